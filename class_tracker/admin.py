@@ -1,21 +1,35 @@
+from datetime import timedelta
+from typing import cast
+
 from django.contrib import admin
 from django.db import models
 from django.db.models import QuerySet
 from django.http import HttpRequest
+from django.utils import timezone
 
+from .global_search.circuit_breaker import circuit_breaker
+from .jobs import enqueue_notification_dispatch, resume_catalog_crawl
 from .models import (
+    CatalogChange,
+    CatalogCrawl,
+    CatalogCrawlUnit,
     ClassAlert,
+    ClassListFingerprint,
     ContactInfo,
     Course,
     CourseCareer,
     CourseSection,
     GlobalSettings,
     InstructionEntry,
+    InstructionEntryQuerySet,
     Instructor,
+    OutboxNotification,
     Recipient,
     School,
     Subject,
     Term,
+    WatchIndexEntry,
+    Weekday,
 )
 
 
@@ -118,7 +132,7 @@ class CourseSectionAdmin(admin.ModelAdmin[CourseSection]):
     list_display = ("course", "section", "status", "instruction_mode", "term")
     list_filter = ("status", "instruction_mode", "term", "course__school")
     search_fields = ("section", "course__level", "course__title")
-    readonly_fields = ("datetime_created", "datetime_modified")
+    readonly_fields = ("datetime_created", "datetime_modified", "datetime_removed")
     ordering = ("course", "section")
 
     inlines = [InstructionEntryInline]
@@ -138,6 +152,25 @@ class CourseSectionAdmin(admin.ModelAdmin[CourseSection]):
         queryset.update(status=CourseSection.StatusChoices.WAITLISTED)
 
 
+class MeetsOnFilter(admin.SimpleListFilter):
+    title = "meets on"
+    parameter_name = "meets_on"
+
+    def lookups(
+        self, _request: HttpRequest, _model_admin: admin.ModelAdmin[InstructionEntry]
+    ) -> list[tuple[str, str]]:
+        return [(value, str(label)) for value, label in Weekday.choices]
+
+    def queryset(
+        self, _request: HttpRequest, queryset: QuerySet[InstructionEntry]
+    ) -> QuerySet[InstructionEntry]:
+        day = self.value()
+        if day is None or day not in Weekday.values:
+            return queryset
+        # the changelist queryset comes from `InstructionEntry.objects`
+        return cast("InstructionEntryQuerySet", queryset).meets_on(day)
+
+
 @admin.register(InstructionEntry)
 class InstructionEntryAdmin(admin.ModelAdmin[InstructionEntry]):
     list_display = (
@@ -148,7 +181,7 @@ class InstructionEntryAdmin(admin.ModelAdmin[InstructionEntry]):
         "get_room",
         "term",
     )
-    list_filter = ("term", "course_section__course", "instructor")
+    list_filter = ("term", MeetsOnFilter, "course_section__course", "instructor")
     search_fields = ("instructor__name", "course_section__course__title", "room")
     readonly_fields = ("datetime_created", "datetime_modified")
     ordering = ("course_section", "instructor")
@@ -223,9 +256,81 @@ class ClassAlertAdmin(admin.ModelAdmin[ClassAlert]):
         )
 
 
+@admin.register(OutboxNotification)
+class OutboxNotificationAdmin(admin.ModelAdmin[OutboxNotification]):
+    """Queued by polling and sent by the notifications queue worker."""
+
+    list_display = (
+        "recipient",
+        "status",
+        "num_attempts",
+        "datetime_created",
+        "datetime_next_attempt",
+        "datetime_sent",
+    )
+    list_filter = ("status",)
+    search_fields = ("recipient__name", "message")
+    readonly_fields = (
+        "recipient",
+        "message",
+        "status",
+        "num_attempts",
+        "datetime_next_attempt",
+        "datetime_sent",
+        "error",
+        "datetime_created",
+        "datetime_modified",
+    )
+    actions = ["send_again"]
+
+    def has_add_permission(self, _request: HttpRequest) -> bool:
+        return False
+
+    def get_queryset(self, request: HttpRequest) -> models.QuerySet[OutboxNotification]:
+        return super().get_queryset(request).select_related("recipient")
+
+    @admin.action(description="Send selected notifications again")
+    def send_again(self, request: HttpRequest, queryset: QuerySet[OutboxNotification]) -> None:
+        num_notifications = queryset.exclude(
+            status=OutboxNotification.StatusChoices.SENDING
+        ).update(
+            status=OutboxNotification.StatusChoices.PENDING,
+            num_attempts=0,
+            datetime_next_attempt=timezone.now(),
+            datetime_modified=timezone.now(),
+        )
+        enqueue_notification_dispatch()
+        self.message_user(request, f"Re-queued {num_notifications} notification(s)")
+
+
 @admin.register(GlobalSettings)
 class GlobalSettingsAdmin(admin.ModelAdmin[GlobalSettings]):
-    list_display = ("__str__", "hours_renotify_grace_period")
+    list_display = ("__str__", "hours_renotify_grace_period", "get_globalsearch_circuit")
+    readonly_fields = ("get_globalsearch_circuit",)
+    actions = ["close_globalsearch_circuit"]
+
+    def get_globalsearch_circuit(self, _obj: GlobalSettings) -> str:
+        status = circuit_breaker.get_status()
+        if status is None:
+            return "Unknown (Redis unavailable)"
+
+        description = (
+            f"{status.state.replace('_', '-')}, {status.num_failures} consecutive failure(s)"
+        )
+        if status.datetime_opened is not None:
+            description += (
+                f", opened {timezone.localtime(status.datetime_opened):%Y-%m-%d %I:%M:%S %p}"
+            )
+        return description
+
+    get_globalsearch_circuit.short_description = "GlobalSearch circuit"  # type: ignore [attr-defined]
+
+    @admin.action(description="Close the GlobalSearch circuit breaker")
+    def close_globalsearch_circuit(
+        self, request: HttpRequest, _queryset: QuerySet[GlobalSettings]
+    ) -> None:
+        circuit_breaker.reset()
+        self.message_user(request, "GlobalSearch circuit breaker closed")
 
     def has_add_permission(self, _request: HttpRequest) -> bool:
         # only allow adding if no GlobalSettings record exists
@@ -236,3 +341,128 @@ class GlobalSettingsAdmin(admin.ModelAdmin[GlobalSettings]):
     ) -> bool:
         # prevent deletion
         return False
+
+
+class CatalogCrawlUnitInline(admin.TabularInline[CatalogCrawlUnit, CatalogCrawl]):
+    model = CatalogCrawlUnit
+    extra = 0
+    fields = (
+        "school",
+        "career",
+        "subject",
+        "status",
+        "num_courses",
+        "is_unchanged",
+        "content_hash",
+        "datetime_started",
+        "fetch_duration",
+        "ingest_duration",
+        "error",
+    )
+    readonly_fields = fields
+
+    def has_add_permission(self, _request: HttpRequest, _obj: CatalogCrawl | None = None) -> bool:
+        return False
+
+
+@admin.register(CatalogCrawl)
+class CatalogCrawlAdmin(admin.ModelAdmin[CatalogCrawl]):
+    list_display = (
+        "__str__",
+        "status",
+        "num_units_completed",
+        "num_units_failed",
+        "num_units_total",
+        "get_throughput",
+        "get_eta",
+        "datetime_created",
+        "datetime_finished",
+    )
+    list_filter = ("status", "term")
+    readonly_fields = (
+        "status",
+        "get_throughput",
+        "get_eta",
+        "datetime_created",
+        "datetime_modified",
+        "datetime_finished",
+    )
+    inlines = [CatalogCrawlUnitInline]
+    actions = ["resume_crawls"]
+
+    def get_queryset(self, request: HttpRequest) -> models.QuerySet[CatalogCrawl]:
+        return super().get_queryset(request).select_related("term", "school", "subject")
+
+    def get_throughput(self, obj: CatalogCrawl) -> str:
+        units_per_minute = obj.get_units_per_minute()
+        return f"{units_per_minute:.1f} units/min" if units_per_minute is not None else "-"
+
+    def get_eta(self, obj: CatalogCrawl) -> str:
+        eta = obj.get_eta()
+        return str(eta - timedelta(microseconds=eta.microseconds)) if eta is not None else "-"
+
+    get_throughput.short_description = "Throughput"  # type: ignore [attr-defined]
+    get_eta.short_description = "ETA"  # type: ignore [attr-defined]
+
+    @admin.action(description="Resume selected crawls (skips completed units)")
+    def resume_crawls(self, request: HttpRequest, queryset: QuerySet[CatalogCrawl]) -> None:
+        num_units = sum(resume_catalog_crawl(crawl) for crawl in queryset)
+        self.message_user(request, f"Re-queued {num_units} unit(s)")
+
+
+@admin.register(ClassListFingerprint)
+class ClassListFingerprintAdmin(admin.ModelAdmin[ClassListFingerprint]):
+    """Deleting a fingerprint makes the next crawl of its class list ingest the page again."""
+
+    list_display = ("__str__", "num_courses", "fingerprint", "datetime_modified")
+    list_filter = ("term", "school", "career")
+    search_fields = ("subject__name", "fingerprint")
+    readonly_fields = ("fingerprint", "num_courses", "datetime_created", "datetime_modified")
+
+    def get_queryset(self, request: HttpRequest) -> models.QuerySet[ClassListFingerprint]:
+        return super().get_queryset(request).select_related("school", "term", "career", "subject")
+
+
+@admin.register(CatalogChange)
+class CatalogChangeAdmin(admin.ModelAdmin[CatalogChange]):
+    list_display = ("course_section", "kind", "changes", "term", "datetime_created")
+    list_filter = ("kind", "term")
+    search_fields = ("course_section__gs_unique_id", "course_section__course__title")
+    readonly_fields = ("course_section", "term", "kind", "changes", "datetime_created")
+    date_hierarchy = "datetime_created"
+
+    def get_queryset(self, request: HttpRequest) -> models.QuerySet[CatalogChange]:
+        return (
+            super()
+            .get_queryset(request)
+            .select_related("term", "course_section__course")
+            .prefetch_related("course_section__instruction_entries")
+        )
+
+
+@admin.register(WatchIndexEntry)
+class WatchIndexEntryAdmin(admin.ModelAdmin[WatchIndexEntry]):
+    """Maintained from `Recipient.watched_sections`; edit the recipient instead."""
+
+    list_display = ("recipient", "section_number", "course_section", "school", "term", "subject")
+    list_filter = ("term", "school", "career")
+    search_fields = ("recipient__name", "section_number")
+    readonly_fields = (
+        "recipient",
+        "course_section",
+        "school",
+        "term",
+        "subject",
+        "career",
+        "section_number",
+    )
+
+    def has_add_permission(self, _request: HttpRequest) -> bool:
+        return False
+
+    def get_queryset(self, request: HttpRequest) -> models.QuerySet[WatchIndexEntry]:
+        return (
+            super()
+            .get_queryset(request)
+            .select_related("recipient", "course_section__course", "school", "term", "subject")
+        )
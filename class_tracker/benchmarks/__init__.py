@@ -0,0 +1,33 @@
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+
+@dataclass
+class TimingResult:
+    name: str
+    repeat: int
+    best_seconds: float
+    mean_seconds: float
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name}: best {self.best_seconds * 1000:.2f} ms, "
+            f"mean {self.mean_seconds * 1000:.2f} ms ({self.repeat} runs)"
+        )
+
+
+def time_callable(name: str, func: Callable[[], Any], *, repeat: int = 5) -> TimingResult:
+    durations: list[float] = []
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+
+    return TimingResult(
+        name=name,
+        repeat=len(durations),
+        best_seconds=min(durations),
+        mean_seconds=statistics.fmean(durations),
+    )
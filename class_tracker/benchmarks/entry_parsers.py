@@ -0,0 +1,130 @@
+import datetime
+import re
+from typing import Any
+
+import pytz
+
+from ..global_search.typedefs import GSCourse
+from ..models import InstructionEntry
+from . import TimingResult, time_callable
+
+_NYC_TZ = pytz.timezone("America/New_York")
+
+
+def _legacy_parse_days_and_times(days_and_times: str) -> tuple[Any, ...]:
+    parts = days_and_times.split()
+    if len(parts) == 1:
+        return ((), None, None)
+
+    time_part = parts[1:]
+    if len(time_part) != 3 or time_part[1] != "-":  # noqa: PLR2004
+        return ((), None, None)
+
+    start_time_naive = datetime.datetime.strptime(time_part[0], "%I:%M%p")  # noqa: DTZ007
+    end_time_naive = datetime.datetime.strptime(time_part[2], "%I:%M%p")  # noqa: DTZ007
+
+    return (
+        InstructionEntry.parse_days(parts[0]),
+        _NYC_TZ.localize(start_time_naive).time(),
+        _NYC_TZ.localize(end_time_naive).time(),
+    )
+
+
+def _legacy_parse_meeting_dates(meeting_dates: str) -> tuple[Any, ...]:
+    parts = meeting_dates.split(" - ")
+    if len(parts) != 2:  # noqa: PLR2004
+        return (None, None)
+
+    start_naive = datetime.datetime.strptime(parts[0], "%m/%d/%Y")  # noqa: DTZ007
+    end_naive = datetime.datetime.strptime(parts[1], "%m/%d/%Y")  # noqa: DTZ007
+
+    return _NYC_TZ.localize(start_naive).date(), _NYC_TZ.localize(end_naive).date()
+
+
+def _legacy_parse_location(location: str) -> tuple[str, str, str]:
+    if not location:
+        return "", "", ""
+
+    parts = location.rsplit(" ", 1)
+    if len(parts) == 1:
+        return "", location, ""
+
+    floor_number_re = re.compile(r"\b[a-z]*([0-9]{1,2})[0-9]{2,}$", flags=re.IGNORECASE)
+    match = floor_number_re.match(location)
+    if not match:
+        return "", location, ""
+
+    return parts[0], parts[1], match.group(1)
+
+
+def _parse_all(
+    entry_strs: list[tuple[str, str, str]],
+    parse_days_and_times: Any,
+    parse_meeting_dates: Any,
+    parse_location: Any,
+) -> list[tuple[Any, ...]]:
+    return [
+        (
+            parse_days_and_times(days_and_times),
+            parse_meeting_dates(meeting_dates),
+            parse_location(location),
+        )
+        for days_and_times, meeting_dates, location in entry_strs
+    ]
+
+
+def _parse_all_legacy(entry_strs: list[tuple[str, str, str]]) -> list[tuple[Any, ...]]:
+    return _parse_all(
+        entry_strs,
+        _legacy_parse_days_and_times,
+        _legacy_parse_meeting_dates,
+        _legacy_parse_location,
+    )
+
+
+def _parse_all_cached(entry_strs: list[tuple[str, str, str]]) -> list[tuple[Any, ...]]:
+    return _parse_all(
+        entry_strs,
+        InstructionEntry.parse_days_and_times,
+        InstructionEntry.parse_meeting_dates,
+        InstructionEntry.parse_location,
+    )
+
+
+def _parse_all_cold(entry_strs: list[tuple[str, str, str]]) -> list[tuple[Any, ...]]:
+    InstructionEntry.clear_parse_caches()
+    return _parse_all_cached(entry_strs)
+
+
+def benchmark_entry_parsers(gs_courses: list[GSCourse], *, repeat: int) -> list[TimingResult]:
+    """
+    Compare the strptime/pytz instruction entry parsers `InstructionEntry` used to have against the
+    cached ones, over every (days & times, meeting dates, room) string of the given courses.
+    """
+    entry_strs = [
+        (entry.days_and_times, entry.meeting_dates, entry.room)
+        for gs_course in gs_courses
+        for section in gs_course.sections
+        for entry in section.instruction_entries
+    ]
+    if _parse_all_legacy(entry_strs) != _parse_all_cold(entry_strs):
+        raise ValueError("Cached entry parsers disagree with the legacy parsers")
+
+    num_distinct = len(set(entry_strs))
+    return [
+        time_callable(
+            f"legacy entry parsers ({len(entry_strs)} entries)",
+            lambda: _parse_all_legacy(entry_strs),
+            repeat=repeat,
+        ),
+        time_callable(
+            f"cached entry parsers, cold cache ({num_distinct} distinct entries)",
+            lambda: _parse_all_cold(entry_strs),
+            repeat=repeat,
+        ),
+        time_callable(
+            "cached entry parsers, warm cache",
+            lambda: _parse_all_cached(entry_strs),
+            repeat=repeat,
+        ),
+    ]
@@ -0,0 +1,178 @@
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from django.db import connection, transaction
+
+from server.util import atomic_get_or_create, bulk_create_and_get
+
+from ..global_search.typedefs import GSCourse
+from ..models import (
+    Course,
+    CourseCareer,
+    CourseSection,
+    InstructionEntry,
+    Instructor,
+    School,
+    Subject,
+    Term,
+)
+from ..util import create_db_courses
+
+TIngestCallable = Callable[[list[GSCourse], Subject, CourseCareer, School, Term], list[Course]]
+
+
+@dataclass
+class IngestResult:
+    name: str
+    num_sections: int
+    seconds: float
+    num_queries: int
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name}: {self.seconds * 1000:.2f} ms, "
+            f"{self.num_queries} queries ({self.num_sections} sections)"
+        )
+
+
+def legacy_create_db_courses(
+    gs_courses: list[GSCourse],
+    subject: Subject,
+    career: CourseCareer,
+    school: School,
+    term: Term,
+) -> list[Course]:
+    """The per-row ingest path `create_db_courses` used before set-based writes, kept as a baseline."""
+    instructors = list(
+        bulk_create_and_get(
+            Instructor,
+            [
+                Instructor(name=entry.instructor, school=school)
+                for gs_course in gs_courses
+                for section in gs_course.sections
+                for entry in section.instruction_entries
+            ],
+            fields=["name", "school__id"],
+        )
+    )
+    term.instructors.add(*instructors)
+    name_to_instructor_map = {instructor.name: instructor for instructor in instructors}
+
+    course_name_to_course_map = {
+        course.get_name(): course
+        for course in bulk_create_and_get(
+            Course,
+            [Course.from_gs_course(c, subject, career, school) for c in gs_courses],
+            fields=["code", "level", "school__id"],
+        )
+    }
+
+    for gs_course in gs_courses:
+        for gs_course_section in gs_course.sections:
+            course = course_name_to_course_map[gs_course.get_name()]
+            course_section = CourseSection.from_gs_course_section(gs_course_section, course, term)
+            course_section, _ = atomic_get_or_create(course_section, fields=["gs_unique_id"])
+
+            InstructionEntry.objects.filter(course_section=course_section).delete()
+
+            for gs_instruction_entry in gs_course_section.instruction_entries:
+                days, start_time, end_time = InstructionEntry.parse_days_and_times(
+                    gs_instruction_entry.days_and_times
+                )
+                start_date, end_date = InstructionEntry.parse_meeting_dates(
+                    gs_instruction_entry.meeting_dates
+                )
+                building, room, floor_number = InstructionEntry.parse_location(
+                    gs_instruction_entry.room
+                )
+                instruction_entry, _ = InstructionEntry.objects.get_or_create(
+                    start_time=start_time,
+                    end_time=end_time,
+                    start_date=start_date,
+                    end_date=end_date,
+                    building=building,
+                    room=room,
+                    floor_number=floor_number,
+                    instructor=name_to_instructor_map[gs_instruction_entry.instructor],
+                    course_section=course_section,
+                    term=term,
+                )
+                instruction_entry.days = days
+                instruction_entry.save(update_fields=["days_mask"])
+
+    courses = list(course_name_to_course_map.values())
+    term.courses.add(*courses)
+    return courses
+
+
+class QueryCounter:
+    """`connection.execute_wrapper` hook; unlike `CaptureQueriesContext` it is not capped at 9000."""
+
+    def __init__(self) -> None:
+        self.num_queries = 0
+
+    def __call__(
+        self, execute: Callable[..., Any], sql: str, params: Any, many: bool, context: Any
+    ) -> Any:
+        self.num_queries += 1
+        return execute(sql, params, many, context)
+
+
+def _measure_ingest(
+    name: str,
+    ingest: TIngestCallable,
+    gs_courses: list[GSCourse],
+    subject: Subject,
+    career: CourseCareer,
+    school: School,
+    term: Term,
+) -> IngestResult:
+    query_counter = QueryCounter()
+    with connection.execute_wrapper(query_counter):
+        start = time.perf_counter()
+        ingest(gs_courses, subject, career, school, term)
+        seconds = time.perf_counter() - start
+
+    return IngestResult(
+        name=name,
+        num_sections=sum(len(gs_course.sections) for gs_course in gs_courses),
+        seconds=seconds,
+        num_queries=query_counter.num_queries,
+    )
+
+
+def benchmark_ingest(
+    gs_courses: list[GSCourse],
+    *,
+    ingest_paths: dict[str, TIngestCallable] | None = None,
+) -> list[IngestResult]:
+    """
+    Time a first ingest and a re-crawl of `gs_courses` for each ingest path against throwaway
+    catalog rows. Every path runs inside its own transaction that is rolled back afterwards.
+    """
+    if ingest_paths is None:
+        ingest_paths = {
+            "legacy per-row ingest": legacy_create_db_courses,
+            "create_db_courses": create_db_courses,
+        }
+
+    results: list[IngestResult] = []
+    for name, ingest in ingest_paths.items():
+        with transaction.atomic():
+            school = School.objects.create(name="Benchmark College", globalsearch_key="BENCH01")
+            term = Term.objects.create(name="Benchmark Term", year=1900, globalsearch_key="BENCH")
+            subject = Subject.objects.create(name="Benchmark Subject", globalsearch_key="BENCH")
+            career = CourseCareer.objects.create(name="Benchmark Career", globalsearch_key="BENCH")
+
+            results.extend(
+                _measure_ingest(
+                    f"{name} ({run_name})", ingest, gs_courses, subject, career, school, term
+                )
+                for run_name in ("first ingest", "re-crawl")
+            )
+
+            transaction.set_rollback(True)
+
+    return results
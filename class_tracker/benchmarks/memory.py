@@ -0,0 +1,93 @@
+import gc
+import logging
+import multiprocessing
+import resource
+import sys
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import django
+
+from ..global_search.parser import parse_class_list_page
+from ..global_search.typedefs import GSCourse
+from .synthetic import generate_results_page
+
+
+@dataclass
+class CrawlMemoryResult:
+    num_pages: int
+    num_sections: int
+    retained_bytes: int  # tracemalloc: still allocated once every page's GS* tree is kept
+    peak_rss_bytes: int  # of a process doing nothing but the crawl
+
+    def __str__(self) -> str:
+        return (
+            f"{self.num_pages} pages, {self.num_sections} sections: "
+            f"GS* trees retain {self.retained_bytes / 1024 / 1024:.1f} MiB "
+            f"({self.retained_bytes / max(1, self.num_sections):.0f} B per section), "
+            f"peak RSS {self.peak_rss_bytes / 1024 / 1024:.1f} MiB"
+        )
+
+
+def _parse_crawl(num_pages: int, sections_per_page: int) -> list[list[GSCourse]]:
+    # pages are generated one at a time, so only the parsed trees pile up like in a real crawl
+    return [
+        parse_class_list_page(generate_results_page(sections_per_page, seed=seed))
+        for seed in range(num_pages)
+    ]
+
+
+def _get_peak_rss_bytes() -> int:
+    # on Linux `ru_maxrss` survives exec, so a spawned process would report its parent's peak
+    status_path = Path("/proc/self/status")
+    if status_path.exists():
+        for line in status_path.read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == "darwin" else max_rss * 1024  # KiB elsewhere
+
+
+def _measure_peak_rss(num_pages: int, sections_per_page: int) -> int:
+    logging.getLogger("main").setLevel(logging.WARNING)
+    _parse_crawl(num_pages, sections_per_page)
+    return _get_peak_rss_bytes()
+
+
+def _measure_retained(num_pages: int, sections_per_page: int) -> tuple[int, int]:
+    logging.getLogger("main").setLevel(logging.WARNING)
+    tracemalloc.start()
+    try:
+        crawl = _parse_crawl(num_pages, sections_per_page)
+        gc.collect()
+        retained_bytes, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    num_sections = sum(len(gs_course.sections) for gs_courses in crawl for gs_course in gs_courses)
+    return retained_bytes, num_sections
+
+
+def benchmark_crawl_memory(num_pages: int, *, sections_per_page: int = 300) -> CrawlMemoryResult:
+    """
+    Parse `num_pages` synthetic class lists while keeping every parsed tree, as a full-semester
+    crawl does. Each measurement runs in a fresh process, so the peak RSS is not inflated by
+    whatever the calling process already holds, nor by tracemalloc's own bookkeeping.
+    """
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context, initializer=django.setup) as pool:
+        peak_rss_bytes = pool.submit(_measure_peak_rss, num_pages, sections_per_page).result()
+    with ProcessPoolExecutor(max_workers=1, mp_context=context, initializer=django.setup) as pool:
+        retained_bytes, num_sections = pool.submit(
+            _measure_retained, num_pages, sections_per_page
+        ).result()
+
+    return CrawlMemoryResult(
+        num_pages=num_pages,
+        num_sections=num_sections,
+        retained_bytes=retained_bytes,
+        peak_rss_bytes=peak_rss_bytes,
+    )
@@ -0,0 +1,126 @@
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.db import transaction
+
+from ..models import ContactInfo, Recipient
+from ..util.notifier import NotificationDispatcher
+
+
+@dataclass
+class FanOutResult:
+    num_workers: int
+    num_notifications: int
+    seconds: float
+    num_connections: int  # opened to the stand-in Join API
+    speedup: float  # relative to one worker
+
+    def __str__(self) -> str:
+        return (
+            f"{self.num_workers} workers: {self.num_notifications} notifications in "
+            f"{self.seconds * 1000:.0f} ms ({self.num_notifications / self.seconds:.0f}/s, "
+            f"{self.speedup:.2f}x) over {self.num_connections} connections"
+        )
+
+
+class _StandInJoinServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, latency_seconds: float):
+        super().__init__(("127.0.0.1", 0), _StandInJoinHandler)
+        self.latency_seconds = latency_seconds
+        self.num_connections = 0
+        self._lock = threading.Lock()
+
+    def count_connection(self) -> None:
+        with self._lock:
+            self.num_connections += 1
+
+
+class _StandInJoinHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+    server: _StandInJoinServer
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.count_connection()
+
+    def do_GET(self) -> None:  # noqa: N802
+        time.sleep(self.server.latency_seconds)
+        body = b'{"success": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+@contextmanager
+def _run_stand_in_join_server(latency_seconds: float) -> Iterator[_StandInJoinServer]:
+    server = _StandInJoinServer(latency_seconds)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+def benchmark_notification_fanout(
+    num_notifications: int, worker_counts: list[int], *, latency_seconds: float = 0.05
+) -> list[FanOutResult]:
+    """
+    Send `num_notifications` SMS with a `NotificationDispatcher` of each size to a local stand-in
+    for the Join API that answers after `latency_seconds`. The recipients are created in a
+    transaction that is rolled back afterwards.
+    """
+    timings: list[tuple[int, float, int]] = []
+    with transaction.atomic():
+        recipients = Recipient.objects.bulk_create(
+            Recipient(name=f"Benchmark Recipient {index}") for index in range(num_notifications)
+        )
+        ContactInfo.objects.bulk_create(
+            ContactInfo(number=f"+1999{index:07d}", owner=recipient, is_enabled=True)
+            for index, recipient in enumerate(recipients)
+        )
+
+        for num_workers in sorted({1, *worker_counts}):
+            with _run_stand_in_join_server(latency_seconds) as server:
+                dispatcher = NotificationDispatcher(
+                    max_workers=num_workers, send_url=f"http://127.0.0.1:{server.server_port}/send"
+                )
+                notifications = [
+                    (recipient, "Found New Open Course Sections!:\nBENCH 100")
+                    for recipient in Recipient.objects.filter(id__in=[r.id for r in recipients])
+                ]
+
+                start = time.perf_counter()
+                errors = dispatcher.notify_all(notifications)
+                seconds = time.perf_counter() - start
+
+                if any(errors):
+                    raise next(error for error in errors if error is not None)
+                timings.append((num_workers, seconds, server.num_connections))
+
+        transaction.set_rollback(True)
+
+    one_worker_seconds = timings[0][1]
+    return [
+        FanOutResult(
+            num_workers=num_workers,
+            num_notifications=num_notifications,
+            seconds=seconds,
+            num_connections=num_connections,
+            speedup=one_worker_seconds / seconds if seconds else 0,
+        )
+        for num_workers, seconds, num_connections in timings
+    ]
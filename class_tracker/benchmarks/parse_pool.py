@@ -0,0 +1,46 @@
+import time
+from dataclasses import dataclass
+
+from ..global_search.parse_pool import ParsePool
+
+
+@dataclass
+class ParsePoolResult:
+    num_workers: int  # 0 parses in-process
+    num_pages: int
+    seconds: float
+    speedup: float  # relative to parsing in-process
+
+    def __str__(self) -> str:
+        workers = f"{self.num_workers} workers" if self.num_workers else "in-process"
+        return (
+            f"ParsePool {workers}: {self.num_pages} pages in {self.seconds * 1000:.0f} ms "
+            f"({self.speedup:.2f}x)"
+        )
+
+
+def benchmark_parse_pool(page_srcs: list[str], worker_counts: list[int]) -> list[ParsePoolResult]:
+    """
+    Time parsing all of `page_srcs` with a `ParsePool` of each size. Worker processes are started
+    before the clock starts, so only parsing & pickling the results back are measured.
+    """
+    timings: list[tuple[int, float]] = []
+    for num_workers in sorted({0, *worker_counts}):
+        with ParsePool(num_workers) as parse_pool:
+            parse_pool.warm_up()
+
+            start = time.perf_counter()
+            for _ in parse_pool.map(page_srcs):
+                pass
+            timings.append((num_workers, time.perf_counter() - start))
+
+    in_process_seconds = timings[0][1]
+    return [
+        ParsePoolResult(
+            num_workers=num_workers,
+            num_pages=len(page_srcs),
+            seconds=seconds,
+            speedup=in_process_seconds / seconds if seconds else 0,
+        )
+        for num_workers, seconds in timings
+    ]
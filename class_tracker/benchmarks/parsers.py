@@ -0,0 +1,30 @@
+from bs4 import BeautifulSoup
+
+from ..global_search.parser import parse_gs_courses, parse_section_statuses
+from . import TimingResult, time_callable
+
+
+def _parse_statuses_with_full_parser(course_results_page_src: str) -> dict[int, str]:
+    courses = parse_gs_courses(BeautifulSoup(course_results_page_src, "lxml"))
+    return {section.number: section.status for course in courses for section in course.sections}
+
+
+def benchmark_status_parsers(course_results_page_src: str, *, repeat: int) -> list[TimingResult]:
+    """Compare the polling status extractor against the full course parser on the same page."""
+    full_parser_statuses = _parse_statuses_with_full_parser(course_results_page_src)
+    status_parser_statuses = parse_section_statuses(course_results_page_src)
+    if full_parser_statuses != status_parser_statuses:
+        raise ValueError("Status parser disagrees with the full parser on this page")
+
+    return [
+        time_callable(
+            "full parser (parse_gs_courses)",
+            lambda: _parse_statuses_with_full_parser(course_results_page_src),
+            repeat=repeat,
+        ),
+        time_callable(
+            "status parser (parse_section_statuses)",
+            lambda: parse_section_statuses(course_results_page_src),
+            repeat=repeat,
+        ),
+    ]
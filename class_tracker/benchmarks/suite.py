@@ -0,0 +1,104 @@
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from bs4 import BeautifulSoup
+
+from ..global_search.parser import (
+    _filter_for_tag_elements,
+    parse_class_list_page,
+    parse_gs_courses,
+)
+from ..global_search.util import get_course_section
+from . import TimingResult, time_callable
+from .entry_parsers import benchmark_entry_parsers
+from .ingest import IngestResult, benchmark_ingest
+from .parsers import benchmark_status_parsers
+
+
+@dataclass
+class PageBenchmark:
+    name: str
+    page_bytes: int
+    num_courses: int
+    num_sections: int
+    parse_peak_memory_bytes: int  # tracemalloc peak while building the soup & parsing courses
+    class_list_parse_peak_memory_bytes: int  # same for `parse_class_list_page`'s sliced soup
+    timings: list[TimingResult] = field(default_factory=list)
+    ingest_results: list[IngestResult] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        header = (
+            f"== {self.name}: {self.num_sections} sections in {self.num_courses} courses, "
+            f"{self.page_bytes / 1024:.0f} KiB page, "
+            f"parse peak memory {self.parse_peak_memory_bytes / 1024 / 1024:.1f} MiB, "
+            f"{self.class_list_parse_peak_memory_bytes / 1024 / 1024:.1f} MiB sliced"
+        )
+        lines = [header]
+        lines.extend(f"  {timing}" for timing in self.timings)
+        lines.extend(f"  {ingest_result}" for ingest_result in self.ingest_results)
+        return "\n".join(lines)
+
+
+def _measure_peak_memory(parse: Callable[[], object]) -> int:
+    tracemalloc.start()
+    try:
+        parse()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak_bytes
+
+
+def benchmark_page(
+    name: str, page_src: str, *, repeat: int, is_ingest_benchmarked: bool = False
+) -> PageBenchmark:
+    """
+    Time every stage between a class results page and the database: soup construction,
+    `parse_gs_courses`, `get_course_section` alone, the polling & entry parsers and, optionally,
+    `create_db_courses` (inside a rolled back transaction).
+    """
+    soup = BeautifulSoup(page_src, "lxml")
+    gs_courses = parse_gs_courses(soup)
+    section_attr_elements = [
+        _filter_for_tag_elements(row.children)
+        for row in soup.select("table.classinfo > tbody > tr")
+    ]
+
+    num_sections = sum(len(gs_course.sections) for gs_course in gs_courses)
+    benchmark = PageBenchmark(
+        name=name,
+        page_bytes=len(page_src.encode()),
+        num_courses=len(gs_courses),
+        num_sections=num_sections,
+        parse_peak_memory_bytes=_measure_peak_memory(
+            lambda: parse_gs_courses(BeautifulSoup(page_src, "lxml"))
+        ),
+        class_list_parse_peak_memory_bytes=_measure_peak_memory(
+            lambda: parse_class_list_page(page_src)
+        ),
+    )
+
+    benchmark.timings.extend(
+        [
+            time_callable(
+                "BeautifulSoup(lxml)", lambda: BeautifulSoup(page_src, "lxml"), repeat=repeat
+            ),
+            time_callable("parse_gs_courses", lambda: parse_gs_courses(soup), repeat=repeat),
+            time_callable(
+                "parse_class_list_page", lambda: parse_class_list_page(page_src), repeat=repeat
+            ),
+            time_callable(
+                "get_course_section",
+                lambda: [get_course_section(elements) for elements in section_attr_elements],
+                repeat=repeat,
+            ),
+        ]
+    )
+    benchmark.timings.extend(benchmark_status_parsers(page_src, repeat=repeat))
+    benchmark.timings.extend(benchmark_entry_parsers(gs_courses, repeat=repeat))
+
+    if is_ingest_benchmarked:
+        benchmark.ingest_results.extend(benchmark_ingest(gs_courses))
+
+    return benchmark
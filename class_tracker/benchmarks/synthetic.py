@@ -0,0 +1,145 @@
+import random
+from html import escape
+
+_SUBJECT_CODES = ("CSCI", "MATH", "PHYS", "BIOL", "CHEM", "ECON", "HIST", "PSYCH")
+_DAY_PATTERNS = ("MoWe", "TuTh", "MoWeFr", "Fr", "Sa", "Mo", "We")
+# locations like "Kiely Hall 258" stay within the 20 characters of `InstructionEntry.room`
+_BUILDINGS = ("Kiely Hall", "Powdermaker Hall", "Remsen Hall", "Razran Hall")
+_INSTRUCTION_MODES = ("In Person", "Hybrid", "Online - Synchronous", "Online - Asynchronous")
+_MEETING_DATES = ("08/26/2024 - 12/18/2024", "08/26/2024 - 10/15/2024", "10/16/2024 - 12/18/2024")
+_STATUSES = ("Open", "Closed", "wait")
+_STATUS_WEIGHTS = (0.3, 0.6, 0.1)
+
+_PAGE_TEMPLATE = """<!DOCTYPE html>
+<html><head><title>CUNY Global Class Search</title></head>
+<body>
+<form name="classSearchForm">
+{courses}
+</form>
+</body></html>
+"""
+
+# mirrors GlobalSearch: a `.testing_msg` course label followed by a `contentDivImg` sibling
+_COURSE_TEMPLATE = """
+<div id="contentDiv{index}">
+  <span class="testing_msg">&nbsp;{code} {level} - {title}</span>
+  <div id="contentDivImg{index}">
+    <table class="classinfo">
+      <thead><tr>
+        <th>Class</th><th>Section</th><th>Days &amp; Times</th><th>Room</th><th>Instructor</th>
+        <th>Instruction Mode</th><th>Meeting Dates</th><th>Status</th><th>Course Topic</th>
+      </tr></thead>
+      <tbody>{rows}</tbody>
+    </table>
+  </div>
+</div>
+"""
+
+_EMPTY_COURSE_TEMPLATE = """
+<div id="contentDiv{index}">
+  <span class="testing_msg">&nbsp;{code} {level} - {title}</span>
+  <div id="noClassesDiv{index}">No classes found</div>
+</div>
+"""
+
+_SECTION_ROW_TEMPLATE = """
+<tr>
+  <td data-label="Class"><a href="https://globalsearch.cuny.edu/CFGlobalSearchTool/CFSearchToolController?class_number_searched=Q{number}">{number}</a></td>
+  <td data-label="Section"><a href="#">{section}</a></td>
+  <td data-label="DaysAndTimes">{days_and_times}</td>
+  <td data-label="Room">{rooms}</td>
+  <td data-label="Instructor">{instructors}</td>
+  <td data-label="Instruction Mode">{instruction_mode}</td>
+  <td data-label="Meeting Dates">{meeting_dates}</td>
+  <td data-label="Status"><img src="/CFGlobalSearchTool/images/{status}.jpg" alt="{status}" title="{status}"></td>
+  <td data-label="Course Topic">{topic}</td>
+</tr>
+"""
+
+
+def _format_time(minutes: int) -> str:
+    hour, minute = divmod(minutes, 60)
+    return f"{(hour - 1) % 12 + 1}:{minute:02d}{'AM' if hour < 12 else 'PM'}"  # noqa: PLR2004
+
+
+def _get_days_and_times(rng: random.Random) -> str:
+    if rng.random() < 0.03:  # noqa: PLR2004
+        return "TBA"
+    start = rng.randrange(8 * 60, 20 * 60, 15)
+    return f"{rng.choice(_DAY_PATTERNS)} {_format_time(start)} - {_format_time(start + rng.choice((50, 75, 100, 150)))}"
+
+
+def _get_room(rng: random.Random) -> str:
+    if rng.random() < 0.1:  # noqa: PLR2004
+        return "Online Synchronous"
+    return f"{rng.choice(_BUILDINGS)} {rng.randrange(100, 599)}"
+
+
+def _get_section_row(rng: random.Random, number: int, index: int, num_instructors: int) -> str:
+    # most sections have a single meeting pattern; some list several, separated by <br>
+    num_entries = 1 if rng.random() > 0.1 else rng.choice((2, 3))  # noqa: PLR2004
+    entries = [
+        (
+            _get_days_and_times(rng),
+            _get_room(rng),
+            f"Instructor {rng.randrange(num_instructors):05d}",
+            rng.choice(_MEETING_DATES),
+        )
+        for _ in range(num_entries)
+    ]
+
+    return _SECTION_ROW_TEMPLATE.format(
+        number=number,
+        section=f"{index:02d}-LEC Regular",
+        days_and_times="<br>".join(escape(entry[0]) for entry in entries),
+        rooms="<br>".join(escape(entry[1]) for entry in entries),
+        instructors="<br>".join(escape(entry[2]) for entry in entries),
+        instruction_mode=rng.choice(_INSTRUCTION_MODES),
+        meeting_dates="<br>".join(escape(entry[3]) for entry in entries),
+        status=rng.choices(_STATUSES, _STATUS_WEIGHTS)[0],
+        topic="" if rng.random() > 0.05 else "Special Topics",  # noqa: PLR2004
+    )
+
+
+def generate_results_page(num_sections: int, *, sections_per_course: int = 6, seed: int = 0) -> str:
+    """
+    Build a GlobalSearch class results page with `num_sections` sections spread over courses of
+    up to `sections_per_course` sections each. Output is deterministic for a given seed.
+    """
+    rng = random.Random(seed)  # noqa: S311
+    num_instructors = max(1, num_sections // 4)
+
+    course_blocks: list[str] = []
+    num_sections_left = num_sections
+    course_index = 0
+    while num_sections_left > 0:
+        code = _SUBJECT_CODES[course_index % len(_SUBJECT_CODES)]
+        level = str(100 + course_index // len(_SUBJECT_CODES))
+        title = f"Synthetic Course {course_index}"
+
+        # GlobalSearch lists some courses without any class, these are skipped by the parser
+        if course_index % 25 == 24:  # noqa: PLR2004
+            course_blocks.append(
+                _EMPTY_COURSE_TEMPLATE.format(
+                    index=course_index, code=code, level=level, title=title
+                )
+            )
+            course_index += 1
+            continue
+
+        num_course_sections = min(num_sections_left, rng.randint(1, sections_per_course))
+        first_number = 10000 + num_sections - num_sections_left
+        rows = "".join(
+            _get_section_row(rng, first_number + index, index + 1, num_instructors)
+            for index in range(num_course_sections)
+        )
+        course_blocks.append(
+            _COURSE_TEMPLATE.format(
+                index=course_index, code=code, level=level, title=title, rows=rows
+            )
+        )
+
+        num_sections_left -= num_course_sections
+        course_index += 1
+
+    return _PAGE_TEMPLATE.format(courses="".join(course_blocks))
@@ -1,10 +1,14 @@
 import logging
 from typing import Callable
 
-from requests import RequestException, Response
+from django.conf import settings
+from requests import RequestException, Response, Session
 
+from server.util import init_http_retrier
 from server.util.typedefs import Failure, Success, TResult
 
+from .archive import ResponseArchive, mount_response_archive
+
 logger = logging.getLogger("main")
 
 GLOBALSEARCH_URL = "https://globalsearch.cuny.edu/CFGlobalSearchTool/CFSearchToolController"
@@ -30,6 +34,20 @@ def get_globalsearch_headers() -> dict[str, str]:
     }
 
 
+def init_globalsearch_session(num_retries: int = 3) -> Session:
+    session = init_http_retrier(headers=get_globalsearch_headers(), num_retries=num_retries)
+
+    if settings.GLOBALSEARCH_ARCHIVE_MODE:
+        mount_response_archive(
+            session,
+            ResponseArchive(settings.GLOBALSEARCH_ARCHIVE_DIR),
+            settings.GLOBALSEARCH_ARCHIVE_MODE,
+            url_prefix=GLOBALSEARCH_ORIGIN_URL,
+        )
+
+    return session
+
+
 def get_response_result(
     request_callback: Callable[[], Response],
 ) -> TResult[Response, RequestException]:
@@ -0,0 +1,185 @@
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, Literal
+from urllib.parse import parse_qsl, urlencode
+
+from requests import PreparedRequest, RequestException, Response, Session
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+TArchiveMode = Literal["record", "replay"]
+
+ARCHIVE_MODES: tuple[TArchiveMode, ...] = ("record", "replay")
+
+# response headers worth replaying; cookies, lengths & encodings describe the original transfer only
+_ARCHIVED_HEADERS = ("content-type",)
+
+
+class ArchiveMissError(RequestException):
+    """A replayed request was never recorded."""
+
+
+class ResponseArchive:
+    """
+    On-disk store of GlobalSearch responses, keyed by the request that produced them.
+
+    Layout under `root`:
+        index/<request key>.json  - status, headers and the sha256 of the body
+        objects/<ab>/<sha256>.gz  - gzip-compressed bodies, shared by identical responses
+
+    A request key hashes the method, url and body; form bodies are normalized so field order does
+    not matter, while headers & cookies are ignored so a replay is independent of session state.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    @staticmethod
+    def get_request_key(request: PreparedRequest) -> str:
+        body = request.body or b""
+        if isinstance(body, str):
+            body = body.encode()
+
+        content_type = request.headers.get("content-type", "")
+        if content_type.startswith("application/x-www-form-urlencoded"):
+            fields = parse_qsl(body.decode(), keep_blank_values=True)
+            body = urlencode(sorted(fields)).encode()
+
+        digest = hashlib.sha256()
+        for part in ((request.method or "GET").encode(), (request.url or "").encode(), body):
+            digest.update(part)
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _get_index_path(self, request_key: str) -> Path:
+        return self.root / "index" / f"{request_key}.json"
+
+    def _get_object_path(self, content_hash: str) -> Path:
+        return self.root / "objects" / content_hash[:2] / f"{content_hash}.gz"
+
+    @staticmethod
+    def _write_atomically(path: Path, data: bytes) -> None:
+        # concurrent pollers may record at the same time, so never expose a partially written file
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(data)
+        Path(tmp_path).replace(path)
+
+    def store(self, request: PreparedRequest, response: Response) -> str:
+        """Archive `response` under the key of `request`, returning the key."""
+        content = response.content
+        content_hash = hashlib.sha256(content).hexdigest()
+
+        object_path = self._get_object_path(content_hash)
+        if not object_path.exists():
+            self._write_atomically(object_path, gzip.compress(content, mtime=0))
+
+        request_key = self.get_request_key(request)
+        entry: dict[str, Any] = {
+            "method": request.method,
+            "url": request.url,
+            "status_code": response.status_code,
+            "reason": response.reason,
+            "encoding": response.encoding,
+            "headers": {
+                name: response.headers[name]
+                for name in _ARCHIVED_HEADERS
+                if name in response.headers
+            },
+            "content_hash": content_hash,
+        }
+        self._write_atomically(
+            self._get_index_path(request_key), json.dumps(entry, indent=2).encode()
+        )
+
+        return request_key
+
+    def load(self, request: PreparedRequest) -> Response | None:
+        """Rebuild the archived response to `request`, or None if it was never recorded."""
+        index_path = self._get_index_path(self.get_request_key(request))
+        if not index_path.exists():
+            return None
+
+        entry = json.loads(index_path.read_text())
+        content = gzip.decompress(self._get_object_path(entry["content_hash"]).read_bytes())
+
+        response = Response()
+        response.status_code = entry["status_code"]
+        response.reason = entry["reason"]
+        response.encoding = entry["encoding"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response._content = content  # noqa: SLF001
+        response.url = request.url or entry["url"]
+        response.request = request
+
+        return response
+
+    def iter_contents(self) -> Iterator[bytes]:
+        """Every distinct archived response body, eg. to benchmark against recorded pages."""
+        content_hashes = sorted(
+            {
+                json.loads(index_path.read_text())["content_hash"]
+                for index_path in (self.root / "index").glob("*.json")
+            }
+        )
+        for content_hash in content_hashes:
+            yield gzip.decompress(self._get_object_path(content_hash).read_bytes())
+
+
+class RecordingAdapter(HTTPAdapter):
+    """Sends requests over the network and archives every response."""
+
+    def __init__(self, archive: ResponseArchive, **kwargs: Any):
+        self.archive = archive
+        super().__init__(**kwargs)
+
+    def send(self, request: PreparedRequest, *args: Any, **kwargs: Any) -> Response:
+        response = super().send(request, *args, **kwargs)
+        self.archive.store(request, response)
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """Serves archived responses without touching the network."""
+
+    def __init__(self, archive: ResponseArchive):
+        self.archive = archive
+        super().__init__()
+
+    def send(self, request: PreparedRequest, *_args: Any, **_kwargs: Any) -> Response:
+        response = self.archive.load(request)
+        if response is None:
+            raise ArchiveMissError(
+                f"No archived response for {request.method} {request.url}", request=request
+            )
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def is_response_archive_mounted(session: Session, *, url_prefix: str) -> bool:
+    """Whether requests of `session` starting with `url_prefix` already go through an archive."""
+    return isinstance(session.get_adapter(url_prefix), RecordingAdapter | ReplayAdapter)
+
+
+def mount_response_archive(
+    session: Session, archive: ResponseArchive, mode: str, *, url_prefix: str
+) -> None:
+    """Route every request of `session` starting with `url_prefix` through `archive`."""
+    if mode == "record":
+        # keep the retry policy of the adapter being replaced
+        max_retries = session.get_adapter(url_prefix).max_retries  # type: ignore[attr-defined]
+        session.mount(url_prefix, RecordingAdapter(archive, max_retries=max_retries))
+    elif mode == "replay":
+        session.mount(url_prefix, ReplayAdapter(archive))
+    else:
+        raise ValueError(
+            f"Unknown GlobalSearch archive mode {mode!r}, expected one of {ARCHIVE_MODES}"
+        )
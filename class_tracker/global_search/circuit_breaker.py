@@ -0,0 +1,183 @@
+import datetime
+from enum import StrEnum
+from typing import NamedTuple
+
+import redis
+from django.conf import settings
+from requests import RequestException
+
+from server.util import RedisOutageGuard, get_redis_connection
+
+# Decides whether a request may go out. An open circuit turns half-open once `reset_timeout` has
+# passed; a half-open circuit lets exactly one probe through, guarded by a lease key that expires
+# in case the probing process dies before reporting back.
+_BEFORE_REQUEST_SCRIPT = """
+local state = redis.call("HGET", KEYS[1], "state") or "closed"
+if state == "closed" then
+    return "closed"
+end
+
+local now_parts = redis.call("TIME")
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+
+if state == "open" then
+    local datetime_opened = tonumber(redis.call("HGET", KEYS[1], "datetime_opened")) or 0
+    if now - datetime_opened < tonumber(ARGV[1]) then
+        return "open"
+    end
+    redis.call("HSET", KEYS[1], "state", "half_open")
+end
+
+if redis.call("SET", KEYS[2], "1", "NX", "EX", ARGV[2]) then
+    return "probe"
+end
+return "open"
+"""
+
+# Counts a failure, opening the circuit once `threshold` failures happen in a row or as soon as a
+# half-open probe fails. Failures of requests sent before the circuit opened don't extend it.
+_RECORD_FAILURE_SCRIPT = """
+local state = redis.call("HGET", KEYS[1], "state") or "closed"
+if state == "open" then
+    return state
+end
+
+local num_failures = redis.call("HINCRBY", KEYS[1], "num_failures", 1)
+if state == "half_open" or num_failures >= tonumber(ARGV[1]) then
+    local now_parts = redis.call("TIME")
+    local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+    redis.call("HSET", KEYS[1], "state", "open", "datetime_opened", tostring(now))
+    redis.call("DEL", KEYS[2])
+    state = "open"
+end
+return state
+"""
+
+
+class CircuitOpenError(RequestException):
+    """GlobalSearch is considered down, the request was not sent."""
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitStatus(NamedTuple):
+    state: CircuitState
+    num_failures: int  # consecutive failures
+    datetime_opened: datetime.datetime | None
+
+
+class CircuitBreaker:
+    """
+    Fast-fails GlobalSearch requests while it is down, with the circuit state kept in Redis so the
+    web process and every scheduler worker trip & recover together.
+
+    After `failure_threshold` consecutive failures the circuit opens and every request raises
+    `CircuitOpenError` without touching the network. Once `reset_timeout_seconds` pass, a single
+    half-open probe request is let through: success closes the circuit, failure opens it again.
+
+    If Redis cannot be reached the breaker fails open (closed circuit), so requests still go out.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        *,
+        failure_threshold: int,
+        reset_timeout_seconds: float,
+        is_enabled: bool = True,
+    ):
+        self.key = key
+        self.probe_key = f"{key}:probe"
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self.is_enabled = is_enabled
+        self._redis_guard = RedisOutageGuard("GlobalSearch circuit breaker")
+
+    def before_request(self) -> None:
+        """Raise `CircuitOpenError` unless a request may be sent right now."""
+        if not self.is_enabled or not self._redis_guard.is_usable():
+            return
+
+        try:
+            state = get_redis_connection().eval(
+                _BEFORE_REQUEST_SCRIPT,
+                2,
+                self.key,
+                self.probe_key,
+                str(self.reset_timeout_seconds),
+                # a probe that never reports back frees its lease after another reset timeout
+                str(max(1, int(self.reset_timeout_seconds))),
+            )
+        except redis.RedisError as ex:
+            self._redis_guard.mark_failed(ex)
+            return
+
+        if state in (b"open", "open"):
+            raise CircuitOpenError(
+                "GlobalSearch circuit is open after repeated failures, not sending request"
+            )
+
+    def record_success(self) -> None:
+        if not self.is_enabled or not self._redis_guard.is_usable():
+            return
+
+        try:
+            with get_redis_connection().pipeline() as pipeline:
+                pipeline.hset(
+                    self.key,
+                    mapping={
+                        "state": CircuitState.CLOSED,
+                        "num_failures": 0,
+                        "datetime_opened": "",
+                    },
+                )
+                pipeline.delete(self.probe_key)
+                pipeline.execute()
+        except redis.RedisError as ex:
+            self._redis_guard.mark_failed(ex)
+
+    def record_failure(self) -> None:
+        if not self.is_enabled or not self._redis_guard.is_usable():
+            return
+
+        try:
+            get_redis_connection().eval(
+                _RECORD_FAILURE_SCRIPT, 2, self.key, self.probe_key, str(self.failure_threshold)
+            )
+        except redis.RedisError as ex:
+            self._redis_guard.mark_failed(ex)
+
+    def get_status(self) -> CircuitStatus | None:
+        """The shared circuit status, None if Redis is unavailable."""
+        try:
+            values = get_redis_connection().hgetall(self.key)
+        except redis.RedisError:
+            return None
+
+        status = {key.decode(): value.decode() for key, value in values.items()}  # type: ignore [union-attr]
+        datetime_opened = (
+            datetime.datetime.fromtimestamp(float(status["datetime_opened"]), tz=datetime.UTC)
+            if status.get("datetime_opened")
+            else None
+        )
+        return CircuitStatus(
+            state=CircuitState(status.get("state", CircuitState.CLOSED)),
+            num_failures=int(status.get("num_failures", 0)),
+            datetime_opened=datetime_opened,
+        )
+
+    def reset(self) -> None:
+        get_redis_connection().delete(self.key, self.probe_key)
+
+
+circuit_breaker = CircuitBreaker(
+    "class_tracker:globalsearch:circuit",
+    failure_threshold=settings.GLOBALSEARCH_CIRCUIT_FAILURE_THRESHOLD,
+    reset_timeout_seconds=settings.GLOBALSEARCH_CIRCUIT_RESET_TIMEOUT_SECONDS,
+    # replayed responses never reach GlobalSearch
+    is_enabled=settings.GLOBALSEARCH_ARCHIVE_MODE != "replay",
+)
@@ -1,20 +1,60 @@
 import logging
+import time
+from typing import Any
 
-from requests import Session
+from requests import RequestException, Response, Session
 
 from ..models import CourseCareer, School, Subject, Term
 from . import GLOBALSEARCH_ORIGIN_URL, GLOBALSEARCH_URL
+from .circuit_breaker import circuit_breaker
+from .rate_limiter import rate_limiter
 
 logger = logging.getLogger("main")
 
 
+class SessionExpiredError(Exception):
+    """GlobalSearch dropped the server-side school/term selection for this session."""
+
+
+def is_session_expired_page(page_src: str) -> bool:
+    """An expired session is answered with the institution selection page instead of results."""
+    return 'name="inst_selection"' in page_src and "testing_msg" not in page_src
+
+
+def _send(session: Session, method: str, *, timeout: float, **kwargs: Any) -> Response:
+    """
+    Send a GlobalSearch request through the shared circuit breaker & rate limiter, reporting back
+    how it went. Raises `CircuitOpenError` right away while GlobalSearch is considered down.
+    """
+    # wait for a token first: a half-open circuit's probe lease is only released by the outcome of
+    # a request actually sent, so it must not be granted to a request that then times out waiting
+    rate_limiter.acquire(timeout=timeout)
+    circuit_breaker.before_request()
+
+    start = time.monotonic()
+    try:
+        response = session.request(method, GLOBALSEARCH_URL, timeout=timeout, **kwargs)
+    except RequestException:
+        rate_limiter.record_failure()
+        circuit_breaker.record_failure()
+        raise
+    rate_limiter.record_response(time.monotonic() - start, response.status_code)
+
+    if response.status_code >= 500:  # noqa: PLR2004
+        circuit_breaker.record_failure()
+    else:
+        circuit_breaker.record_success()
+
+    response.raise_for_status()
+    return response
+
+
 def get_main_page(session: Session, timeout: float = 10) -> str:
     session.headers.update(
         {"sec-fetch-site": "none"},
     )
 
-    response = session.get(GLOBALSEARCH_URL, timeout=timeout)
-    response.raise_for_status()
+    response = _send(session, "GET", timeout=timeout)
 
     return response.text
 
@@ -32,8 +72,7 @@ def get_main_page_anew(session: Session, timeout: float = 10) -> str:
 
     payload = {"new_search": "New Search"}
 
-    response = session.get(GLOBALSEARCH_URL, data=payload, timeout=timeout)
-    response.raise_for_status()
+    response = _send(session, "GET", data=payload, timeout=timeout)
 
     return response.text
 
@@ -59,8 +98,7 @@ def get_subject_selection_page(
         "next_btn": "Next",
     }
 
-    response = session.post(GLOBALSEARCH_URL, data=payload, timeout=timeout)
-    response.raise_for_status()
+    response = _send(session, "POST", data=payload, timeout=timeout)
 
     return response.text
 
@@ -115,7 +153,9 @@ def get_classlist_result_page(
     if open_classes_only:
         payload["open_class"] = "O"
 
-    response = session.post(GLOBALSEARCH_URL, data=payload, timeout=timeout)
-    response.raise_for_status()
+    response = _send(session, "POST", data=payload, timeout=timeout)
+
+    if is_session_expired_page(response.text):
+        raise SessionExpiredError(f"Session expired before fetching {subject.name} class list")
 
     return response.text
@@ -0,0 +1,110 @@
+import logging
+import multiprocessing
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from types import TracebackType
+from typing import Self
+
+import django
+from django.conf import settings
+
+from .parser import parse_class_list_page
+from .typedefs import GSCourse
+
+logger = logging.getLogger("main")
+
+
+class ParsePool:
+    """
+    Parses class list pages on worker processes, so parsing several pages is not serialized on the
+    GIL of the calling process. The `GSCourse` trees are pickled back to the caller.
+
+    With `num_workers=0` pages are parsed in the calling process instead, which is also where
+    parsing falls back to if a worker process dies. A pool may be shared by several threads.
+    """
+
+    def __init__(self, num_workers: int):
+        self.num_workers = max(0, num_workers)
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()  # guards `_executor` & `num_workers`
+
+    @classmethod
+    def from_settings(cls) -> Self:
+        return cls(settings.CLASS_TRACKER_PARSE_WORKERS)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc_value: BaseException | None,
+        _traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _get_executor(self) -> ProcessPoolExecutor | None:
+        with self._lock:
+            if self._executor is None and self.num_workers > 0:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.num_workers,
+                    # a fresh interpreter, rather than a fork of a possibly multi-threaded process
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=django.setup,
+                )
+            return self._executor
+
+    def submit(self, page_src: str) -> "Future[list[GSCourse]]":
+        executor = self._get_executor()
+        if executor is not None:
+            try:
+                return executor.submit(parse_class_list_page, page_src)
+            except RuntimeError:
+                # `BrokenProcessPool`, or the executor was shut down by another thread falling back
+                self._fall_back_in_process()
+
+        future: Future[list[GSCourse]] = Future()
+        try:
+            future.set_result(parse_class_list_page(page_src))
+        except Exception as ex:  # noqa: BLE001 - raised from `result()`, like an executor would
+            future.set_exception(ex)
+        return future
+
+    def parse(self, page_src: str) -> list[GSCourse]:
+        try:
+            return self.submit(page_src).result()
+        except (BrokenProcessPool, CancelledError):
+            # cancelled when another thread fell back in-process while the page was queued; the
+            # page may well be what killed the worker, but a real parse error is worth seeing
+            self._fall_back_in_process()
+            return parse_class_list_page(page_src)
+
+    def map(self, page_srcs: Iterable[str]) -> Iterator[list[GSCourse]]:
+        """Parse every page, yielding results in the order of `page_srcs`."""
+        futures = [self.submit(page_src) for page_src in page_srcs]
+        for future in futures:
+            yield future.result()
+
+    def warm_up(self) -> None:
+        """Start every worker process now rather than on the first pages."""
+        for future in [self.submit("") for _ in range(self.num_workers)]:
+            future.result()
+
+    def _fall_back_in_process(self) -> None:
+        with self._lock:
+            if self.num_workers == 0:  # another thread already fell back
+                return
+            self.num_workers = 0
+
+        logger.warning("Parse worker process died, parsing in-process from now on")
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+
+        # outside the lock, as shutting down waits for the pages being parsed
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
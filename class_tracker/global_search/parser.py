@@ -1,18 +1,40 @@
+import hashlib
+import io
 import logging
+import re
 from typing import Iterable, cast
 
 from bs4 import BeautifulSoup, Comment, Doctype, PageElement, ProcessingInstruction, Tag
+from lxml import etree
+from lxml import html as lxml_html
+from requests import Session
 
-from server.util import bulk_create_and_get, init_http_retrier
+from server.util import bulk_create_and_get
 
 from .. import models
-from . import get_globalsearch_headers
-from .navigator import get_classlist_result_page, get_subject_selection_page
+from .navigator import get_classlist_result_page
+from .session_pool import session_pool
 from .typedefs import GSCourse
 from .util import get_course_section
 
 logger = logging.getLogger("main")
 
+# a single scan over rows; `//table[...]//tr` instead merges one node-set per table, which is
+# quadratic on pages listing hundreds of courses
+_CLASSINFO_ROWS_XPATH = etree.XPath(
+    "//tr[td[@data-label='Class']]"
+    "[ancestor::table[1][contains(concat(' ', normalize-space(@class), ' '), ' classinfo ')]]"
+)
+_CLASS_NUMBER_XPATH = etree.XPath("normalize-space(td[@data-label='Class'])")
+_STATUS_XPATH = etree.XPath("td[@data-label='Status']//img[@alt and @title][1]/@title")
+
+# parts of a class list page that change without the catalog changing: section status icons (kept
+# current by polling), session ids in links & whitespace
+_VOLATILE_MARKUP_RE = re.compile(
+    r"<img\b[^>]*/images/(?:open|closed|wait)\.jpg[^>]*>|;jsessionid=[^?\"'#]*", re.IGNORECASE
+)
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 def get_terms_available(soup: BeautifulSoup) -> list[models.Term]:
     term_select_elm = soup.find("select", attrs={"name": "term_value"})
@@ -115,33 +137,135 @@ def parse_gs_courses(course_results_soup: BeautifulSoup) -> list[GSCourse]:
     courses: list[GSCourse] = []
 
     for course_label_container in course_label_containers:
-        course_full_title = course_label_container.text.replace("\xa0", " ").strip()
-        course_sections_container = _find_next_tag_sibling(course_label_container)
-
-        logger.info("   - Parsing course: %s", course_full_title)
-
-        if course_sections_container is None:
-            value_error = ValueError("No next sibling found")
-            logger.exception(value_error)
-            raise value_error
-        if not course_sections_container.has_attr("id") or not str(
-            course_sections_container.get("id")
-        ).startswith("contentDivImg"):
-            logger.info("No class listing for %s", course_full_title)
+        gs_course = _parse_gs_course(
+            course_label_container.text, _find_next_tag_sibling(course_label_container)
+        )
+        if gs_course is not None:
+            courses.append(gs_course)
+
+    return courses
+
+
+def parse_class_list_page(course_results_page_src: str) -> list[GSCourse]:
+    """
+    `parse_gs_courses` straight from the page source. Needs no database access, so it can run in
+    a worker process.
+
+    Rather than building a soup of the whole page, the page is streamed through lxml and only the
+    sections container of one course at a time is turned into a soup. Each course's elements are
+    dropped once it is parsed, so parsing peaks at the size of a course instead of the whole page.
+    """
+    if not course_results_page_src.strip():
+        return []
+
+    courses: list[GSCourse] = []
+    # the `.testing_msg` course label whose sections container, its next sibling, is yet to end
+    course_label: etree._Element | None = None
+    for _, element in etree.iterparse(
+        io.BytesIO(course_results_page_src.encode()),
+        events=("end",),
+        html=True,
+        encoding="utf-8",
+    ):
+        if element.tag == "br":
             continue
 
-        course_sections = [
-            get_course_section(_filter_for_tag_elements(course_section_attrs_container.children))
-            for course_section_attrs_container in course_sections_container.select(
-                "table.classinfo > tbody > tr"
-            )
-        ]
+        if course_label is not None and element.getparent() is course_label.getparent():
+            gs_course = _parse_gs_course("".join(course_label.itertext()), _get_soup_tag(element))
+            if gs_course is not None:
+                courses.append(gs_course)
 
-        courses.append(GSCourse(course_full_title, course_sections))
+            # the course is parsed, let go of its elements
+            course_label_parent = element.getparent()
+            course_label_parent.remove(course_label)
+            course_label = None
+            if not _is_course_label(element):  # a label right after a label is a course itself
+                course_label_parent.remove(element)
+                continue
+        elif course_label is not None and element is course_label.getparent():
+            _parse_gs_course("".join(course_label.itertext()), None)  # raises, no next sibling
+
+        if _is_course_label(element):
+            course_label = element
 
     return courses
 
 
+def _is_course_label(element: etree._Element) -> bool:
+    """`[id^='content'] .testing_msg`, as selected by `parse_gs_courses`."""
+    return "testing_msg" in str(element.get("class", "")).split() and any(
+        str(ancestor.get("id", "")).startswith("content") for ancestor in element.iterancestors()
+    )
+
+
+def _get_soup_tag(element: etree._Element) -> Tag:
+    element_soup = BeautifulSoup(
+        etree.tostring(element, encoding="unicode", with_tail=False), "lxml"
+    )
+    return cast("Tag", element_soup.find(element.tag))
+
+
+def _parse_gs_course(
+    course_label_text: str, course_sections_container: Tag | None
+) -> GSCourse | None:
+    course_full_title = course_label_text.replace("\xa0", " ").strip()
+
+    logger.info("   - Parsing course: %s", course_full_title)
+
+    if course_sections_container is None:
+        value_error = ValueError("No next sibling found")
+        logger.exception(value_error)
+        raise value_error
+    if not course_sections_container.has_attr("id") or not str(
+        course_sections_container.get("id")
+    ).startswith("contentDivImg"):
+        logger.info("No class listing for %s", course_full_title)
+        return None
+
+    course_sections = (
+        get_course_section(_filter_for_tag_elements(course_section_attrs_container.children))
+        for course_section_attrs_container in course_sections_container.select(
+            "table.classinfo > tbody > tr"
+        )
+    )
+    return GSCourse.from_full_title(course_full_title, course_sections)
+
+
+def get_page_fingerprint(course_results_page_src: str) -> str:
+    """
+    Hash of a class list page with its volatile parts stripped, so a re-crawl can tell an unchanged
+    catalog apart without parsing the page.
+    """
+    normalized_page_src = _WHITESPACE_RE.sub(
+        " ", _VOLATILE_MARKUP_RE.sub("", course_results_page_src)
+    )
+    return hashlib.sha256(normalized_page_src.encode()).hexdigest()
+
+
+def parse_section_statuses(course_results_page_src: str) -> dict[int, str]:
+    """
+    Map class number to status ('Open', 'Closed', 'wait') for every `table.classinfo` row.
+
+    Lightweight alternative to `parse_gs_courses` for the polling path, which only needs
+    class numbers and statuses; no `GS*` objects are built.
+    """
+    if not course_results_page_src.strip():
+        return {}
+
+    document = lxml_html.document_fromstring(course_results_page_src)
+
+    section_statuses: dict[int, str] = {}
+    for row in _CLASSINFO_ROWS_XPATH(document):
+        class_number = _CLASS_NUMBER_XPATH(row)
+        statuses = _STATUS_XPATH(row)
+        if not statuses:
+            raise ValueError(f"Status indicator is None for class: {class_number}")
+
+        section_statuses[int(class_number)] = str(statuses[0])
+
+    return section_statuses
+
+
 def _is_proper_tag_element(element: PageElement) -> bool:
     return (
         isinstance(element, Tag)
@@ -171,24 +295,46 @@ def find_open_sections(
     term: models.Term,
     subject: models.Subject,
     course_career: models.CourseCareer,
+    timeout: float = 10,
 ) -> set[int]:
-    session = init_http_retrier(headers=get_globalsearch_headers(), num_retries=3)
-
-    logger.info("Handling school & term selection page")
-    get_subject_selection_page(session, school, term)
-
     logger.info("Handling departmental attributes page. Dept attribute: %s", subject.name)
-    course_results_page_src = BeautifulSoup(
-        get_classlist_result_page(session, course_career, subject), "lxml"
+    section_statuses = session_pool.run(
+        school,
+        term,
+        lambda session: _get_polled_section_statuses(session, course_career, subject, timeout),
+        timeout=timeout,
+    )
+
+    # sections absent from an open-classes-only listing are treated as closed
+    return {
+        number
+        for number, status in section_statuses.items()
+        if status == "Open" and number in watched_section_numbers
+    }
+
+
+def _get_polled_section_statuses(
+    session: Session, course_career: models.CourseCareer, subject: models.Subject, timeout: float
+) -> dict[int, str]:
+    """
+    Fetch section statuses using the open-classes-only filter, falling back to the full class list
+    when the filtered page is empty or fails to parse, since an empty listing can't be told apart
+    from a page GlobalSearch failed to render.
+    """
+    open_results_page_src = get_classlist_result_page(
+        session, course_career, subject, open_classes_only=True, timeout=timeout
     )
 
-    logger.info("Parsing courses from html source")
-    courses = parse_gs_courses(course_results_page_src)
+    try:
+        section_statuses = parse_section_statuses(open_results_page_src)
+    except ValueError:
+        logger.warning("Could not parse open-classes-only page for %s", subject.name, exc_info=True)
+        section_statuses = {}
 
-    open_watched_section_numbers: set[int] = set()
-    for course in courses:
-        for section in course.sections:
-            if section.status == "Open" and section.number in watched_section_numbers:
-                open_watched_section_numbers.add(section.number)
+    if section_statuses:
+        return section_statuses
 
-    return open_watched_section_numbers
+    logger.info("Open-classes-only page was empty for %s, fetching full class list", subject.name)
+    return parse_section_statuses(
+        get_classlist_result_page(session, course_career, subject, timeout=timeout)
+    )
@@ -0,0 +1,190 @@
+import time
+from dataclasses import dataclass
+from typing import Self, cast
+
+import redis
+from django.conf import settings
+from requests import RequestException
+
+from server.util import RedisOutageGuard, get_redis_connection
+
+# Token bucket shared by every process. Refills at the current rate up to `burst` tokens, using the
+# Redis clock so workers on different hosts agree on elapsed time. Returns the seconds to wait
+# before a token is available (0 when one was taken), as a string since Lua numbers are truncated
+# to integers on the way out.
+_ACQUIRE_SCRIPT = """
+local now_parts = redis.call("TIME")
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local burst = tonumber(ARGV[2])
+
+local state = redis.call("HMGET", KEYS[1], "tokens", "datetime_refilled", "rate")
+local rate = tonumber(state[3]) or tonumber(ARGV[1])
+local tokens = tonumber(state[1]) or burst
+local datetime_refilled = tonumber(state[2]) or now
+
+tokens = math.min(burst, tokens + math.max(0, now - datetime_refilled) * rate)
+
+local wait_seconds = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait_seconds = (1 - tokens) / rate
+end
+
+redis.call("HSET", KEYS[1], "tokens", tokens, "datetime_refilled", now, "rate", rate)
+redis.call("EXPIRE", KEYS[1], ARGV[3])
+return tostring(wait_seconds)
+"""
+
+# Additive increase / multiplicative decrease of the shared rate, clamped to [min_rate, max_rate]
+_ADJUST_SCRIPT = """
+local min_rate = tonumber(ARGV[2])
+local max_rate = tonumber(ARGV[3])
+local rate = tonumber(redis.call("HGET", KEYS[1], "rate")) or tonumber(ARGV[4])
+
+if ARGV[1] == "increase" then
+    rate = math.min(max_rate, rate + tonumber(ARGV[5]))
+else
+    rate = math.max(min_rate, rate * tonumber(ARGV[6]))
+end
+
+redis.call("HSET", KEYS[1], "rate", rate)
+redis.call("EXPIRE", KEYS[1], ARGV[7])
+return tostring(rate)
+"""
+
+
+class RateLimitTimeoutError(RequestException):
+    """No GlobalSearch request token became available within the request's timeout."""
+
+
+@dataclass(frozen=True)
+class RateLimitConfig:
+    initial_rate: float  # requests per second
+    min_rate: float
+    max_rate: float
+    burst: int
+    # replies faster than this earn a rate increase, slower than `slow_latency_seconds` a decrease
+    target_latency_seconds: float
+    slow_latency_seconds: float
+    increase_step: float = 0.1  # requests per second added per fast reply
+    decrease_factor: float = 0.5
+    state_ttl_seconds: int = 24 * 60 * 60
+
+    @classmethod
+    def from_settings(cls) -> Self:
+        return cls(
+            initial_rate=settings.GLOBALSEARCH_RATE_LIMIT_INITIAL_RATE,
+            min_rate=settings.GLOBALSEARCH_RATE_LIMIT_MIN_RATE,
+            max_rate=settings.GLOBALSEARCH_RATE_LIMIT_MAX_RATE,
+            burst=settings.GLOBALSEARCH_RATE_LIMIT_BURST,
+            target_latency_seconds=settings.GLOBALSEARCH_RATE_LIMIT_TARGET_LATENCY_SECONDS,
+            slow_latency_seconds=settings.GLOBALSEARCH_RATE_LIMIT_SLOW_LATENCY_SECONDS,
+        )
+
+
+class AdaptiveRateLimiter:
+    """
+    Paces outbound GlobalSearch requests across the web process and every scheduler worker with a
+    token bucket kept in Redis. The refill rate adapts to how GlobalSearch responds: fast replies
+    raise it step by step up to `max_rate`, while 5xx responses, connection errors and slow replies
+    cut it down to `min_rate` at worst.
+
+    If Redis cannot be reached the limiter fails open for a while, so a Redis outage never stops
+    polling.
+    """
+
+    def __init__(self, key: str, config: RateLimitConfig, *, is_enabled: bool = True):
+        self.key = key
+        self.config = config
+        self.is_enabled = is_enabled
+        self._redis_guard = RedisOutageGuard("GlobalSearch rate limiter")
+
+    def _take_token(self) -> float:
+        wait_seconds = get_redis_connection().eval(
+            _ACQUIRE_SCRIPT,
+            1,
+            self.key,
+            str(self.config.initial_rate),
+            str(self.config.burst),
+            str(self.config.state_ttl_seconds),
+        )
+        return float(cast("bytes", wait_seconds))
+
+    def acquire(self, timeout: float) -> None:
+        """Block until a request may be sent, raising `RateLimitTimeoutError` after `timeout`."""
+        if not self.is_enabled or not self._redis_guard.is_usable():
+            return
+
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                wait_seconds = self._take_token()
+            except redis.RedisError as ex:
+                self._redis_guard.mark_failed(ex)
+                return
+
+            if wait_seconds <= 0:
+                return
+
+            seconds_left = deadline - time.monotonic()
+            if wait_seconds > seconds_left:
+                raise RateLimitTimeoutError(
+                    f"No GlobalSearch request token within {timeout:.1f}s "
+                    f"(next in {wait_seconds:.1f}s)"
+                )
+            time.sleep(wait_seconds)
+
+    def _adjust_rate(self, direction: str) -> None:
+        if not self._redis_guard.is_usable():
+            return
+
+        try:
+            get_redis_connection().eval(
+                _ADJUST_SCRIPT,
+                1,
+                self.key,
+                direction,
+                str(self.config.min_rate),
+                str(self.config.max_rate),
+                str(self.config.initial_rate),
+                str(self.config.increase_step),
+                str(self.config.decrease_factor),
+                str(self.config.state_ttl_seconds),
+            )
+        except redis.RedisError as ex:
+            self._redis_guard.mark_failed(ex)
+
+    def record_response(self, latency_seconds: float, status_code: int) -> None:
+        if not self.is_enabled:
+            return
+
+        if status_code >= 500 or latency_seconds >= self.config.slow_latency_seconds:  # noqa: PLR2004
+            self._adjust_rate("decrease")
+        elif latency_seconds <= self.config.target_latency_seconds:
+            self._adjust_rate("increase")
+
+    def record_failure(self) -> None:
+        """A request that never got a response (connection error, timeout, exhausted retries)."""
+        if self.is_enabled:
+            self._adjust_rate("decrease")
+
+    def get_rate(self) -> float | None:
+        """Current shared rate in requests per second, None if unset or Redis is unavailable."""
+        try:
+            rate = get_redis_connection().hget(self.key, "rate")
+        except redis.RedisError:
+            return None
+        return float(rate) if rate is not None else None  # type: ignore [arg-type]
+
+    def reset(self) -> None:
+        get_redis_connection().delete(self.key)
+
+
+rate_limiter = AdaptiveRateLimiter(
+    "class_tracker:globalsearch:rate_limit",
+    RateLimitConfig.from_settings(),
+    # replayed responses never reach GlobalSearch
+    is_enabled=settings.GLOBALSEARCH_RATE_LIMIT_ENABLED
+    and settings.GLOBALSEARCH_ARCHIVE_MODE != "replay",
+)
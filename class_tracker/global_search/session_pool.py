@@ -0,0 +1,139 @@
+import logging
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TypeVar
+
+from django.conf import settings
+from requests import Session
+
+from ..models import School, Term
+from . import init_globalsearch_session
+from .navigator import SessionExpiredError, get_subject_selection_page
+
+logger = logging.getLogger("main")
+
+T = TypeVar("T")
+TSessionKey = tuple[str, str]  # (school globalsearch_key, term globalsearch_key)
+
+
+@dataclass
+class PooledSession:
+    session: Session
+    selection_page_src: str  # subject selection page returned while warming the session
+    datetime_warmed: float  # time.monotonic() timestamp
+
+
+class GlobalSearchSessionPool:
+    """
+    Keeps cookie-bearing GlobalSearch sessions that already posted a school & term selection,
+    so follow-up class list requests can skip the selection POST and reuse open connections.
+
+    Sessions are keyed by (school, term); a key can hold several idle sessions so concurrent
+    pollers never share one `requests.Session`.
+    """
+
+    def __init__(self, *, max_idle_per_key: int, max_age_seconds: float):
+        self._max_idle_per_key = max_idle_per_key
+        self._max_age_seconds = max_age_seconds
+        self._idle_sessions: defaultdict[TSessionKey, list[PooledSession]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_key(school: School, term: Term) -> TSessionKey:
+        return (school.globalsearch_key, term.globalsearch_key)
+
+    def _is_stale(self, pooled_session: PooledSession) -> bool:
+        return time.monotonic() - pooled_session.datetime_warmed > self._max_age_seconds
+
+    def _checkout(self, key: TSessionKey) -> PooledSession | None:
+        with self._lock:
+            idle_sessions = self._idle_sessions[key]
+            while idle_sessions:
+                pooled_session = idle_sessions.pop()
+                if not self._is_stale(pooled_session):
+                    return pooled_session
+                pooled_session.session.close()
+        return None
+
+    def _checkin(self, key: TSessionKey, pooled_session: PooledSession) -> None:
+        with self._lock:
+            if len(self._idle_sessions[key]) < self._max_idle_per_key:
+                self._idle_sessions[key].append(pooled_session)
+                return
+        pooled_session.session.close()
+
+    @staticmethod
+    def _warm(
+        school: School, term: Term, timeout: float, session: Session | None = None
+    ) -> PooledSession:
+        session = session or init_globalsearch_session()
+        logger.info("Warming GlobalSearch session for %s - %s", school.name, term.full_term_name)
+        selection_page_src = get_subject_selection_page(session, school, term, timeout=timeout)
+        return PooledSession(
+            session=session,
+            selection_page_src=selection_page_src,
+            datetime_warmed=time.monotonic(),
+        )
+
+    @contextmanager
+    def session(
+        self, school: School, term: Term, *, timeout: float = 10, rewarm: bool = False
+    ) -> Iterator[PooledSession]:
+        """
+        Check out a warmed session. It is returned to the pool only if the block exits cleanly,
+        so a session left in an unknown state by an error is never reused.
+        """
+        key = self._get_key(school, term)
+        pooled_session = None if rewarm else self._checkout(key)
+        if pooled_session is None:
+            pooled_session = self._warm(school, term, timeout)
+
+        try:
+            yield pooled_session
+        except BaseException:
+            pooled_session.session.close()
+            raise
+
+        self._checkin(key, pooled_session)
+
+    def run(
+        self,
+        school: School,
+        term: Term,
+        callback: Callable[[Session], T],
+        *,
+        timeout: float = 10,
+    ) -> T:
+        """Run `callback` with a warmed session, re-warming once if the server-side session expired."""
+        with self.session(school, term, timeout=timeout) as pooled_session:
+            try:
+                return callback(pooled_session.session)
+            except SessionExpiredError:
+                logger.info(
+                    "GlobalSearch session expired for %s - %s, re-warming",
+                    school.name,
+                    term.full_term_name,
+                )
+
+            rewarmed_session = self._warm(school, term, timeout, session=pooled_session.session)
+            pooled_session.selection_page_src = rewarmed_session.selection_page_src
+            pooled_session.datetime_warmed = rewarmed_session.datetime_warmed
+
+            return callback(pooled_session.session)
+
+    def clear(self) -> None:
+        with self._lock:
+            for idle_sessions in self._idle_sessions.values():
+                for pooled_session in idle_sessions:
+                    pooled_session.session.close()
+            self._idle_sessions.clear()
+
+
+session_pool = GlobalSearchSessionPool(
+    max_idle_per_key=settings.GLOBALSEARCH_MAX_CONNECTIONS_PER_HOST,
+    max_age_seconds=settings.GLOBALSEARCH_SESSION_MAX_AGE_SECONDS,
+)
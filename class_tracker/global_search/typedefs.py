@@ -1,6 +1,9 @@
+import hashlib
 import re
+import sys
+from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import Literal, TypedDict
+from typing import Literal, Self, TypedDict
 
 
 class TSessionData(TypedDict):
@@ -8,7 +11,11 @@ class TSessionData(TypedDict):
     headers: dict[str, str]
 
 
-@dataclass
+# GS* objects are kept for every class list of a crawl, so they are slotted & frozen, with the
+# strings repeated across sections (instructors, rooms, meetings...) interned by the parser
+
+
+@dataclass(frozen=True, slots=True)
 class GSInstructionEntry:
     days_and_times: str
     room: str
@@ -16,7 +23,7 @@ class GSInstructionEntry:
     meeting_dates: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GSCourseSection:
     unique_id: str  # gathered from url query param
     number: int
@@ -25,29 +32,55 @@ class GSCourseSection:
     instruction_mode: str
     status: Literal["Open", "Closed", "wait"]
     topic: str
-    instruction_entries: list[GSInstructionEntry]
+    instruction_entries: tuple[GSInstructionEntry, ...]
+
+    def get_fingerprint(self, course_name: str) -> str:
+        """
+        Hash of everything an ingest writes for this section. The status is left out, it changes
+        all the time and is kept up to date by polling instead.
+        """
+        content = (
+            course_name,
+            self.number,
+            self.section_name,
+            self.url,
+            self.instruction_mode,
+            self.topic,
+            [
+                (entry.days_and_times, entry.room, entry.instructor, entry.meeting_dates)
+                for entry in self.instruction_entries
+            ],
+        )
+        return hashlib.sha256(repr(content).encode()).hexdigest()
 
 
+_COURSE_INFO_RE = re.compile(r"^(\w+) *(\w+)? *- *(.+)", flags=re.IGNORECASE)
+
+
+@dataclass(frozen=True, slots=True)
 class GSCourse:
     code: str  # eg. CSCI
     level: str  # eg. 331
     title: str  # eg. Database Systems
-    sections: list[GSCourseSection]
-
-    def __init__(self, course_full_title: str, course_sections: list[GSCourseSection]):
-        self.sections = course_sections
+    sections: tuple[GSCourseSection, ...]
 
-        course_info_re = re.compile(r"^(\w+) *(\w+)? *- *(.+)", flags=re.IGNORECASE)
-        match = course_info_re.search(course_full_title)
+    @classmethod
+    def from_full_title(
+        cls, course_full_title: str, course_sections: Iterable[GSCourseSection]
+    ) -> Self:
+        match = _COURSE_INFO_RE.search(course_full_title)
 
         if not match:
             raise ValueError(
-                f"{course_info_re} did not match course info str: {course_full_title!r}"
+                f"{_COURSE_INFO_RE} did not match course info str: {course_full_title!r}"
             )
 
-        self.code = match.group(1).strip()
-        self.level = match.group(2).strip()
-        self.title = match.group(3).strip()
+        return cls(
+            code=sys.intern(match.group(1).strip()),
+            level=match.group(2).strip(),
+            title=match.group(3).strip(),
+            sections=tuple(course_sections),
+        )
 
     def get_name(self) -> str:
         return f"{self.code} {self.level}"
@@ -1,3 +1,6 @@
+import sys
+from dataclasses import dataclass
+from typing import Literal
 from urllib.parse import parse_qs, urlparse
 
 from bs4 import Tag
@@ -5,17 +8,21 @@ from bs4 import Tag
 from .typedefs import GSCourseSection, GSInstructionEntry
 
 
+@dataclass
+class SectionAttributes:
+    """The single-valued attributes of a section, gathered before its `GSCourseSection` is built."""
+
+    unique_id: str = ""
+    number: int = 0
+    section_name: str = ""
+    url: str = ""
+    instruction_mode: str = ""
+    status: Literal["Open", "Closed", "wait"] = "Closed"
+    topic: str = ""
+
+
 def get_course_section(section_attr_elements: list[Tag]) -> GSCourseSection:
-    gs_course_section = GSCourseSection(
-        unique_id="",
-        number=0,
-        section_name="",
-        topic="",
-        url="",
-        instruction_mode="",
-        status="Closed",
-        instruction_entries=[],
-    )
+    section_attributes = SectionAttributes()
 
     days_and_times_list: list[str] = []
     room_list: list[str] = []
@@ -25,7 +32,7 @@ def get_course_section(section_attr_elements: list[Tag]) -> GSCourseSection:
     for section_attr_element in section_attr_elements:
         assign_section_attributes(
             section_attr_element,
-            gs_course_section,
+            section_attributes,
             days_and_times_list,
             room_list,
             instructor_list,
@@ -70,20 +77,28 @@ def get_course_section(section_attr_elements: list[Tag]) -> GSCourseSection:
         strict=True,
     ):
         instruction_entry = GSInstructionEntry(
-            days_and_times=truncate_if_non_word(days_and_times).strip() or "TBA",
-            room=truncate_if_non_word(room).strip() or "TBA",
-            instructor=truncate_if_non_word(instructor).strip() or "TBA",
-            meeting_dates=truncate_if_non_word(meeting_dates),
+            days_and_times=sys.intern(truncate_if_non_word(days_and_times).strip() or "TBA"),
+            room=sys.intern(truncate_if_non_word(room).strip() or "TBA"),
+            instructor=sys.intern(truncate_if_non_word(instructor).strip() or "TBA"),
+            meeting_dates=sys.intern(truncate_if_non_word(meeting_dates)),
         )
         instruction_entries.append(instruction_entry)
-    gs_course_section.instruction_entries = instruction_entries
 
-    return gs_course_section
+    return GSCourseSection(
+        unique_id=section_attributes.unique_id,
+        number=section_attributes.number,
+        section_name=sys.intern(section_attributes.section_name),
+        url=section_attributes.url,
+        instruction_mode=sys.intern(section_attributes.instruction_mode),
+        status=section_attributes.status,
+        topic=sys.intern(section_attributes.topic),
+        instruction_entries=tuple(instruction_entries),
+    )
 
 
 def assign_section_attributes(  # noqa: PLR0912
     section_attr_element: Tag,
-    gs_course_section: GSCourseSection,
+    section_attributes: SectionAttributes,
     days_and_times_list: list[str],
     room_list: list[str],
     instructor_list: list[str],
@@ -97,7 +112,7 @@ def assign_section_attributes(  # noqa: PLR0912
 
     match data_label:
         case "Class":
-            gs_course_section.number = int(section_attr_element.get_text(separator="\n").strip())
+            section_attributes.number = int(section_attr_element.get_text(separator="\n").strip())
 
             anchor_tag = section_attr_element.select_one("a")
             if anchor_tag is None:
@@ -106,19 +121,19 @@ def assign_section_attributes(  # noqa: PLR0912
             url = anchor_tag.get("href")
             if url is None:
                 raise ValueError(f"No href found in anchor tag: {anchor_tag}")
-            gs_course_section.url = str(url)
+            section_attributes.url = str(url)
 
-            parsed_url = urlparse(gs_course_section.url)
+            parsed_url = urlparse(section_attributes.url)
             query_params = parse_qs(parsed_url.query)
             class_number_searched = query_params.get("class_number_searched", [None])[0]
             if class_number_searched is None:
                 raise ValueError(
-                    f"url query param 'class_number_searched' is None in url: {gs_course_section.url}"
+                    f"url query param 'class_number_searched' is None in url: {section_attributes.url}"
                 )
-            gs_course_section.unique_id = class_number_searched
+            section_attributes.unique_id = class_number_searched
 
         case "Section":
-            gs_course_section.section_name = section_attr_element.get_text(separator="\n").strip()
+            section_attributes.section_name = section_attr_element.get_text(separator="\n").strip()
         case "DaysAndTimes":
             days_and_times_list.extend(
                 [
@@ -141,7 +156,7 @@ def assign_section_attributes(  # noqa: PLR0912
                 ]
             )
         case "Instruction Mode":
-            gs_course_section.instruction_mode = section_attr_element.get_text(
+            section_attributes.instruction_mode = section_attr_element.get_text(
                 separator="\n"
             ).strip()
         case "Meeting Dates":
@@ -155,13 +170,13 @@ def assign_section_attributes(  # noqa: PLR0912
             status_indicator = section_attr_element.select_one("img[alt][title]")
             if status_indicator is None:
                 raise ValueError(
-                    f"Status indicator is None for class: {gs_course_section.section_name} - {gs_course_section.number}"
+                    f"Status indicator is None for class: {section_attributes.section_name} - {section_attributes.number}"
                 )
             status = status_indicator.get("title")
-            gs_course_section.status = str(status)  # type: ignore[assignment]
+            section_attributes.status = sys.intern(str(status))  # type: ignore[assignment]
 
         case "Course Topic":
-            gs_course_section.topic = section_attr_element.get_text(separator="\n").strip()
+            section_attributes.topic = section_attr_element.get_text(separator="\n").strip()
         case _:
             raise ValueError(f"Bad data label: '{data_label}'")
 
@@ -1,16 +1,40 @@
 import logging
-from datetime import timedelta
+from datetime import datetime
+from functools import partial
 
+import redis
+from django.conf import settings
+from django.db import transaction
 from django.utils import timezone
+from scheduler.helpers.queues import get_queue
 
+from .global_search.circuit_breaker import CircuitOpenError
 from .global_search.parser import find_open_sections
-from .models import ClassAlert, CourseSection, GlobalSettings, Recipient
+from .global_search.rate_limiter import RateLimitTimeoutError
+from .models import (
+    CatalogCrawl,
+    CatalogCrawlUnit,
+    ClassAlert,
+    CourseSection,
+    GlobalSettings,
+    OutboxNotification,
+    Recipient,
+)
 from .util import (
     SearchGroup,
     get_grouped_watched_sections_for_search,
     group_open_sections_by_recipient,
 )
-from .util.notifier import notify_recipient
+from .util.alert_ledger import alert_ledger
+from .util.crawl import plan_crawl_units, run_crawl_unit
+from .util.crawl_pipeline import CrawlPipelineConfig, run_crawl_pipeline
+from .util.outbox import (
+    OutboxConfig,
+    drain_outbox,
+    get_due_notifications_filter,
+    get_next_retry_datetime,
+)
+from .util.polling import PollingConfig, run_concurrently
 
 logger = logging.getLogger("main")
 
@@ -19,8 +43,121 @@ def test_job() -> None:
     logger.info("Hello there")
 
 
+def enqueue_catalog_crawl(crawl: CatalogCrawl) -> None:
+    get_queue("default").create_and_enqueue_job(
+        start_catalog_crawl, args=(crawl.id,), description=f"Plan catalog crawl {crawl}"
+    )
+
+
+def enqueue_crawl_units(units: list[CatalogCrawlUnit]) -> None:
+    """
+    Enqueue one job per unit. The jobs are not spaced out: every GlobalSearch request goes through
+    the shared rate limiter, which paces the crawl together with polling.
+    """
+    queue = get_queue("default")
+    for unit in units:
+        queue.create_and_enqueue_job(
+            crawl_catalog_unit, args=(unit.id,), description=f"Crawl {unit}"
+        )
+
+
+def enqueue_pending_crawl_units(crawl: CatalogCrawl, units: list[CatalogCrawlUnit]) -> None:
+    """
+    Crawls covering several class lists run as a single `crawl_catalog_pipeline` job, which overlaps
+    fetching, parsing & writing; a lone unit (or a disabled pipeline) gets a job per unit.
+    """
+    if not settings.CLASS_TRACKER_CRAWL_PIPELINE_ENABLED or len(units) <= 1:
+        enqueue_crawl_units(units)
+        return
+
+    get_queue("default").create_and_enqueue_job(
+        crawl_catalog_pipeline,
+        args=(crawl.id,),
+        timeout=settings.CLASS_TRACKER_CRAWL_PIPELINE_JOB_TIMEOUT_SECONDS,
+        description=f"Crawl {len(units)} class lists of {crawl}",
+    )
+
+
+def start_catalog_crawl(crawl_id: int) -> None:
+    crawl = CatalogCrawl.objects.select_related("term", "school", "subject").get(id=crawl_id)
+
+    units = plan_crawl_units(crawl)
+    pending_units = [
+        unit for unit in units if unit.status != CatalogCrawlUnit.StatusChoices.COMPLETED
+    ]
+    logger.info(
+        "Planned %d units for catalog crawl %r, %d left to run",
+        len(units),
+        crawl,
+        len(pending_units),
+    )
+
+    crawl.status = CatalogCrawl.StatusChoices.RUNNING
+    crawl.save(update_fields=["status"])
+
+    if not pending_units:
+        crawl.mark_finished_if_done()
+        return
+
+    enqueue_pending_crawl_units(crawl, pending_units)
+
+
+def crawl_catalog_pipeline(crawl_id: int) -> None:
+    crawl = CatalogCrawl.objects.select_related("term", "school", "subject").get(id=crawl_id)
+    pending_units = list(
+        crawl.units.exclude(status=CatalogCrawlUnit.StatusChoices.COMPLETED)
+        .select_related("school", "career", "subject")
+        .order_by("id")
+    )
+    if not pending_units:
+        crawl.mark_finished_if_done()
+        return
+
+    run_crawl_pipeline(crawl, pending_units, CrawlPipelineConfig.from_settings())
+
+
+def crawl_catalog_unit(unit_id: int) -> None:
+    unit = CatalogCrawlUnit.objects.select_related(
+        "crawl__term", "school", "career", "subject"
+    ).get(id=unit_id)
+
+    if unit.status == CatalogCrawlUnit.StatusChoices.COMPLETED:
+        logger.info("Skipping already completed crawl unit %r", unit)
+        return
+
+    run_crawl_unit(unit)
+
+
+def resume_catalog_crawl(crawl: CatalogCrawl) -> int:
+    """
+    Re-queue every unit of a crawl that has not completed: failed units, units left running by a
+    worker that died & units whose job was lost. Completed units keep their checkpoint and are not
+    fetched again. A crawl whose planning job was lost is planned again.
+    """
+    if not crawl.units.exists():
+        CatalogCrawl.objects.filter(id=crawl.id).update(datetime_modified=timezone.now())
+        enqueue_catalog_crawl(crawl)
+        return 0
+
+    pending_units = list(crawl.units.exclude(status=CatalogCrawlUnit.StatusChoices.COMPLETED))
+    if not pending_units:
+        crawl.mark_finished_if_done()
+        return 0
+
+    crawl.units.filter(id__in=[unit.id for unit in pending_units]).update(
+        status=CatalogCrawlUnit.StatusChoices.QUEUED, error="", datetime_modified=timezone.now()
+    )
+    crawl.status = CatalogCrawl.StatusChoices.RUNNING
+    crawl.datetime_finished = None
+    crawl.save(update_fields=["status", "datetime_finished"])
+
+    enqueue_pending_crawl_units(crawl, pending_units)
+    return len(pending_units)
+
+
 def check_for_open_sections() -> None:
     logger.info("Checking for open sections")
+    enqueue_due_notification_dispatch()
 
     search_groups = get_grouped_watched_sections_for_search()
 
@@ -30,17 +167,17 @@ def check_for_open_sections() -> None:
 
     logger.info("Found %d search groups to process", len(search_groups))
 
-    all_recipients_with_open_sections: dict[Recipient, list[CourseSection]] = {}
-
-    for group in search_groups:
-        group_recipients_with_open_sections = _find_search_group_open_sections(group)
+    polling_config = PollingConfig.from_settings()
+    groups_open_section_numbers = run_concurrently(
+        search_groups,
+        partial(_find_search_group_open_sections, timeout=polling_config.request_timeout_seconds),
+        describe=_describe_search_group,
+        config=polling_config,
+    )
 
-        # merge results with existing data
-        for recipient, sections in group_recipients_with_open_sections.items():
-            if recipient in all_recipients_with_open_sections:
-                all_recipients_with_open_sections[recipient].extend(sections)
-            else:
-                all_recipients_with_open_sections[recipient] = sections
+    all_recipients_with_open_sections = group_open_sections_by_recipient(
+        groups_open_section_numbers
+    )
 
     if all_recipients_with_open_sections:
         # Filter out sections that have recent alerts within grace period
@@ -56,11 +193,21 @@ def check_for_open_sections() -> None:
         logger.info("No open sections found for any recipients")
 
 
-def _find_search_group_open_sections(group: SearchGroup) -> dict[Recipient, list[CourseSection]]:
-    """Process a single search group and return recipients with their open sections."""
+def _describe_search_group(group: SearchGroup) -> str:
+    return (
+        f"{group.school.name} - {group.term.full_term_name} - "
+        f"{group.subject.name} - {group.career.name}"
+    )
+
+
+def _find_search_group_open_sections(
+    group: SearchGroup, timeout: float = 10
+) -> tuple[SearchGroup, set[int]]:
+    """Process a single search group and return the numbers of its watched sections that are open."""
     logger.info(
-        "Searching for %d sections in %s - %s - %s - %s",
+        "Searching for %d sections watched by %d recipients in %s - %s - %s - %s",
         len(group.section_numbers),
+        len(group.recipient_ids),
         group.school.name,
         group.term.full_term_name,
         group.subject.name,
@@ -68,65 +215,54 @@ def _find_search_group_open_sections(group: SearchGroup) -> dict[Recipient, list
     )
 
     try:
-        section_num_to_section: dict[int, CourseSection] = {}
-        for recipient in group.recipients:
-            for watched_section in recipient.watched_sections.all():
-                section_num_to_section[watched_section.number] = watched_section
-
         open_section_numbers = find_open_sections(
-            set(group.section_numbers), group.school, group.term, group.subject, group.career
+            set(group.section_numbers),
+            group.school,
+            group.term,
+            group.subject,
+            group.career,
+            timeout=timeout,
         )
-
-        open_sections = [
-            section_num_to_section[num]
-            for num in open_section_numbers
-            if num in section_num_to_section
-        ]
-
-        if len(open_sections) > 0:
-            logger.info("Found %d open sections", len(open_sections))
-            return group_open_sections_by_recipient(open_sections, group.recipients)
-
-        logger.info("No open sections found for this group")
-        return {}
-
     except (ValueError, ConnectionError, TimeoutError):
         logger.exception(
             "Error searching for classes in %s - %s", group.school.name, group.term.full_term_name
         )
-        return {}
+        return group, set()
+    except (CircuitOpenError, RateLimitTimeoutError) as ex:
+        # GlobalSearch is down or saturated, the next poll will retry
+        logger.warning(
+            "Skipped searching for classes in %s - %s: %s",
+            group.school.name,
+            group.term.full_term_name,
+            ex,
+        )
+        return group, set()
+
+    if len(open_section_numbers) > 0:
+        logger.info("Found %d open sections", len(open_section_numbers))
+    else:
+        logger.info("No open sections found for this group")
+    return group, open_section_numbers
+
+
+def _get_hours_renotify_grace_period() -> float:
+    global_settings = GlobalSettings.objects.first()
+    return global_settings.hours_renotify_grace_period if global_settings is not None else 6.0
 
 
 def _filter_sections_within_grace_period(
     recipients_with_open_sections: dict[Recipient, list[CourseSection]],
 ) -> dict[Recipient, list[CourseSection]]:
     """Filter out course sections that have recent ClassAlert records within the grace period."""
-    hours_grace_period = 6.0
     try:
-        global_settings = GlobalSettings.objects.first()
-        if global_settings is not None:
-            hours_grace_period = global_settings.hours_renotify_grace_period
-
-        grace_period_cutoff = timezone.now() - timedelta(hours=hours_grace_period)
-
-        # collect all recipients and sections to prepare for bulk query
-        all_recipients = list(recipients_with_open_sections.keys())
-        all_sections = [
-            section
-            for sections_list in recipients_with_open_sections.values()
-            for section in sections_list
-        ]
-
-        recent_alerts = ClassAlert.objects.filter(
-            recipient__in=all_recipients,
-            course_section__in=all_sections,
-            datetime_created__gt=grace_period_cutoff,
-        ).select_related("recipient", "course_section")
-
-        # set (recipient_id, section_id) tuples
-        recent_alert_pairs = {
-            (alert.recipient.id, alert.course_section.id) for alert in recent_alerts
-        }
+        recent_alert_pairs = alert_ledger.get_recent_pairs(
+            (
+                (recipient.id, section.id)
+                for recipient, open_sections in recipients_with_open_sections.items()
+                for section in open_sections
+            ),
+            hours_grace_period=_get_hours_renotify_grace_period(),
+        )
 
         filtered_recipients_with_sections: dict[Recipient, list[CourseSection]] = {}
 
@@ -157,7 +293,10 @@ def _filter_sections_within_grace_period(
 
 
 def _notify_recipients(recipients_with_open_sections: dict[Recipient, list[CourseSection]]) -> None:
-    """Notify all recipients about their open sections and create ClassAlert records."""
+    """
+    Create the ClassAlert records and queue a notification for each recipient in one transaction;
+    the notifications are sent by the `dispatch_notifications` job once it commits.
+    """
     logger.info("Notifying %d recipients about open sections", len(recipients_with_open_sections))
 
     all_alerts_to_create = [
@@ -165,24 +304,58 @@ def _notify_recipients(recipients_with_open_sections: dict[Recipient, list[Cours
         for recipient, open_sections in recipients_with_open_sections.items()
         for section in open_sections
     ]
+    notifications_to_create = [
+        OutboxNotification(
+            recipient=recipient,
+            message=f"Found New Open Course Sections!:\n{course_sections_str}",
+        )
+        for recipient, open_sections in recipients_with_open_sections.items()
+        if (course_sections_str := get_formatted_course_sections_msg(open_sections))
+    ]
+
+    if len(all_alerts_to_create) == 0:
+        return
+
+    with transaction.atomic():
+        created_alerts = ClassAlert.objects.bulk_create(all_alerts_to_create)
+        OutboxNotification.objects.bulk_create(notifications_to_create)
+        transaction.on_commit(enqueue_notification_dispatch)
+
+    logger.info(
+        "Created %d ClassAlert records & queued %d notifications",
+        len(created_alerts),
+        len(notifications_to_create),
+    )
+    alert_ledger.record(created_alerts, hours_grace_period=_get_hours_renotify_grace_period())
+
+
+def enqueue_notification_dispatch(when: datetime | None = None) -> None:
+    try:
+        get_queue("notifications").create_and_enqueue_job(
+            dispatch_notifications, when=when, description="Send queued notifications"
+        )
+    except redis.RedisError:
+        # the notifications stay in the outbox and are picked up by the next poll
+        logger.exception("Could not enqueue the notification dispatch")
+
+
+def enqueue_due_notification_dispatch() -> None:
+    """Enqueue a dispatch if notifications are due but their job was lost, e.g. to a Redis outage."""
+    due_notifications = OutboxNotification.objects.filter(
+        get_due_notifications_filter(timezone.now(), OutboxConfig.from_settings())
+    )
+    if due_notifications.exists():
+        logger.info("Found due notifications in the outbox, enqueueing a dispatch")
+        enqueue_notification_dispatch()
+
+
+def dispatch_notifications() -> None:
+    stats = drain_outbox(OutboxConfig.from_settings())
+    logger.info("Dispatched notifications: %s", stats)
 
-    if len(all_alerts_to_create) > 0:
-        ClassAlert.objects.bulk_create(all_alerts_to_create)
-        logger.info("Created %d ClassAlert records", len(all_alerts_to_create))
-
-    for recipient, open_sections in recipients_with_open_sections.items():
-        try:
-            course_sections_str = get_formatted_course_sections_msg(open_sections)
-            if course_sections_str:
-                message = f"Found New Open Course Sections!:\n{course_sections_str}"
-                notify_recipient(recipient, message)
-                logger.info(
-                    "Notified %s about %d open sections", recipient.name, len(open_sections)
-                )
-
-        except (ValueError, ConnectionError):
-            logger.exception("Error notifying recipient %s", recipient.name)
-            continue
+    datetime_next_retry = get_next_retry_datetime()
+    if datetime_next_retry is not None:
+        enqueue_notification_dispatch(when=datetime_next_retry)
 
 
 def get_formatted_course_sections_msg(course_sections: list[CourseSection]) -> str:
@@ -0,0 +1,171 @@
+import json
+import platform
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.utils import timezone
+
+from class_tracker.benchmarks.memory import CrawlMemoryResult, benchmark_crawl_memory
+from class_tracker.benchmarks.notify import FanOutResult, benchmark_notification_fanout
+from class_tracker.benchmarks.parse_pool import ParsePoolResult, benchmark_parse_pool
+from class_tracker.benchmarks.suite import PageBenchmark, benchmark_page
+from class_tracker.benchmarks.synthetic import generate_results_page
+from class_tracker.global_search.archive import ResponseArchive
+
+
+class Command(BaseCommand):
+    help = "Benchmark GlobalSearch result page parsing and ingest"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--html",
+            action="append",
+            default=[],
+            type=Path,
+            help="Path to a saved GlobalSearch class results page (repeatable)",
+        )
+        parser.add_argument(
+            "--synthetic",
+            action="append",
+            default=[],
+            type=int,
+            metavar="NUM_SECTIONS",
+            help="Benchmark a generated results page with this many sections (repeatable)",
+        )
+        parser.add_argument(
+            "--archive",
+            type=Path,
+            help="Also benchmark every class results page recorded in this response archive",
+        )
+        parser.add_argument("--seed", type=int, default=0, help="Seed for generated pages")
+        parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement")
+        parser.add_argument(
+            "--ingest",
+            action="store_true",
+            help="Also compare database ingest paths (rolled back afterwards)",
+        )
+        parser.add_argument(
+            "--parse-workers",
+            action="append",
+            default=[],
+            type=int,
+            metavar="NUM_WORKERS",
+            help="Time parsing all pages on a ParsePool of this many processes (repeatable)",
+        )
+        parser.add_argument(
+            "--crawl-memory",
+            type=int,
+            metavar="NUM_PAGES",
+            help="Measure the memory of parsing & keeping this many 300-section generated pages",
+        )
+        parser.add_argument(
+            "--notify",
+            type=int,
+            metavar="NUM_NOTIFICATIONS",
+            help="Send this many notifications to a local stand-in Join API (rolled back afterwards)",
+        )
+        parser.add_argument(
+            "--notify-workers",
+            action="append",
+            default=[],
+            type=int,
+            metavar="NUM_WORKERS",
+            help="Concurrent sends to compare with one at a time for --notify (repeatable)",
+        )
+        parser.add_argument(
+            "--output", type=Path, help="Write the results as JSON to compare between commits"
+        )
+
+    def handle(self, **options: Any) -> None:
+        html_paths: list[Path] = options["html"]
+        synthetic_sizes: list[int] = options["synthetic"]
+        seed: int = options["seed"]
+        repeat: int = options["repeat"]
+        is_ingest_benchmarked: bool = options["ingest"]
+
+        archive_path: Path | None = options["archive"]
+        parse_worker_counts: list[int] = options["parse_workers"]
+        num_crawl_memory_pages: int | None = options["crawl_memory"]
+        num_notifications: int | None = options["notify"]
+
+        if (
+            not html_paths
+            and not synthetic_sizes
+            and archive_path is None
+            and num_crawl_memory_pages is None
+            and num_notifications is None
+        ):
+            self.stderr.write(
+                "Nothing to benchmark; pass --html, --synthetic, --archive, --crawl-memory "
+                "and/or --notify"
+            )
+            return
+
+        pages = [(str(html_path), html_path.read_text()) for html_path in html_paths]
+        if archive_path is not None:
+            pages.extend(
+                (f"{archive_path} #{i}", page_src)
+                for i, page_src in enumerate(
+                    content.decode(errors="replace")
+                    for content in ResponseArchive(archive_path).iter_contents()
+                )
+                if 'class="classinfo"' in page_src
+            )
+        pages.extend(
+            (
+                f"synthetic {num_sections} sections (seed {seed})",
+                generate_results_page(num_sections, seed=seed),
+            )
+            for num_sections in synthetic_sizes
+        )
+
+        benchmarks: list[PageBenchmark] = []
+        for name, page_src in pages:
+            benchmark = benchmark_page(
+                name, page_src, repeat=repeat, is_ingest_benchmarked=is_ingest_benchmarked
+            )
+            benchmarks.append(benchmark)
+            self.stdout.write(str(benchmark))
+
+        parse_pool_results: list[ParsePoolResult] = []
+        if parse_worker_counts:
+            parse_pool_results = benchmark_parse_pool(
+                [page_src for _, page_src in pages], parse_worker_counts
+            )
+            self.stdout.write(f"== Parsing all {len(pages)} pages")
+            for parse_pool_result in parse_pool_results:
+                self.stdout.write(f"  {parse_pool_result}")
+
+        crawl_memory_result: CrawlMemoryResult | None = None
+        if num_crawl_memory_pages is not None:
+            crawl_memory_result = benchmark_crawl_memory(num_crawl_memory_pages)
+            self.stdout.write(f"== Crawl memory: {crawl_memory_result}")
+
+        fan_out_results: list[FanOutResult] = []
+        if num_notifications is not None:
+            fan_out_results = benchmark_notification_fanout(
+                num_notifications, options["notify_workers"] or [4, 16]
+            )
+            self.stdout.write(f"== Notifying {num_notifications} recipients")
+            for fan_out_result in fan_out_results:
+                self.stdout.write(f"  {fan_out_result}")
+
+        if options["output"] is not None:
+            output_path = Path(options["output"])
+            output_path.write_text(
+                json.dumps(
+                    {
+                        "datetime_created": timezone.now().isoformat(),
+                        "python_version": platform.python_version(),
+                        "repeat": repeat,
+                        "benchmarks": [asdict(benchmark) for benchmark in benchmarks],
+                        "parse_pool": [asdict(result) for result in parse_pool_results],
+                        "crawl_memory": crawl_memory_result and asdict(crawl_memory_result),
+                        "notify": [asdict(result) for result in fan_out_results],
+                    },
+                    indent=2,
+                )
+            )
+            self.stdout.write(f"Saved results to {output_path}")
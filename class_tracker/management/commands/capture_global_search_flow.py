@@ -0,0 +1,84 @@
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+
+from class_tracker.global_search import GLOBALSEARCH_ORIGIN_URL, init_globalsearch_session
+from class_tracker.global_search.archive import (
+    ResponseArchive,
+    is_response_archive_mounted,
+    mount_response_archive,
+)
+from class_tracker.global_search.navigator import (
+    get_classlist_result_page,
+    get_main_page,
+    get_subject_selection_page,
+)
+from class_tracker.models import CourseCareer, School, Subject, Term
+
+_DEFAULT_OUTPUT_DIR = Path(__file__).resolve().parents[2] / "tests" / "html"
+
+
+class Command(BaseCommand):
+    help = (
+        "Walk GlobalSearch from the main page to a class list, archiving every response and "
+        "saving the pages in the layout the HTML parser tests read (tests/html/<flow>/)"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--flow", required=True, help="Flow directory name, eg. flow2-2025-sep-1"
+        )
+        parser.add_argument("--school", required=True, help="School globalsearch_key, eg. QNS01")
+        parser.add_argument("--term", required=True, help="Term globalsearch_key, eg. 1252")
+        parser.add_argument("--career", required=True, help="Career globalsearch_key, eg. UGRD")
+        parser.add_argument("--subject", required=True, help="Subject globalsearch_key, eg. CMSC")
+        parser.add_argument(
+            "--label", default="", help="Page name infix, eg. qc-spring2025 (default: school-term)"
+        )
+        parser.add_argument("--output-dir", type=Path, default=_DEFAULT_OUTPUT_DIR)
+        parser.add_argument(
+            "--replay",
+            action="store_true",
+            help="Serve the flow from the archive instead of recording it over the network",
+        )
+
+    def handle(self, **options: Any) -> None:
+        school = School.objects.get(globalsearch_key=options["school"])
+        term = Term.objects.get(globalsearch_key=options["term"])
+        career = CourseCareer.objects.get(globalsearch_key=options["career"])
+        subject = Subject.objects.get(globalsearch_key=options["subject"])
+        label: str = (
+            options["label"] or f"{school.globalsearch_key}-{term.globalsearch_key}".lower()
+        )
+
+        session = init_globalsearch_session()
+        if is_response_archive_mounted(session, url_prefix=GLOBALSEARCH_ORIGIN_URL):
+            # GLOBALSEARCH_ARCHIVE_MODE already routes the session through the archive
+            self.stdout.write(
+                f"Archive mode {settings.GLOBALSEARCH_ARCHIVE_MODE!r} set by "
+                "GLOBALSEARCH_ARCHIVE_MODE, --replay has no effect"
+            )
+        else:
+            mount_response_archive(
+                session,
+                ResponseArchive(settings.GLOBALSEARCH_ARCHIVE_DIR),
+                "replay" if options["replay"] else "record",
+                url_prefix=GLOBALSEARCH_ORIGIN_URL,
+            )
+
+        pages = {
+            "page1": get_main_page(session),
+            f"page2-{label}": get_subject_selection_page(session, school, term),
+            f"page3-{label}-{subject.globalsearch_key.lower()}": get_classlist_result_page(
+                session, career, subject
+            ),
+        }
+
+        flow_dir: Path = options["output_dir"] / options["flow"]
+        flow_dir.mkdir(parents=True, exist_ok=True)
+        for page_name, page_src in pages.items():
+            page_path = flow_dir / f"{page_name}.html"
+            page_path.write_text(page_src)
+            self.stdout.write(f"Saved {page_path}")
@@ -0,0 +1,73 @@
+# Generated by Django 5.0.2 on 2026-10-17 12:00
+
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.state import StateApps
+
+# Monday is the lowest bit, matching `class_tracker.models.WEEKDAY_BITS`
+DAY_NAMES = ("Mo", "Tu", "We", "Th", "Fr", "Sa", "Su")
+DAY_BITS = {name: 1 << i for i, name in enumerate(DAY_NAMES)}
+
+
+def days_to_days_mask(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    InstructionEntry = apps.get_model("class_tracker", "InstructionEntry")
+    InstructionEntryDay = InstructionEntry.days.through
+
+    entry_id_to_days_mask: dict[int, int] = {}
+    for entry_id, day_name in InstructionEntryDay.objects.values_list(
+        "instructionentry_id", "day__name"
+    ).iterator():
+        entry_id_to_days_mask[entry_id] = entry_id_to_days_mask.get(entry_id, 0) | DAY_BITS[day_name]
+
+    InstructionEntry.objects.bulk_update(
+        [
+            InstructionEntry(id=entry_id, days_mask=days_mask)
+            for entry_id, days_mask in entry_id_to_days_mask.items()
+        ],
+        ["days_mask"],
+        batch_size=1000,
+    )
+
+
+def days_mask_to_days(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    Day = apps.get_model("class_tracker", "Day")
+    InstructionEntry = apps.get_model("class_tracker", "InstructionEntry")
+    InstructionEntryDay = InstructionEntry.days.through
+
+    Day.objects.bulk_create([Day(name=name) for name in DAY_NAMES], ignore_conflicts=True)
+    day_name_to_id = dict(Day.objects.values_list("name", "id"))
+
+    InstructionEntryDay.objects.bulk_create(
+        [
+            InstructionEntryDay(instructionentry_id=entry_id, day_id=day_name_to_id[day_name])
+            for entry_id, days_mask in InstructionEntry.objects.exclude(days_mask=0)
+            .values_list("id", "days_mask")
+            .iterator()
+            for day_name, day_bit in DAY_BITS.items()
+            if days_mask & day_bit
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('class_tracker', '0054_globalsettings'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='instructionentry',
+            name='days_mask',
+            field=models.PositiveSmallIntegerField(db_index=True, default=0),
+        ),
+        migrations.RunPython(days_to_days_mask, days_mask_to_days),
+        migrations.RemoveField(
+            model_name='instructionentry',
+            name='days',
+        ),
+        migrations.DeleteModel(
+            name='Day',
+        ),
+    ]
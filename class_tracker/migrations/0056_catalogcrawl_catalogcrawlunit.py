@@ -0,0 +1,48 @@
+# Generated by Django 5.0.2 on 2026-10-17 13:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('class_tracker', '0055_instructionentry_days_mask'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CatalogCrawl',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('datetime_created', models.DateTimeField(auto_now_add=True)),
+                ('datetime_modified', models.DateTimeField(auto_now=True)),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('completed', 'Completed'), ('failed', 'Failed')], default='queued', max_length=20)),
+                ('datetime_finished', models.DateTimeField(blank=True, null=True)),
+                ('school', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='catalog_crawls', to='class_tracker.school')),
+                ('subject', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='catalog_crawls', to='class_tracker.subject')),
+                ('term', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='catalog_crawls', to='class_tracker.term')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='CatalogCrawlUnit',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('datetime_created', models.DateTimeField(auto_now_add=True)),
+                ('datetime_modified', models.DateTimeField(auto_now=True)),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('completed', 'Completed'), ('failed', 'Failed')], default='queued', max_length=20)),
+                ('num_courses', models.PositiveIntegerField(default=0)),
+                ('error', models.TextField(blank=True)),
+                ('career', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='class_tracker.coursecareer')),
+                ('crawl', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='units', to='class_tracker.catalogcrawl')),
+                ('school', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='class_tracker.school')),
+                ('subject', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='class_tracker.subject')),
+            ],
+            options={
+                'unique_together': {('crawl', 'school', 'career', 'subject')},
+            },
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.0.2 on 2026-10-17 14:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('class_tracker', '0056_catalogcrawl_catalogcrawlunit'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='catalogcrawlunit',
+            name='content_hash',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='catalogcrawlunit',
+            name='datetime_finished',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='catalogcrawlunit',
+            name='datetime_started',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='catalogcrawlunit',
+            name='fetch_duration',
+            field=models.DurationField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='catalogcrawlunit',
+            name='ingest_duration',
+            field=models.DurationField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.0.2 on 2026-10-17 15:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('class_tracker', '0057_catalogcrawlunit_checkpoint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='catalogcrawlunit',
+            name='is_unchanged',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='coursesection',
+            name='gs_fingerprint',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+        migrations.CreateModel(
+            name='ClassListFingerprint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('datetime_created', models.DateTimeField(auto_now_add=True)),
+                ('datetime_modified', models.DateTimeField(auto_now=True)),
+                ('fingerprint', models.CharField(max_length=64)),
+                ('num_courses', models.PositiveIntegerField(default=0)),
+                ('career', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='class_tracker.coursecareer')),
+                ('school', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='class_tracker.school')),
+                ('subject', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='class_tracker.subject')),
+                ('term', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='class_tracker.term')),
+            ],
+            options={
+                'unique_together': {('school', 'term', 'career', 'subject')},
+            },
+        ),
+    ]
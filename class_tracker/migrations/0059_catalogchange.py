@@ -0,0 +1,34 @@
+# Generated by Django 5.0.2 on 2026-10-17 03:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('class_tracker', '0058_classlistfingerprint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='coursesection',
+            name='datetime_removed',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name='CatalogChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('datetime_created', models.DateTimeField(auto_now_add=True)),
+                ('datetime_modified', models.DateTimeField(auto_now=True)),
+                ('kind', models.CharField(choices=[('added', 'Section added'), ('removed', 'Section removed'), ('modified', 'Section modified'), ('instructors', 'Instructors changed'), ('rooms', 'Rooms changed')], max_length=20)),
+                ('changes', models.JSONField(blank=True, default=dict)),
+                ('course_section', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='catalog_changes', to='class_tracker.coursesection')),
+                ('term', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='catalog_changes', to='class_tracker.term')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['term', 'datetime_created'], name='class_track_term_id_861ea2_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,74 @@
+# Generated by Django 5.0.2 on 2026-10-17 13:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.state import StateApps
+
+
+def index_watched_sections(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    Recipient = apps.get_model("class_tracker", "Recipient")
+    WatchIndexEntry = apps.get_model("class_tracker", "WatchIndexEntry")
+    RecipientWatchedSection = Recipient.watched_sections.through
+
+    WatchIndexEntry.objects.bulk_create(
+        [
+            WatchIndexEntry(
+                recipient_id=recipient_id,
+                course_section_id=course_section_id,
+                school_id=school_id,
+                term_id=term_id,
+                subject_id=subject_id,
+                career_id=career_id,
+                section_number=section_number,
+            )
+            for (
+                recipient_id,
+                course_section_id,
+                school_id,
+                term_id,
+                subject_id,
+                career_id,
+                section_number,
+            ) in RecipientWatchedSection.objects.values_list(
+                "recipient_id",
+                "coursesection_id",
+                "coursesection__course__school_id",
+                "coursesection__term_id",
+                "coursesection__course__subject_id",
+                "coursesection__course__career_id",
+                "coursesection__number",
+            ).iterator()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('class_tracker', '0059_catalogchange'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WatchIndexEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('datetime_created', models.DateTimeField(auto_now_add=True)),
+                ('datetime_modified', models.DateTimeField(auto_now=True)),
+                ('section_number', models.IntegerField()),
+                ('career', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='class_tracker.coursecareer')),
+                ('course_section', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='watch_index_entries', to='class_tracker.coursesection')),
+                ('recipient', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='watch_index_entries', to='class_tracker.recipient')),
+                ('school', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='class_tracker.school')),
+                ('subject', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='class_tracker.subject')),
+                ('term', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='class_tracker.term')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['school', 'term', 'subject', 'career', 'section_number'], name='class_track_school__cd6bc3_idx')],
+                'unique_together': {('recipient', 'course_section')},
+            },
+        ),
+        migrations.RunPython(index_watched_sections, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.0.2 on 2026-10-17 04:00
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('class_tracker', '0060_watchindexentry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxNotification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('datetime_created', models.DateTimeField(auto_now_add=True)),
+                ('datetime_modified', models.DateTimeField(auto_now=True)),
+                ('message', models.TextField()),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('sending', 'Sending'), ('sent', 'Sent'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('num_attempts', models.PositiveSmallIntegerField(default=0)),
+                ('datetime_next_attempt', models.DateTimeField(default=django.utils.timezone.now)),
+                ('datetime_sent', models.DateTimeField(blank=True, null=True)),
+                ('error', models.TextField(blank=True)),
+                ('recipient', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='outbox_notifications', to='class_tracker.recipient')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'datetime_next_attempt'], name='class_track_status_48b8cd_idx')],
+            },
+        ),
+    ]
@@ -1,10 +1,13 @@
 import datetime
+import functools
 import re
-import sys
+from collections.abc import Iterable
 from typing import Any, NamedTuple, Self
 
-import pytz
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F
+from django.db.models.query import QuerySet
+from django.utils import timezone
 
 from .global_search.typedefs import GSCourse, GSCourseSection
 
@@ -15,7 +18,12 @@ TBuildingName = str
 TRoom = str
 TFloorNumber = str
 
-NYC_TZ = pytz.timezone("America/New_York")
+# max distinct raw strings remembered by each of the `InstructionEntry.parse_*` caches
+PARSE_CACHE_SIZE = 4096
+
+_TIME_RE = re.compile(r"(1[0-2]|0?[1-9]):([0-5]?[0-9])([AP]M)", flags=re.IGNORECASE)
+_DATE_RE = re.compile(r"([0-9]{1,2})/([0-9]{1,2})/([0-9]{4})")
+_FLOOR_NUMBER_RE = re.compile(r"\b[a-z]*([0-9]{1,2})[0-9]{2,}$", flags=re.IGNORECASE)
 
 
 class InstructorInfo(NamedTuple):
@@ -175,10 +183,30 @@ class CourseSection(CommonModel):
     status = models.CharField(
         max_length=20, choices=StatusChoices.choices, default=StatusChoices.OPEN
     )
+    # `GSCourseSection.get_fingerprint()` as of the last ingest, unchanged sections are not rewritten
+    gs_fingerprint = models.CharField(max_length=64, blank=True)
+    # set once a re-crawl no longer lists the section; it is kept since recipients may watch it
+    datetime_removed = models.DateTimeField(null=True, blank=True)
 
     course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name="sections")
     term = models.ForeignKey(Term, on_delete=models.CASCADE, related_name="sections")
 
+    # fields overwritten when a re-crawl upserts an already stored section (conflict on gs_unique_id)
+    GS_UPSERT_FIELDS = (
+        "number",
+        "section",
+        "topic",
+        "url",
+        "instruction_mode",
+        "gs_fingerprint",
+        "datetime_removed",
+        "course",
+        "term",
+        "datetime_modified",
+    )
+    # catalog fields compared by a re-crawl to log what changed about a section
+    GS_DIFF_FIELDS = ("number", "section", "topic", "url", "instruction_mode", "course_id")
+
     class Meta:
         verbose_name_plural = "Course Sections"
         ordering = ("course", "section")
@@ -221,6 +249,7 @@ class CourseSection(CommonModel):
             instruction_mode=gs_course_section.instruction_mode,
             url=gs_course_section.url,
             topic=gs_course_section.topic,
+            gs_fingerprint=gs_course_section.get_fingerprint(course.get_name()),
         )
         instance.course = course
         instance.term = term
@@ -244,27 +273,35 @@ class Instructor(CommonModel):
         return f"<Instructor(id={self.id}, full_name='{self.name}')>"
 
 
-class Day(models.Model):
-    class DayChoices(models.TextChoices):
-        MONDAY = ("Mo", "Monday")
-        TUESDAY = ("Tu", "Tuesday")
-        WEDNESDAY = ("We", "Wednesday")
-        THURSDAY = ("Th", "Thursday")
-        FRIDAY = ("Fr", "Friday")
-        SATURDAY = ("Sa", "Saturday")
-        SUNDAY = ("Su", "Sunday")
+class Weekday(models.TextChoices):
+    MONDAY = ("Mo", "Monday")
+    TUESDAY = ("Tu", "Tuesday")
+    WEDNESDAY = ("We", "Wednesday")
+    THURSDAY = ("Th", "Thursday")
+    FRIDAY = ("Fr", "Friday")
+    SATURDAY = ("Sa", "Saturday")
+    SUNDAY = ("Su", "Sunday")
 
-    name = models.CharField(max_length=10, choices=DayChoices.choices, unique=True)
 
-    def __str__(self) -> str:
-        return self.get_name_display()
+# bit of each weekday within `InstructionEntry.days_mask`, Monday being the lowest bit
+WEEKDAY_BITS: dict[str, int] = {value: 1 << i for i, value in enumerate(Weekday.values)}
 
-    def __repr__(self) -> str:
-        return f"<Day(id={self.id}, name='{self.get_name_display()}')>"
+
+class InstructionEntryQuerySet(QuerySet["InstructionEntry"]):
+    def meets_on(self, *days: str) -> "InstructionEntryQuerySet":
+        """Entries meeting on (at least) every given day, eg. `meets_on("Tu", "Th")`."""
+        days_mask = InstructionEntry.encode_days(days)
+        return self.alias(meets_on_mask=F("days_mask").bitand(days_mask)).filter(
+            meets_on_mask=days_mask
+        )
+
+    def meets_only_on(self, *days: str) -> "InstructionEntryQuerySet":
+        """Entries meeting on exactly the given days."""
+        return self.filter(days_mask=InstructionEntry.encode_days(days))
 
 
 class InstructionEntry(CommonModel):
-    days = models.ManyToManyField(Day, related_name="instruction_entries")
+    days_mask = models.PositiveSmallIntegerField(default=0, db_index=True)  # see `WEEKDAY_BITS`
     start_time = models.TimeField(null=True)  # eg. 10:45AM; `null=True` due to TBA designation
     end_time = models.TimeField(null=True)  # eg. 12:00PM; `null=True` due to TBA designation
 
@@ -283,6 +320,8 @@ class InstructionEntry(CommonModel):
     )
     term = models.ForeignKey(Term, on_delete=models.CASCADE, related_name="instruction_entries")
 
+    objects = InstructionEntryQuerySet.as_manager()
+
     class Meta:
         unique_together = (
             "term",
@@ -300,13 +339,12 @@ class InstructionEntry(CommonModel):
         return f"Times: {self.get_days_and_times()}; location: {self.location}"
 
     def __repr__(self) -> str:
-        days_display = ", ".join(day.get_name_display() for day in self.days.all())
+        days_display = ", ".join(str(day.label) for day in self.days)
         return f"<InstructionEntry(id={self.id}, days='{days_display}', start_time={self._get_time_str(self.start_time)}, end_time={self._get_time_str(self.end_time)}, building='{self.building}', room_number='{self.room}')>"
 
     def get_days_and_times(self) -> str:
         """Get string like 'Tu, Thu 10:45AM - 12:00PM'"""
-        days: models.QuerySet[Day] = self.days.all()
-        days_display = ", ".join(day.name for day in days)
+        days_display = ", ".join(self.days)
 
         start_time = self._get_time_str(self.start_time)
         end_time = self._get_time_str(self.end_time)
@@ -329,20 +367,63 @@ class InstructionEntry(CommonModel):
     def location(self) -> str:
         return self.building + self.room
 
+    @property
+    def days(self) -> list[Weekday]:
+        """Meeting days decoded from `days_mask`, Monday first."""
+        return InstructionEntry.decode_days(self.days_mask)
+
+    @days.setter
+    def days(self, days: Iterable[str]) -> None:
+        self.days_mask = InstructionEntry.encode_days(days)
+
     @staticmethod
-    def parse_days(days_str: str) -> list[Day]:
-        """Convert a string like 'TuTh' into a list of Day objects."""
-        day_mapping = {d.value: d for d in Day.DayChoices}  # type: ignore[misc]
-        return [
-            Day.objects.get_or_create(name=day_mapping[abbr])[0]
-            for abbr in [days_str[i : i + 2] for i in range(0, len(days_str), 2)]
-        ]
+    def encode_days(days: Iterable[str]) -> int:
+        """Pack day abbreviations like ['Tu', 'Th'] into a bitmask."""
+        days_mask = 0
+        for day in days:
+            days_mask |= WEEKDAY_BITS[day]
+        return days_mask
 
     @staticmethod
+    def decode_days(days_mask: int) -> list[Weekday]:
+        """Unpack a bitmask into the days it contains, Monday first."""
+        return [weekday for weekday in Weekday if days_mask & WEEKDAY_BITS[weekday]]
+
+    @staticmethod
+    def parse_days(days_str: str) -> tuple[Weekday, ...]:
+        """Convert a string like 'TuTh' into a tuple of Weekday values."""
+        return tuple(Weekday(days_str[i : i + 2]) for i in range(0, len(days_str), 2))
+
+    @staticmethod
+    def _parse_time(time_str: str) -> datetime.time:
+        """Convert '5:00PM' into a naive time, accepting the same input as `strptime(_, '%I:%M%p')`."""
+        match = _TIME_RE.fullmatch(time_str)
+        if match is None:
+            raise ValueError(f"Unexpected time: {time_str=}")
+
+        hour = int(match.group(1)) % 12
+        if match.group(3).upper() == "PM":
+            hour += 12
+        return datetime.time(hour, int(match.group(2)))
+
+    @staticmethod
+    def _parse_date(date_str: str) -> datetime.date:
+        """Convert '01/25/2025' into a date."""
+        match = _DATE_RE.fullmatch(date_str)
+        if match is None:
+            raise ValueError(f"Unexpected date: {date_str=}")
+
+        return datetime.date(int(match.group(3)), int(match.group(1)), int(match.group(2)))
+
+    # the parsers below are cached on the raw string since a semester only has a few hundred
+    # distinct values; results are tuples so cached values can be shared between callers
+
+    @staticmethod
+    @functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
     def parse_meeting_dates(
         meeting_dates: str,
     ) -> tuple[datetime.date | None, datetime.date | None]:
-        """Convert '01/25/2025 - 05/22/2025' into (start_date, end_date) and adjust to NYC timezone."""
+        """Convert '01/25/2025 - 05/22/2025' into (start_date, end_date); dates are NYC calendar dates."""
         parts = meeting_dates.split(" - ")
         num_expected_values = 2
 
@@ -353,16 +434,10 @@ class InstructionEntry(CommonModel):
             return (None, None)
 
         start_str, end_str = parts
-
-        start_naive = datetime.datetime.strptime(start_str, "%m/%d/%Y")  # noqa: DTZ007
-        end_naive = datetime.datetime.strptime(end_str, "%m/%d/%Y")  # noqa: DTZ007
-
-        start_nyc = NYC_TZ.localize(start_naive)
-        end_nyc = NYC_TZ.localize(end_naive)
-
-        return start_nyc.date(), end_nyc.date()
+        return InstructionEntry._parse_date(start_str), InstructionEntry._parse_date(end_str)
 
     @staticmethod
+    @functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
     def parse_location(location: str) -> tuple[TBuildingName, TRoom, TFloorNumber]:
         """Decompose strings like 'Kiely Hall 258' into ('Kiely Hall', '258', '2')."""
         if not location:
@@ -374,8 +449,7 @@ class InstructionEntry(CommonModel):
         if len(parts) == 1:
             return "", location, ""
 
-        floor_number_re = re.compile(r"\b[a-z]*([0-9]{1,2})[0-9]{2,}$", flags=re.IGNORECASE)
-        match = floor_number_re.match(location)
+        match = _FLOOR_NUMBER_RE.match(location)
 
         # if no trailing numbers found, like with 'Online Synchronous'
         if not match:
@@ -384,71 +458,101 @@ class InstructionEntry(CommonModel):
         return parts[0], parts[1], match.group(1)
 
     @staticmethod
+    @functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
     def parse_days_and_times(
         days_and_times: str,
-    ) -> tuple[list[Day], datetime.time | None, datetime.time | None]:
-        """Convert 'TuTh 5:00PM - 5:30PM' into a tuple of (list[Day], start_time, end_time) using NYC as the timezone"""
-        print(f"Parsing days and times: {days_and_times=}", file=sys.stderr)
-
+    ) -> tuple[tuple[Weekday, ...], datetime.time | None, datetime.time | None]:
+        """Convert 'TuTh 5:00PM - 5:30PM' into (days, start_time, end_time); times are naive NYC wall-clock times"""
         parts = days_and_times.split()
         if len(parts) == 1:
-            return ([], None, None)
+            return ((), None, None)
 
         days_part = parts[0]  # eg. yields 'TuTh'
         time_part = parts[1:]  # eg yields ['5:00PM', '-', '5:30PM']
 
         if len(time_part) != 3 or time_part[1] != "-":  # noqa: PLR2004
-            return ([], None, None)
-
-        start_time_naive = datetime.datetime.strptime(time_part[0], "%I:%M%p")  # noqa: DTZ007
-        end_time_naive = datetime.datetime.strptime(time_part[2], "%I:%M%p")  # noqa: DTZ007
+            return ((), None, None)
 
-        start_time_nyc = NYC_TZ.localize(start_time_naive)
-        end_time_nyc = NYC_TZ.localize(end_time_naive)
-
-        start_time = start_time_nyc.time()
-        end_time = end_time_nyc.time()
+        start_time = InstructionEntry._parse_time(time_part[0])
+        end_time = InstructionEntry._parse_time(time_part[2])
 
         days = InstructionEntry.parse_days(days_part)
 
         return days, start_time, end_time
 
     @staticmethod
-    def create_entries_from_gs_course_section(
-        gs_course_section: GSCourseSection,
-        course_section: CourseSection,
+    def clear_parse_caches() -> None:
+        InstructionEntry.parse_meeting_dates.cache_clear()
+        InstructionEntry.parse_location.cache_clear()
+        InstructionEntry.parse_days_and_times.cache_clear()
+
+    def get_unique_key(self) -> tuple[Any, ...]:
+        """The columns of the unique constraint, less `term` which follows from the section."""
+        return (
+            self.course_section_id,
+            self.start_time,
+            self.end_time,
+            self.start_date,
+            self.end_date,
+            self.building,
+            self.room,
+            self.instructor_id,
+        )
+
+    @staticmethod
+    def build_from_gs_course_sections(
+        gs_and_db_course_sections: list[tuple[GSCourseSection, CourseSection]],
         term: Term,
         name_to_instructors_map: dict[str, Instructor],
-    ) -> list["InstructionEntry"]:
-        instruction_entries: list[InstructionEntry] = []
-        for gs_instruction_entry in gs_course_section.instruction_entries:
-            days, start_time, end_time = InstructionEntry.parse_days_and_times(
-                gs_instruction_entry.days_and_times
-            )
-            start_date, end_date = InstructionEntry.parse_meeting_dates(
-                gs_instruction_entry.meeting_dates
-            )
-            building, room, floor_number = InstructionEntry.parse_location(
-                gs_instruction_entry.room
-            )
-
-            instruction_entry, _ = InstructionEntry.objects.get_or_create(
-                start_time=start_time,
-                end_time=end_time,
-                start_date=start_date,
-                end_date=end_date,
-                building=building,
-                room=room,
-                floor_number=floor_number,
-                instructor=name_to_instructors_map[gs_instruction_entry.instructor],
-                course_section=course_section,
-                term=term,
-            )
-
-            instruction_entry.days.set(days)
-            instruction_entries.append(instruction_entry)
-
-        return instruction_entries
+    ) -> dict[tuple[Any, ...], "InstructionEntry"]:
+        """
+        Unsaved instruction entries of every given section, by `get_unique_key()`.
+
+        Entries that collide on the unique constraint within a section are merged, keeping the
+        union of their meeting days.
+        """
+        key_to_instruction_entry: dict[tuple[Any, ...], InstructionEntry] = {}
+
+        for gs_course_section, course_section in gs_and_db_course_sections:
+            for gs_instruction_entry in gs_course_section.instruction_entries:
+                days, start_time, end_time = InstructionEntry.parse_days_and_times(
+                    gs_instruction_entry.days_and_times
+                )
+                start_date, end_date = InstructionEntry.parse_meeting_dates(
+                    gs_instruction_entry.meeting_dates
+                )
+                building, room, floor_number = InstructionEntry.parse_location(
+                    gs_instruction_entry.room
+                )
+                instructor = name_to_instructors_map[gs_instruction_entry.instructor]
+
+                key = (
+                    course_section.id,
+                    start_time,
+                    end_time,
+                    start_date,
+                    end_date,
+                    building,
+                    room,
+                    instructor.id,
+                )
+                if key not in key_to_instruction_entry:
+                    key_to_instruction_entry[key] = InstructionEntry(
+                        start_time=start_time,
+                        end_time=end_time,
+                        start_date=start_date,
+                        end_date=end_date,
+                        building=building,
+                        room=room,
+                        floor_number=floor_number,
+                        instructor=instructor,
+                        course_section=course_section,
+                        term=term,
+                    )
+
+                key_to_instruction_entry[key].days_mask |= InstructionEntry.encode_days(days)
+
+        return key_to_instruction_entry
 
 
 class Recipient(CommonModel):
@@ -464,6 +568,97 @@ class Recipient(CommonModel):
         return f"<Recipient(id={self.id}, name={self.name!r})>"
 
 
+class WatchIndexEntry(CommonModel):
+    """
+    Inverted index of `Recipient.watched_sections`: the recipients watching a section number, keyed
+    by the (school, term, subject, career) class list a poll finds it on. Kept in sync with the
+    m2m by `signals.sync_watch_index`, so polling never walks recipients & their watched sections.
+    """
+
+    recipient = models.ForeignKey(
+        Recipient, on_delete=models.CASCADE, related_name="watch_index_entries"
+    )
+    course_section = models.ForeignKey(
+        CourseSection, on_delete=models.CASCADE, related_name="watch_index_entries"
+    )
+    # copied from the section & its course
+    school = models.ForeignKey(School, on_delete=models.CASCADE, related_name="+")
+    term = models.ForeignKey(Term, on_delete=models.CASCADE, related_name="+")
+    subject = models.ForeignKey(Subject, on_delete=models.CASCADE, related_name="+")
+    career = models.ForeignKey(CourseCareer, on_delete=models.CASCADE, related_name="+")
+    section_number = models.IntegerField()
+
+    class Meta:
+        unique_together = ("recipient", "course_section")
+        indexes = [models.Index(fields=["school", "term", "subject", "career", "section_number"])]
+
+    def __str__(self) -> str:
+        return f"{self.recipient_id} watches {self.section_number}"
+
+    def __repr__(self) -> str:
+        return f"<WatchIndexEntry(id={self.id}, recipient_id={self.recipient_id}, course_section_id={self.course_section_id}, section_number={self.section_number})>"
+
+    @staticmethod
+    def add_watches(recipient_and_section_ids: Iterable[tuple[int, int]]) -> None:
+        recipient_and_section_ids = list(recipient_and_section_ids)
+        if not recipient_and_section_ids:
+            return
+
+        id_to_course_section = (
+            CourseSection.objects.select_related("course")
+            .only(
+                "number",
+                "term_id",
+                "course__school_id",
+                "course__subject_id",
+                "course__career_id",
+            )
+            .in_bulk({course_section_id for _, course_section_id in recipient_and_section_ids})
+        )
+        WatchIndexEntry.objects.bulk_create(
+            [
+                WatchIndexEntry(
+                    recipient_id=recipient_id,
+                    course_section_id=course_section_id,
+                    school_id=course_section.course.school_id,
+                    term_id=course_section.term_id,
+                    subject_id=course_section.course.subject_id,
+                    career_id=course_section.course.career_id,
+                    section_number=course_section.number,
+                )
+                for recipient_id, course_section_id in recipient_and_section_ids
+                if (course_section := id_to_course_section.get(course_section_id)) is not None
+            ],
+            ignore_conflicts=True,
+        )
+
+    @classmethod
+    def refresh_for_course_sections(cls, course_section_ids: Iterable[int]) -> None:
+        """Re-index the watches of sections whose number or course changed."""
+        course_section_ids = list(course_section_ids)
+        if not course_section_ids:
+            return
+
+        cls.objects.filter(course_section_id__in=course_section_ids).delete()
+        cls.add_watches(
+            Recipient.watched_sections.through.objects.filter(
+                coursesection_id__in=course_section_ids
+            ).values_list("recipient_id", "coursesection_id")
+        )
+
+    @classmethod
+    def rebuild(cls) -> int:
+        """Re-index every watch, returning the number of entries."""
+        with transaction.atomic():
+            cls.objects.all().delete()
+            cls.add_watches(
+                Recipient.watched_sections.through.objects.values_list(
+                    "recipient_id", "coursesection_id"
+                )
+            )
+            return cls.objects.count()
+
+
 class ContactInfo(CommonModel):
     number = models.CharField(max_length=20, unique=True, db_index=True)
     owner = models.ForeignKey(Recipient, on_delete=models.CASCADE, related_name="phone_numbers")
@@ -493,8 +688,255 @@ class ClassAlert(CommonModel):
         return f"<ClassAlert(id={self.id}, recipient_id={self.recipient_id}, course_section_id={self.course_section_id})>"
 
 
+class OutboxNotification(CommonModel):
+    """
+    A message waiting to be sent to a recipient, written in the same transaction as the recipient's
+    `ClassAlert` rows and delivered by the `dispatch_notifications` job of the notifications queue.
+    """
+
+    class StatusChoices(models.TextChoices):
+        PENDING = ("pending", "Pending")
+        SENDING = ("sending", "Sending")
+        SENT = ("sent", "Sent")
+        FAILED = ("failed", "Failed")  # undeliverable, or out of attempts
+
+    recipient = models.ForeignKey(
+        Recipient, on_delete=models.CASCADE, related_name="outbox_notifications"
+    )
+    message = models.TextField()
+    status = models.CharField(
+        max_length=20, choices=StatusChoices.choices, default=StatusChoices.PENDING
+    )
+    num_attempts = models.PositiveSmallIntegerField(default=0)
+    datetime_next_attempt = models.DateTimeField(default=timezone.now)
+    datetime_sent = models.DateTimeField(null=True, blank=True)
+    error = models.TextField(blank=True)  # of the last failed attempt
+
+    class Meta:
+        indexes = [models.Index(fields=["status", "datetime_next_attempt"])]
+
+    def __str__(self) -> str:
+        return f"Notification for {self.recipient.name} ({self.get_status_display()})"
+
+    def __repr__(self) -> str:
+        return f"<OutboxNotification(id={self.id}, recipient_id={self.recipient_id}, status='{self.status}', num_attempts={self.num_attempts})>"
+
+
 class GlobalSettings(CommonModel):
     hours_renotify_grace_period = models.FloatField(default=6.0)
 
     def __str__(self) -> str:
         return "Global Settings"
+
+
+class CatalogCrawl(CommonModel):
+    """A request to (re)fetch the course sections of a term, fanned out into `CatalogCrawlUnit` jobs."""
+
+    class StatusChoices(models.TextChoices):
+        QUEUED = ("queued", "Queued")
+        RUNNING = ("running", "Running")
+        COMPLETED = ("completed", "Completed")
+        FAILED = ("failed", "Failed")  # finished, but at least one unit failed
+
+    term = models.ForeignKey(Term, on_delete=models.CASCADE, related_name="catalog_crawls")
+    # null means every school / subject available for the term
+    school = models.ForeignKey(
+        School, on_delete=models.CASCADE, related_name="catalog_crawls", null=True, blank=True
+    )
+    subject = models.ForeignKey(
+        Subject, on_delete=models.CASCADE, related_name="catalog_crawls", null=True, blank=True
+    )
+    status = models.CharField(
+        max_length=20, choices=StatusChoices.choices, default=StatusChoices.QUEUED
+    )
+    datetime_finished = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self) -> str:
+        school_name = self.school.name if self.school is not None else "All schools"
+        subject_name = self.subject.name if self.subject is not None else "all subjects"
+        return f"{self.term} - {school_name}, {subject_name}"
+
+    def __repr__(self) -> str:
+        return f"<CatalogCrawl(id={self.id}, term_id={self.term_id}, school_id={self.school_id}, subject_id={self.subject_id}, status='{self.status}')>"
+
+    @functools.cached_property
+    def unit_status_counts(self) -> dict[str, int]:
+        counts = dict.fromkeys(CatalogCrawlUnit.StatusChoices.values, 0)
+        counts.update(
+            self.units.values_list("status").annotate(count=models.Count("id")).order_by()
+        )
+        return counts
+
+    @property
+    def num_units_total(self) -> int:
+        return sum(self.unit_status_counts.values())
+
+    @property
+    def num_units_completed(self) -> int:
+        return self.unit_status_counts[CatalogCrawlUnit.StatusChoices.COMPLETED]
+
+    @property
+    def num_units_failed(self) -> int:
+        return self.unit_status_counts[CatalogCrawlUnit.StatusChoices.FAILED]
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (self.StatusChoices.COMPLETED, self.StatusChoices.FAILED)
+
+    @functools.cached_property
+    def unit_timings(self) -> dict[str, Any]:
+        return self.units.aggregate(
+            datetime_first_started=models.Min("datetime_started"),
+            datetime_last_finished=models.Max("datetime_finished"),
+            datetime_last_modified=models.Max("datetime_modified"),
+        )
+
+    def get_units_per_minute(self) -> float | None:
+        """Settled (completed or failed) units per minute since the first unit started."""
+        datetime_first_started: datetime.datetime | None = self.unit_timings[
+            "datetime_first_started"
+        ]
+        if datetime_first_started is None:
+            return None
+
+        datetime_until: datetime.datetime = (
+            self.unit_timings["datetime_last_finished"] if self.is_finished else timezone.now()
+        )
+        minutes_elapsed = (datetime_until - datetime_first_started).total_seconds() / 60
+        num_units_settled = self.num_units_completed + self.num_units_failed
+        if minutes_elapsed <= 0 or num_units_settled == 0:
+            return None
+
+        return num_units_settled / minutes_elapsed
+
+    def get_eta(self) -> datetime.timedelta | None:
+        units_per_minute = self.get_units_per_minute()
+        if self.is_finished or units_per_minute is None:
+            return None
+
+        num_units_left = self.num_units_total - self.num_units_completed - self.num_units_failed
+        return datetime.timedelta(minutes=num_units_left / units_per_minute)
+
+    def is_stale(self, stale_seconds: float) -> bool:
+        """
+        Whether the crawl is unfinished but neither it nor any of its units changed within the last
+        `stale_seconds`, ie. the worker running it died or its job timed out or was lost.
+        """
+        if self.is_finished:
+            return False
+
+        datetime_last_modified: datetime.datetime = max(
+            self.datetime_modified,
+            self.unit_timings["datetime_last_modified"] or self.datetime_modified,
+        )
+        return timezone.now() - datetime_last_modified > datetime.timedelta(seconds=stale_seconds)
+
+    def mark_finished_if_done(self) -> None:
+        """
+        Move the crawl to completed/failed once no unit is left to run. Only ever moves forward, so
+        units finishing at the same time can all call it without overwriting each other.
+        """
+        pending_statuses = (
+            CatalogCrawlUnit.StatusChoices.QUEUED,
+            CatalogCrawlUnit.StatusChoices.RUNNING,
+        )
+        if self.units.filter(status__in=pending_statuses).exists():
+            return
+
+        has_failed_units = self.units.filter(status=CatalogCrawlUnit.StatusChoices.FAILED).exists()
+        CatalogCrawl.objects.filter(id=self.id, datetime_finished__isnull=True).update(
+            status=self.StatusChoices.FAILED if has_failed_units else self.StatusChoices.COMPLETED,
+            datetime_finished=timezone.now(),
+            datetime_modified=timezone.now(),
+        )
+        self.refresh_from_db(fields=["status", "datetime_finished"])
+
+
+class CatalogCrawlUnit(CommonModel):
+    """One (school, career, subject) class list of a `CatalogCrawl`, fetched & stored by its own job."""
+
+    class StatusChoices(models.TextChoices):
+        QUEUED = ("queued", "Queued")
+        RUNNING = ("running", "Running")
+        COMPLETED = ("completed", "Completed")
+        FAILED = ("failed", "Failed")
+
+    crawl = models.ForeignKey(CatalogCrawl, on_delete=models.CASCADE, related_name="units")
+    school = models.ForeignKey(School, on_delete=models.CASCADE, related_name="+")
+    career = models.ForeignKey(CourseCareer, on_delete=models.CASCADE, related_name="+")
+    subject = models.ForeignKey(Subject, on_delete=models.CASCADE, related_name="+")
+    status = models.CharField(
+        max_length=20, choices=StatusChoices.choices, default=StatusChoices.QUEUED
+    )
+    num_courses = models.PositiveIntegerField(default=0)
+    is_unchanged = models.BooleanField(default=False)  # page fingerprint matched, nothing written
+    error = models.TextField(blank=True)
+    # checkpoint of the last run: sha256 of the fetched class list page & how long each step took
+    content_hash = models.CharField(max_length=64, blank=True)
+    datetime_started = models.DateTimeField(null=True, blank=True)
+    datetime_finished = models.DateTimeField(null=True, blank=True)
+    fetch_duration = models.DurationField(null=True, blank=True)
+    ingest_duration = models.DurationField(null=True, blank=True)
+
+    class Meta:
+        unique_together = ("crawl", "school", "career", "subject")
+
+    def __str__(self) -> str:
+        return f"{self.school.name} - {self.career.name} - {self.subject.name}"
+
+    def __repr__(self) -> str:
+        return f"<CatalogCrawlUnit(id={self.id}, crawl_id={self.crawl_id}, school_id={self.school_id}, career_id={self.career_id}, subject_id={self.subject_id}, status='{self.status}')>"
+
+
+class ClassListFingerprint(CommonModel):
+    """
+    Fingerprint of the last ingested class list page of a (school, term, career, subject), used to
+    skip parsing & writing re-crawled pages that did not change.
+    """
+
+    school = models.ForeignKey(School, on_delete=models.CASCADE, related_name="+")
+    term = models.ForeignKey(Term, on_delete=models.CASCADE, related_name="+")
+    career = models.ForeignKey(CourseCareer, on_delete=models.CASCADE, related_name="+")
+    subject = models.ForeignKey(Subject, on_delete=models.CASCADE, related_name="+")
+    fingerprint = models.CharField(max_length=64)  # `parser.get_page_fingerprint()`
+    num_courses = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ("school", "term", "career", "subject")
+
+    def __str__(self) -> str:
+        return f"{self.school.name} - {self.term.name} - {self.career.name} - {self.subject.name}"
+
+    def __repr__(self) -> str:
+        return f"<ClassListFingerprint(id={self.id}, school_id={self.school_id}, term_id={self.term_id}, career_id={self.career_id}, subject_id={self.subject_id}, fingerprint='{self.fingerprint}')>"
+
+
+class CatalogChange(CommonModel):
+    """
+    What a re-crawl changed about a course section, one row per kind of change. Written by
+    `create_db_courses` as a feed of catalog changes, newest last.
+    """
+
+    class KindChoices(models.TextChoices):
+        ADDED = ("added", "Section added")
+        REMOVED = ("removed", "Section removed")
+        MODIFIED = ("modified", "Section modified")  # catalog fields or meeting times
+        INSTRUCTORS = ("instructors", "Instructors changed")
+        ROOMS = ("rooms", "Rooms changed")
+
+    course_section = models.ForeignKey(
+        CourseSection, on_delete=models.CASCADE, related_name="catalog_changes"
+    )
+    term = models.ForeignKey(Term, on_delete=models.CASCADE, related_name="catalog_changes")
+    kind = models.CharField(max_length=20, choices=KindChoices.choices)
+    # {field: [old value, new value]}, empty for added & removed sections
+    changes = models.JSONField(default=dict, blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["term", "datetime_created"])]
+
+    def __str__(self) -> str:
+        return f"{self.get_kind_display()}: {self.course_section_id}"
+
+    def __repr__(self) -> str:
+        return f"<CatalogChange(id={self.id}, course_section_id={self.course_section_id}, kind='{self.kind}')>"
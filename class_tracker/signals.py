@@ -0,0 +1,37 @@
+from typing import Any
+
+from django.db.models.signals import m2m_changed
+from django.dispatch import receiver
+
+from .models import CourseSection, Recipient, WatchIndexEntry
+
+
+@receiver(m2m_changed, sender=Recipient.watched_sections.through)
+def sync_watch_index(
+    instance: Recipient | CourseSection,
+    action: str,
+    reverse: bool,
+    pk_set: set[int] | None,
+    **_kwargs: Any,
+) -> None:
+    """Mirror every change of `Recipient.watched_sections`, from either side, in `WatchIndexEntry`."""
+    if action == "post_clear":
+        side = "course_section" if reverse else "recipient"
+        WatchIndexEntry.objects.filter(**{f"{side}_id": instance.pk}).delete()
+        return
+    if action not in {"post_add", "post_remove"} or not pk_set:
+        return
+
+    recipient_and_section_ids = [
+        (pk, instance.pk) if reverse else (instance.pk, pk) for pk in pk_set
+    ]
+    if action == "post_add":
+        WatchIndexEntry.add_watches(recipient_and_section_ids)
+    elif reverse:
+        WatchIndexEntry.objects.filter(
+            course_section_id=instance.pk, recipient_id__in=pk_set
+        ).delete()
+    else:
+        WatchIndexEntry.objects.filter(
+            recipient_id=instance.pk, course_section_id__in=pk_set
+        ).delete()
@@ -0,0 +1,118 @@
+import datetime
+from unittest import mock
+
+import redis
+from bs4 import BeautifulSoup
+from django.test import TestCase
+from django.utils import timezone
+
+from ..benchmarks.synthetic import generate_results_page
+from ..global_search.parser import parse_gs_courses
+from ..models import ClassAlert, CourseCareer, CourseSection, Recipient, School, Subject, Term
+from ..util import create_db_courses
+from ..util.alert_ledger import AlertLedger
+from .test_rate_limiter import requires_redis
+
+
+class AlertLedgerTestCase(TestCase):
+    def setUp(self) -> None:
+        school = School.objects.create(name="Queens College", globalsearch_key="QNS01")
+        term = Term.objects.create(name="Fall Term", globalsearch_key="1249", year=2024)
+        career = CourseCareer.objects.create(name="Undergraduate", globalsearch_key="UGRD")
+        subject = Subject.objects.create(name="Computer Science", globalsearch_key="CMSC")
+        gs_courses = parse_gs_courses(BeautifulSoup(generate_results_page(3), "lxml"))
+        create_db_courses(gs_courses, subject, career, school, term)
+
+        self.first, self.second, self.third = CourseSection.objects.order_by("number")[:3]
+        self.ada = Recipient.objects.create(name="Ada")
+
+    def create_alert(self, course_section: CourseSection, *, hours_ago: float = 0) -> ClassAlert:
+        alert = ClassAlert.objects.create(recipient=self.ada, course_section=course_section)
+        if hours_ago:
+            alert.datetime_created = timezone.now() - datetime.timedelta(hours=hours_ago)
+            ClassAlert.objects.filter(id=alert.id).update(datetime_created=alert.datetime_created)
+        return alert
+
+    def get_pairs(self) -> list[tuple[int, int]]:
+        return [(self.ada.id, section.id) for section in (self.first, self.second, self.third)]
+
+
+class AlertLedgerTests(AlertLedgerTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.ledger = AlertLedger("class_tracker:test:alert_ledger")
+
+        patcher = mock.patch("class_tracker.util.alert_ledger.get_redis_connection")
+        self.redis_connection = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+
+    def test_fails_open_to_database(self) -> None:
+        self.redis_connection.hmget.side_effect = redis.ConnectionError("refused")
+        self.create_alert(self.first, hours_ago=1)
+        self.create_alert(self.second, hours_ago=7)
+
+        for _ in range(2):
+            self.assertEqual(
+                self.ledger.get_recent_pairs(self.get_pairs(), hours_grace_period=6),
+                {(self.ada.id, self.first.id)},
+            )
+
+        # Redis is left alone until the retry interval passes
+        self.assertEqual(self.redis_connection.hmget.call_count, 1)
+        self.ledger.record([self.create_alert(self.third)], hours_grace_period=6)
+        self.redis_connection.pipeline.assert_not_called()
+
+    def test_no_candidates(self) -> None:
+        self.assertEqual(self.ledger.get_recent_pairs([], hours_grace_period=6), set())
+        self.redis_connection.hmget.assert_not_called()
+
+
+@requires_redis
+class RedisAlertLedgerTests(AlertLedgerTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.ledger = AlertLedger("class_tracker:test:alert_ledger")
+        self.ledger.reset()
+        self.addCleanup(self.ledger.reset)
+
+    def test_fills_from_database_then_skips_it(self) -> None:
+        self.create_alert(self.first, hours_ago=1)
+        self.create_alert(self.second, hours_ago=7)
+
+        self.assertEqual(
+            self.ledger.get_recent_pairs(self.get_pairs(), hours_grace_period=6),
+            {(self.ada.id, self.first.id)},
+        )
+        self.ledger.record([self.create_alert(self.third)], hours_grace_period=6)
+
+        # only the latest alert id is read from the database
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                self.ledger.get_recent_pairs(self.get_pairs(), hours_grace_period=6),
+                {(self.ada.id, self.first.id), (self.ada.id, self.third.id)},
+            )
+
+    def test_catches_up_on_unrecorded_alerts(self) -> None:
+        self.ledger.get_recent_pairs(self.get_pairs(), hours_grace_period=6)
+        self.create_alert(self.second)
+
+        self.assertEqual(
+            self.ledger.get_recent_pairs(self.get_pairs(), hours_grace_period=6),
+            {(self.ada.id, self.second.id)},
+        )
+
+    def test_grace_period_change(self) -> None:
+        self.create_alert(self.first, hours_ago=1)
+        self.create_alert(self.second, hours_ago=3)
+        self.assertEqual(
+            self.ledger.get_recent_pairs(self.get_pairs(), hours_grace_period=2),
+            {(self.ada.id, self.first.id)},
+        )
+
+        self.assertEqual(
+            self.ledger.get_recent_pairs(self.get_pairs(), hours_grace_period=4),
+            {(self.ada.id, self.first.id), (self.ada.id, self.second.id)},
+        )
+        self.assertEqual(
+            self.ledger.get_recent_pairs(self.get_pairs(), hours_grace_period=0.5), set()
+        )
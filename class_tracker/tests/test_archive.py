@@ -0,0 +1,128 @@
+import tempfile
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+from requests import PreparedRequest, Request, Response
+
+from ..global_search import (
+    GLOBALSEARCH_ORIGIN_URL,
+    GLOBALSEARCH_URL,
+    init_globalsearch_session,
+    navigator,
+)
+from ..global_search.archive import (
+    ArchiveMissError,
+    ResponseArchive,
+    is_response_archive_mounted,
+    mount_response_archive,
+)
+from ..global_search.navigator import get_classlist_result_page
+from ..models import CourseCareer, Subject
+
+
+def _prepare(data: dict[str, str]) -> PreparedRequest:
+    return Request("POST", GLOBALSEARCH_URL, data=data).prepare()
+
+
+def _get_response(content: str) -> Response:
+    response = Response()
+    response.status_code = 200
+    response.reason = "OK"
+    response.encoding = "utf-8"
+    response.headers["content-type"] = "text/html;charset=UTF-8"
+    response.headers["set-cookie"] = "JSESSIONID=abc"
+    response._content = content.encode()  # noqa: SLF001
+    return response
+
+
+class ResponseArchiveTests(SimpleTestCase):
+    def setUp(self) -> None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.root = Path(tmp_dir.name)
+        self.archive = ResponseArchive(self.root)
+
+    def test_round_trip(self) -> None:
+        request = _prepare({"subject_name": "CMSC"})
+        self.archive.store(request, _get_response("<html>csci</html>"))
+
+        response = self.archive.load(_prepare({"subject_name": "CMSC"}))
+
+        if response is None:
+            self.fail("Archived response was not found")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.text, "<html>csci</html>")
+        self.assertEqual(response.headers["content-type"], "text/html;charset=UTF-8")
+        self.assertNotIn("set-cookie", response.headers)
+
+    def test_form_field_order_is_ignored(self) -> None:
+        self.assertEqual(
+            ResponseArchive.get_request_key(_prepare({"a": "1", "b": "2"})),
+            ResponseArchive.get_request_key(_prepare({"b": "2", "a": "1"})),
+        )
+        self.assertNotEqual(
+            ResponseArchive.get_request_key(_prepare({"a": "1"})),
+            ResponseArchive.get_request_key(_prepare({"a": "2"})),
+        )
+
+    def test_identical_bodies_are_stored_once(self) -> None:
+        self.archive.store(_prepare({"subject_name": "CMSC"}), _get_response("same"))
+        self.archive.store(_prepare({"subject_name": "MATH"}), _get_response("same"))
+
+        self.assertEqual(len(list((self.root / "index").iterdir())), 2)
+        self.assertEqual(len(list((self.root / "objects").rglob("*.gz"))), 1)
+
+    def test_iter_contents(self) -> None:
+        self.archive.store(_prepare({"subject_name": "CMSC"}), _get_response("same"))
+        self.archive.store(_prepare({"subject_name": "MATH"}), _get_response("same"))
+        self.archive.store(_prepare({"subject_name": "PHYS"}), _get_response("other"))
+
+        self.assertEqual(sorted(self.archive.iter_contents()), [b"other", b"same"])
+
+    def test_unknown_request(self) -> None:
+        self.assertIsNone(self.archive.load(_prepare({"subject_name": "CMSC"})))
+
+    # keep the scheduler's shared pacing & breaker state in Redis out of the test
+    @mock.patch.object(navigator, "circuit_breaker", mock.Mock())
+    @mock.patch.object(navigator, "rate_limiter", mock.Mock())
+    def test_record_then_replay_navigator(self) -> None:
+        career = CourseCareer(name="Undergraduate", globalsearch_key="UGRD")
+        subject = Subject(name="Computer Science", globalsearch_key="CMSC")
+
+        recording_session = init_globalsearch_session()
+        mount_response_archive(
+            recording_session, self.archive, "record", url_prefix=GLOBALSEARCH_ORIGIN_URL
+        )
+
+        def send(_adapter: Any, _request: PreparedRequest, **_kwargs: Any) -> Response:
+            return _get_response("<html>recorded results</html>")
+
+        with mock.patch("requests.adapters.HTTPAdapter.send", send):
+            recorded_page = get_classlist_result_page(recording_session, career, subject)
+
+        replay_session = init_globalsearch_session()
+        mount_response_archive(
+            replay_session, self.archive, "replay", url_prefix=GLOBALSEARCH_ORIGIN_URL
+        )
+
+        self.assertEqual(get_classlist_result_page(replay_session, career, subject), recorded_page)
+
+        # a different payload was never recorded
+        with self.assertRaises(ArchiveMissError):
+            get_classlist_result_page(replay_session, career, subject, open_classes_only=True)
+
+    def test_archive_mounted_from_settings(self) -> None:
+        self.assertFalse(
+            is_response_archive_mounted(
+                init_globalsearch_session(), url_prefix=GLOBALSEARCH_ORIGIN_URL
+            )
+        )
+
+        with override_settings(
+            GLOBALSEARCH_ARCHIVE_MODE="replay", GLOBALSEARCH_ARCHIVE_DIR=self.archive.root
+        ):
+            session = init_globalsearch_session()
+
+        self.assertTrue(is_response_archive_mounted(session, url_prefix=GLOBALSEARCH_ORIGIN_URL))
@@ -0,0 +1,113 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+
+from ..benchmarks.memory import benchmark_crawl_memory
+from ..benchmarks.notify import benchmark_notification_fanout
+from ..benchmarks.suite import benchmark_page
+from ..benchmarks.synthetic import generate_results_page
+from ..global_search.parser import parse_gs_courses, parse_section_statuses
+from ..models import InstructionEntry
+
+
+class SyntheticPageTests(SimpleTestCase):
+    def test_generates_requested_number_of_sections(self) -> None:
+        page_src = generate_results_page(120)
+
+        gs_courses = parse_gs_courses(BeautifulSoup(page_src, "lxml"))
+
+        self.assertEqual(sum(len(gs_course.sections) for gs_course in gs_courses), 120)
+        self.assertEqual(len(parse_section_statuses(page_src)), 120)
+        self.assertEqual(len({gs_course.get_name() for gs_course in gs_courses}), len(gs_courses))
+
+    def test_locations_fit_instruction_entry_columns(self) -> None:
+        gs_courses = parse_gs_courses(BeautifulSoup(generate_results_page(500), "lxml"))
+        locations = {
+            gs_instruction_entry.room
+            for gs_course in gs_courses
+            for gs_course_section in gs_course.sections
+            for gs_instruction_entry in gs_course_section.instruction_entries
+        }
+
+        for location in locations:
+            building, room, floor_number = InstructionEntry.parse_location(location)
+            with self.subTest(location=location):
+                self.assertLessEqual(len(building), InstructionEntry.building.field.max_length or 0)
+                self.assertLessEqual(len(room), InstructionEntry.room.field.max_length or 0)
+                self.assertLessEqual(
+                    len(floor_number), InstructionEntry.floor_number.field.max_length or 0
+                )
+
+    def test_is_deterministic(self) -> None:
+        self.assertEqual(generate_results_page(50, seed=3), generate_results_page(50, seed=3))
+        self.assertNotEqual(generate_results_page(50, seed=3), generate_results_page(50, seed=4))
+
+    def test_benchmark_page(self) -> None:
+        benchmark = benchmark_page("synthetic", generate_results_page(30), repeat=1)
+
+        self.assertEqual(benchmark.num_sections, 30)
+        self.assertGreater(benchmark.parse_peak_memory_bytes, 0)
+        self.assertGreater(benchmark.class_list_parse_peak_memory_bytes, 0)
+        self.assertIn("parse_gs_courses", [timing.name for timing in benchmark.timings])
+        self.assertEqual(benchmark.ingest_results, [])
+
+    def test_benchmark_crawl_memory(self) -> None:
+        result = benchmark_crawl_memory(2, sections_per_page=10)
+
+        self.assertEqual(result.num_sections, 20)
+        self.assertGreater(result.retained_bytes, 0)
+        self.assertGreater(result.peak_rss_bytes, result.retained_bytes)
+
+
+class NotificationFanOutBenchmarkTests(TestCase):
+    def test_benchmark_notification_fanout(self) -> None:
+        results = benchmark_notification_fanout(6, [3], latency_seconds=0)
+
+        self.assertEqual([result.num_workers for result in results], [1, 3])
+        for result in results:
+            self.assertEqual(result.num_notifications, 6)
+            # connections are kept alive & reused instead of opened per message
+            self.assertLessEqual(result.num_connections, result.num_workers)
+
+
+class BenchmarkCommandTests(TestCase):
+    def test_writes_json_results(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_path = Path(tmp_dir) / "results.json"
+            call_command(
+                "benchmark_global_search",
+                "--synthetic=20",
+                "--repeat=1",
+                "--ingest",
+                f"--output={output_path}",
+                stdout=StringIO(),
+            )
+            results = json.loads(output_path.read_text())
+
+        [benchmark] = results["benchmarks"]
+        self.assertEqual(benchmark["num_sections"], 20)
+        self.assertTrue(benchmark["ingest_results"])
+        self.assertTrue(all(result["num_queries"] > 0 for result in benchmark["ingest_results"]))
+
+    def test_parse_pool_results(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_path = Path(tmp_dir) / "results.json"
+            call_command(
+                "benchmark_global_search",
+                "--synthetic=20",
+                "--synthetic=30",
+                "--repeat=1",
+                "--parse-workers=0",
+                f"--output={output_path}",
+                stdout=StringIO(),
+            )
+            results = json.loads(output_path.read_text())
+
+        [parse_pool_result] = results["parse_pool"]
+        self.assertEqual(parse_pool_result["num_workers"], 0)
+        self.assertEqual(parse_pool_result["num_pages"], 2)
@@ -0,0 +1,214 @@
+from dataclasses import replace
+from typing import Any
+from unittest import mock
+
+from bs4 import BeautifulSoup
+from django.test import SimpleTestCase, TestCase
+
+from ..benchmarks.synthetic import generate_results_page
+from ..global_search.parser import get_page_fingerprint, parse_gs_courses
+from ..models import (
+    CatalogChange,
+    ClassListFingerprint,
+    CourseCareer,
+    CourseSection,
+    InstructionEntry,
+    School,
+    Subject,
+    Term,
+)
+from ..util import create_db_courses, ingest_class_list_page
+
+
+class PageFingerprintTests(SimpleTestCase):
+    def test_ignores_statuses_and_whitespace(self) -> None:
+        page_src = generate_results_page(40)
+        closed_page_src = page_src.replace("Open", "Closed").replace("wait", "Closed")
+
+        self.assertEqual(get_page_fingerprint(page_src), get_page_fingerprint(closed_page_src))
+        self.assertEqual(
+            get_page_fingerprint(page_src), get_page_fingerprint(page_src.replace("\n", "\n  "))
+        )
+
+    def test_changes_with_catalog(self) -> None:
+        page_src = generate_results_page(40)
+
+        self.assertNotEqual(
+            get_page_fingerprint(page_src),
+            get_page_fingerprint(page_src.replace("Kiely Hall", "Rosenthal Library", 1)),
+        )
+
+
+class ChangeDetectionIngestTests(TestCase):
+    def setUp(self) -> None:
+        self.school = School.objects.create(name="Queens College", globalsearch_key="QNS01")
+        self.term = Term.objects.create(name="Fall Term", globalsearch_key="1249", year=2024)
+        self.career = CourseCareer.objects.create(name="Undergraduate", globalsearch_key="UGRD")
+        self.subject = Subject.objects.create(name="Computer Science", globalsearch_key="CMSC")
+        self.page_src = generate_results_page(60)
+
+    def ingest(self, page_src: str, *, is_forced: bool = False) -> bool:
+        return ingest_class_list_page(
+            page_src, self.subject, self.career, self.school, self.term, is_forced=is_forced
+        ).is_unchanged
+
+    def test_unchanged_page_skips_parsing(self) -> None:
+        self.assertFalse(self.ingest(self.page_src))
+
+        with mock.patch("class_tracker.util.parse_class_list_page") as parse_mock:
+            self.assertTrue(self.ingest(self.page_src))
+        parse_mock.assert_not_called()
+
+        fingerprint = ClassListFingerprint.objects.get()
+        self.assertEqual(fingerprint.fingerprint, get_page_fingerprint(self.page_src))
+        self.assertGreater(fingerprint.num_courses, 0)
+
+    def test_forced_ingest_parses_unchanged_page(self) -> None:
+        self.ingest(self.page_src)
+
+        self.assertFalse(self.ingest(self.page_src, is_forced=True))
+
+    def test_only_changed_sections_are_rewritten(self) -> None:
+        gs_courses = parse_gs_courses(BeautifulSoup(self.page_src, "lxml"))
+        create_db_courses(gs_courses, self.subject, self.career, self.school, self.term)
+        entry_ids_before = set(InstructionEntry.objects.values_list("id", flat=True))
+
+        # re-ingesting the same sections only re-reads their fingerprints
+        with self.assertNumQueries(6):
+            create_db_courses(gs_courses, self.subject, self.career, self.school, self.term)
+
+        changed_gs_course_section = replace(gs_courses[0].sections[0], topic="Special Topics")
+        gs_courses[0] = replace(
+            gs_courses[0], sections=(changed_gs_course_section, *gs_courses[0].sections[1:])
+        )
+        create_db_courses(gs_courses, self.subject, self.career, self.school, self.term)
+
+        changed_course_section = CourseSection.objects.get(
+            gs_unique_id=changed_gs_course_section.unique_id
+        )
+        self.assertEqual(changed_course_section.topic, "Special Topics")
+        # the meetings did not change, so neither did the instruction entries
+        self.assertEqual(
+            set(InstructionEntry.objects.values_list("id", flat=True)), entry_ids_before
+        )
+
+
+class CatalogDiffTests(TestCase):
+    def setUp(self) -> None:
+        self.school = School.objects.create(name="Queens College", globalsearch_key="QNS01")
+        self.term = Term.objects.create(name="Fall Term", globalsearch_key="1249", year=2024)
+        self.career = CourseCareer.objects.create(name="Undergraduate", globalsearch_key="UGRD")
+        self.subject = Subject.objects.create(name="Computer Science", globalsearch_key="CMSC")
+        self.last_change_id = 0
+
+        self.gs_courses = parse_gs_courses(BeautifulSoup(generate_results_page(20), "lxml"))
+        self.sync()
+        self.gs_course_section = self.gs_courses[0].sections[0]
+        self.course_section = CourseSection.objects.get(
+            gs_unique_id=self.gs_course_section.unique_id
+        )
+
+    def replace_gs_course_section(self, **changes: Any) -> None:
+        gs_course = self.gs_courses[0]
+        self.gs_course_section = replace(self.gs_course_section, **changes)
+        self.gs_courses[0] = replace(
+            gs_course, sections=(self.gs_course_section, *gs_course.sections[1:])
+        )
+
+    def sync(self) -> None:
+        create_db_courses(self.gs_courses, self.subject, self.career, self.school, self.term)
+
+    def get_new_changes(self) -> list[CatalogChange]:
+        catalog_changes = list(CatalogChange.objects.filter(id__gt=self.last_change_id))
+        self.last_change_id = max(
+            (change.id for change in catalog_changes), default=self.last_change_id
+        )
+        return catalog_changes
+
+    def test_first_sync_logs_added_sections(self) -> None:
+        catalog_changes = self.get_new_changes()
+
+        self.assertEqual(
+            {change.kind for change in catalog_changes}, {CatalogChange.KindChoices.ADDED}
+        )
+        self.assertEqual(len(catalog_changes), CourseSection.objects.count())
+
+    def test_unchanged_sync_logs_nothing(self) -> None:
+        self.get_new_changes()
+
+        self.sync()
+
+        self.assertEqual(self.get_new_changes(), [])
+
+    def test_modified_section(self) -> None:
+        self.get_new_changes()
+        old_topic = self.course_section.topic
+
+        self.replace_gs_course_section(topic="Special Topics")
+        self.sync()
+
+        [catalog_change] = self.get_new_changes()
+        self.assertEqual(catalog_change.course_section, self.course_section)
+        self.assertEqual(catalog_change.kind, CatalogChange.KindChoices.MODIFIED)
+        self.assertEqual(catalog_change.changes, {"topic": [old_topic, "Special Topics"]})
+
+    def test_instructor_and_room_changes(self) -> None:
+        self.get_new_changes()
+        entry_ids_before = set(self.course_section.instruction_entries.values_list("id", flat=True))
+        other_entry_ids_before = set(
+            InstructionEntry.objects.exclude(course_section=self.course_section).values_list(
+                "id", flat=True
+            )
+        )
+
+        self.replace_gs_course_section(
+            instruction_entries=tuple(
+                replace(gs_instruction_entry, instructor="Ada Lovelace", room="Razran Hall 230")
+                for gs_instruction_entry in self.gs_course_section.instruction_entries
+            )
+        )
+        self.sync()
+
+        kind_to_changes = {change.kind: change.changes for change in self.get_new_changes()}
+        self.assertEqual(
+            set(kind_to_changes),
+            {CatalogChange.KindChoices.INSTRUCTORS, CatalogChange.KindChoices.ROOMS},
+        )
+        self.assertEqual(kind_to_changes["instructors"]["instructors"][1], ["Ada Lovelace"])
+        self.assertEqual(kind_to_changes["rooms"]["rooms"][1], ["Razran Hall 230"])
+
+        # only the entries of the changed section were replaced
+        entry_ids_after = set(self.course_section.instruction_entries.values_list("id", flat=True))
+        self.assertTrue(entry_ids_after.isdisjoint(entry_ids_before))
+        self.assertEqual(
+            set(
+                InstructionEntry.objects.exclude(course_section=self.course_section).values_list(
+                    "id", flat=True
+                )
+            ),
+            other_entry_ids_before,
+        )
+
+    def test_removed_then_listed_again(self) -> None:
+        self.get_new_changes()
+        gs_course = self.gs_courses[0]
+
+        self.gs_courses[0] = replace(gs_course, sections=gs_course.sections[1:])
+        self.sync()
+
+        [catalog_change] = self.get_new_changes()
+        self.course_section.refresh_from_db()
+        self.assertEqual(catalog_change.kind, CatalogChange.KindChoices.REMOVED)
+        self.assertIsNotNone(self.course_section.datetime_removed)
+        self.assertTrue(self.course_section.instruction_entries.exists())
+
+        self.sync()  # a removal is only logged once
+        self.assertEqual(self.get_new_changes(), [])
+
+        self.gs_courses[0] = gs_course
+        self.sync()
+
+        [catalog_change] = self.get_new_changes()
+        self.course_section.refresh_from_db()
+        self.assertEqual(catalog_change.kind, CatalogChange.KindChoices.ADDED)
+        self.assertIsNone(self.course_section.datetime_removed)
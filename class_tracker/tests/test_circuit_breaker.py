@@ -0,0 +1,151 @@
+from unittest import mock
+
+import redis
+from django.test import SimpleTestCase
+from requests import ConnectionError as RequestsConnectionError
+from requests import HTTPError, Response, Session
+
+from ..global_search import navigator
+from ..global_search.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+)
+from ..global_search.rate_limiter import RateLimitTimeoutError
+from .test_rate_limiter import requires_redis
+
+
+def _get_session(status_code: int) -> mock.Mock:
+    response = Response()
+    response.status_code = status_code
+    response._content = b"<html></html>"  # noqa: SLF001
+    session = mock.Mock(spec=Session, headers={})
+    session.request.return_value = response
+    return session
+
+
+class CircuitBreakerTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.circuit_breaker = CircuitBreaker(
+            "test:circuit", failure_threshold=3, reset_timeout_seconds=60
+        )
+
+        patcher = mock.patch("class_tracker.global_search.circuit_breaker.get_redis_connection")
+        self.redis_connection = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+
+    def test_open_circuit_rejects_requests(self) -> None:
+        self.redis_connection.eval.return_value = b"open"
+
+        with self.assertRaises(CircuitOpenError):
+            self.circuit_breaker.before_request()
+
+    def test_closed_circuit_and_probe_are_let_through(self) -> None:
+        self.redis_connection.eval.side_effect = [b"closed", b"probe"]
+
+        self.circuit_breaker.before_request()
+        self.circuit_breaker.before_request()
+
+    def test_fails_open_without_redis(self) -> None:
+        self.redis_connection.eval.side_effect = redis.ConnectionError("refused")
+
+        self.circuit_breaker.before_request()
+        self.circuit_breaker.record_failure()
+
+        self.assertEqual(self.redis_connection.eval.call_count, 1)
+
+    def test_get_status(self) -> None:
+        self.redis_connection.hgetall.return_value = {
+            b"state": b"open",
+            b"num_failures": b"3",
+            b"datetime_opened": b"1700000000.5",
+        }
+
+        status = self.circuit_breaker.get_status()
+
+        if status is None:
+            self.fail("Expected a circuit status")
+        self.assertEqual(status.state, CircuitState.OPEN)
+        self.assertEqual(status.num_failures, 3)
+        self.assertIsNotNone(status.datetime_opened)
+
+
+class NavigatorCircuitBreakerTests(SimpleTestCase):
+    def setUp(self) -> None:
+        patcher = mock.patch.object(navigator, "circuit_breaker")
+        self.circuit_breaker = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch.object(navigator, "rate_limiter")
+        self.rate_limiter = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_open_circuit_skips_network(self) -> None:
+        self.circuit_breaker.before_request.side_effect = CircuitOpenError("open")
+        session = _get_session(200)
+
+        with self.assertRaises(CircuitOpenError):
+            navigator.get_main_page(session)
+
+        session.request.assert_not_called()
+
+    def test_rate_limit_timeout_takes_no_probe(self) -> None:
+        self.rate_limiter.acquire.side_effect = RateLimitTimeoutError("no token")
+        session = _get_session(200)
+
+        with self.assertRaises(RateLimitTimeoutError):
+            navigator.get_main_page(session)
+
+        # a probe granted here would stay leased until it expired, as no outcome is reported
+        self.circuit_breaker.before_request.assert_not_called()
+        session.request.assert_not_called()
+
+    def test_server_errors_count_as_failures(self) -> None:
+        with self.assertRaises(HTTPError):
+            navigator.get_main_page(_get_session(503))
+
+        self.circuit_breaker.record_failure.assert_called_once_with()
+        self.circuit_breaker.record_success.assert_not_called()
+
+    def test_connection_errors_count_as_failures(self) -> None:
+        session = _get_session(200)
+        session.request.side_effect = RequestsConnectionError("reset")
+
+        with self.assertRaises(RequestsConnectionError):
+            navigator.get_main_page(session)
+
+        self.circuit_breaker.record_failure.assert_called_once_with()
+
+    def test_success_closes_circuit(self) -> None:
+        navigator.get_main_page(_get_session(200))
+
+        self.circuit_breaker.record_success.assert_called_once_with()
+
+
+@requires_redis
+class RedisCircuitBreakerTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.circuit_breaker = CircuitBreaker(
+            "class_tracker:test:circuit", failure_threshold=2, reset_timeout_seconds=0
+        )
+        self.circuit_breaker.reset()
+        self.addCleanup(self.circuit_breaker.reset)
+
+    def test_trips_probes_and_closes(self) -> None:
+        self.circuit_breaker.record_failure()
+        self.circuit_breaker.before_request()
+        self.circuit_breaker.record_failure()
+
+        status = self.circuit_breaker.get_status()
+        self.assertEqual(status and status.state, CircuitState.OPEN)
+
+        # reset timeout of 0: the next request is the half-open probe, others are rejected meanwhile
+        self.circuit_breaker.before_request()
+        with self.assertRaises(CircuitOpenError):
+            self.circuit_breaker.before_request()
+
+        self.circuit_breaker.record_success()
+
+        status = self.circuit_breaker.get_status()
+        self.assertEqual(status and status.state, CircuitState.CLOSED)
+        self.circuit_breaker.before_request()
@@ -0,0 +1,83 @@
+from bs4 import BeautifulSoup
+from django.test import SimpleTestCase
+
+from ..benchmarks.synthetic import generate_results_page
+from ..global_search.parser import parse_class_list_page, parse_gs_courses
+
+_COURSE_TEMPLATE = """
+<div id="contentDiv{index}">
+  <span class="testing_msg">&nbsp;CSCI {level} - Course {index}</span>
+  <div id="contentDivImg{index}">
+    <table class="classinfo">
+      <tbody>
+        <tr>
+          <td data-label="Class"><a href="/?class_number_searched=Q{number}">{number}</a></td>
+          <td data-label="Section">01-LEC Regular</td>
+          <td data-label="DaysAndTimes">MoWe 9:15AM - 10:30AM</td>
+          <td data-label="Room">Science Building C205</td>
+          <td data-label="Instructor">Jane Doe</td>
+          <td data-label="Instruction Mode">In Person</td>
+          <td data-label="Meeting Dates">08/26/2024 - 12/18/2024</td>
+          <td data-label="Status"><img src="/open.jpg" alt="Open" title="Open"></td>
+          <td data-label="Course Topic"></td>
+        </tr>
+      </tbody>
+    </table>
+  </div>
+</div>
+"""
+
+
+def _get_course(index: int) -> str:
+    return _COURSE_TEMPLATE.format(index=index, level=100 + index, number=30000 + index)
+
+
+class ClassListPageParserTests(SimpleTestCase):
+    def assert_matches_soup_parser(self, page_src: str) -> None:
+        self.assertEqual(
+            parse_class_list_page(page_src), parse_gs_courses(BeautifulSoup(page_src, "lxml"))
+        )
+
+    def test_matches_soup_parser(self) -> None:
+        for num_sections in (1, 40, 300):
+            with self.subTest(num_sections=num_sections):
+                self.assert_matches_soup_parser(generate_results_page(num_sections, seed=7))
+
+    def test_skips_page_chrome(self) -> None:
+        page_src = (
+            "<html><head><script>var content = 1;</script></head><body>"
+            '<nav id="menu"><span class="testing_msg">CSCI 999 - Not a course</span><div></div></nav>'
+            f'<div id="contentWrapper">{_get_course(0)}{_get_course(1)}</div>'
+            "</body></html>"
+        )
+
+        self.assert_matches_soup_parser(page_src)
+        self.assertEqual(
+            [gs_course.get_name() for gs_course in parse_class_list_page(page_src)],
+            ["CSCI 100", "CSCI 101"],
+        )
+
+    def test_course_without_listing(self) -> None:
+        page_src = (
+            '<html><body><div id="contentDiv0">'
+            '<span class="testing_msg">CSCI 100 - Empty</span><br>'
+            '<div id="noClassesDiv0">No classes found</div>'
+            f"</div>{_get_course(1)}</body></html>"
+        )
+
+        self.assert_matches_soup_parser(page_src)
+        [gs_course] = parse_class_list_page(page_src)
+        self.assertEqual(gs_course.get_name(), "CSCI 101")
+
+    def test_course_label_without_sibling(self) -> None:
+        page_src = (
+            '<html><body><div id="contentDiv0"><span class="testing_msg">CSCI 100 - Cut off</span>'
+            "</div></body></html>"
+        )
+
+        with self.assertRaises(ValueError):
+            parse_class_list_page(page_src)
+
+    def test_page_without_results(self) -> None:
+        self.assertEqual(parse_class_list_page(""), [])
+        self.assertEqual(parse_class_list_page("<html><body></body></html>"), [])
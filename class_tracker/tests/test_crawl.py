@@ -0,0 +1,467 @@
+import datetime
+import hashlib
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.exceptions import NotFound
+
+from ..benchmarks.synthetic import generate_results_page
+from ..jobs import (
+    crawl_catalog_pipeline,
+    crawl_catalog_unit,
+    resume_catalog_crawl,
+    start_catalog_crawl,
+)
+from ..models import CatalogCrawl, CatalogCrawlUnit, Course, CourseCareer, School, Subject, Term
+from ..util.crawl import plan_crawl_units, run_crawl_unit
+from ..util.crawl_pipeline import CrawlPipelineConfig, run_crawl_pipeline
+
+_PIPELINE_CONFIG = CrawlPipelineConfig(
+    num_fetchers=2,
+    num_parsers=0,
+    queue_size=2,
+    write_batch_size=2,
+    request_timeout_seconds=1,
+)
+
+
+class CatalogCrawlTestCase(TestCase):
+    def setUp(self) -> None:
+        self.school = School.objects.create(name="Queens College", globalsearch_key="QNS01")
+        self.term = Term.objects.create(name="Fall Term", globalsearch_key="1249", year=2024)
+        self.term.schools.add(self.school)
+
+        self.careers = [
+            CourseCareer.objects.create(name="Undergraduate", globalsearch_key="UGRD"),
+            CourseCareer.objects.create(name="Graduate", globalsearch_key="GRAD"),
+        ]
+        self.subjects = [
+            Subject.objects.create(name="Computer Science", globalsearch_key="CMSC"),
+            Subject.objects.create(name="Mathematics", globalsearch_key="MATH"),
+            Subject.objects.create(name="Physics", globalsearch_key="PHYS"),
+        ]
+        for career in self.careers:
+            career.terms.add(self.term)
+            career.schools.add(self.school)
+        for subject in self.subjects:
+            subject.terms.add(self.term)
+            subject.schools.add(self.school)
+
+        # every enqueued job is recorded instead of reaching the scheduler
+        patcher = mock.patch("class_tracker.jobs.get_queue")
+        self.get_queue = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get_enqueued_jobs(self) -> list[mock._Call]:
+        enqueued_jobs: list[mock._Call] = (
+            self.get_queue.return_value.create_and_enqueue_job.call_args_list
+        )
+        return enqueued_jobs
+
+
+class PlanCrawlUnitsTests(CatalogCrawlTestCase):
+    def test_plans_every_career_and_subject(self) -> None:
+        crawl = CatalogCrawl.objects.create(term=self.term)
+
+        units = plan_crawl_units(crawl)
+
+        self.assertEqual(len(units), len(self.careers) * len(self.subjects))
+        self.assertTrue(all(unit.id is not None for unit in units))
+
+    def test_plans_single_subject(self) -> None:
+        crawl = CatalogCrawl.objects.create(
+            term=self.term, school=self.school, subject=self.subjects[0]
+        )
+
+        units = plan_crawl_units(crawl)
+
+        self.assertEqual({unit.subject for unit in units}, {self.subjects[0]})
+        self.assertEqual(len(units), len(self.careers))
+
+    @override_settings(CLASS_TRACKER_CRAWL_PIPELINE_ENABLED=False)
+    def test_start_enqueues_unit_jobs(self) -> None:
+        crawl = CatalogCrawl.objects.create(term=self.term, school=self.school)
+
+        start_catalog_crawl(crawl.id)
+
+        crawl.refresh_from_db()
+        enqueued_jobs = self.get_enqueued_jobs()
+        self.assertEqual(crawl.status, CatalogCrawl.StatusChoices.RUNNING)
+        self.assertEqual(len(enqueued_jobs), len(self.careers) * len(self.subjects))
+        self.assertEqual(
+            {job.kwargs["args"][0] for job in enqueued_jobs},
+            set(crawl.units.values_list("id", flat=True)),
+        )
+
+    def test_start_enqueues_pipeline_job(self) -> None:
+        crawl = CatalogCrawl.objects.create(term=self.term, school=self.school)
+
+        start_catalog_crawl(crawl.id)
+
+        [enqueued_job] = self.get_enqueued_jobs()
+        self.assertEqual(enqueued_job.args, (crawl_catalog_pipeline,))
+        self.assertEqual(enqueued_job.kwargs["args"], (crawl.id,))
+
+    @override_settings(CLASS_TRACKER_CRAWL_PIPELINE_ENABLED=False)
+    def test_replanning_keeps_checkpointed_units(self) -> None:
+        crawl = CatalogCrawl.objects.create(term=self.term, school=self.school)
+        [first_unit, *_] = plan_crawl_units(crawl)
+        first_unit.status = CatalogCrawlUnit.StatusChoices.COMPLETED
+        first_unit.save(update_fields=["status"])
+
+        start_catalog_crawl(crawl.id)
+
+        self.assertEqual(crawl.units.count(), len(self.careers) * len(self.subjects))
+        enqueued_unit_ids = [job.kwargs["args"][0] for job in self.get_enqueued_jobs()]
+        self.assertEqual(len(enqueued_unit_ids), crawl.units.count() - 1)
+        self.assertNotIn(first_unit.id, enqueued_unit_ids)
+
+    def test_start_without_units_finishes_immediately(self) -> None:
+        empty_term = Term.objects.create(name="Spring Term", globalsearch_key="1252", year=2025)
+        crawl = CatalogCrawl.objects.create(term=empty_term)
+
+        start_catalog_crawl(crawl.id)
+
+        crawl.refresh_from_db()
+        self.assertEqual(crawl.status, CatalogCrawl.StatusChoices.COMPLETED)
+        self.assertIsNotNone(crawl.datetime_finished)
+        self.assertEqual(self.get_enqueued_jobs(), [])
+
+
+class RunCrawlUnitTests(CatalogCrawlTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.crawl = CatalogCrawl.objects.create(
+            term=self.term, school=self.school, subject=self.subjects[0]
+        )
+        self.units = plan_crawl_units(self.crawl)
+
+    def test_success_stores_courses(self) -> None:
+        page_src = generate_results_page(30)
+        with mock.patch("class_tracker.util.crawl.session_pool.run", return_value=page_src):
+            run_crawl_unit(self.units[0])
+
+        self.units[0].refresh_from_db()
+        self.assertEqual(self.units[0].status, CatalogCrawlUnit.StatusChoices.COMPLETED)
+        self.assertGreater(self.units[0].num_courses, 0)
+        self.assertEqual(Course.objects.count(), self.units[0].num_courses)
+        self.assertEqual(self.units[0].content_hash, hashlib.sha256(page_src.encode()).hexdigest())
+        self.assertIsNotNone(self.units[0].fetch_duration)
+        self.assertIsNotNone(self.units[0].ingest_duration)
+        datetime_started = self.units[0].datetime_started
+        datetime_finished = self.units[0].datetime_finished
+        if datetime_started is None or datetime_finished is None:
+            self.fail("The unit timings were not recorded")
+        self.assertLessEqual(datetime_started, datetime_finished)
+
+    def test_recrawl_of_unchanged_page_is_skipped(self) -> None:
+        page_src = generate_results_page(30)
+        with mock.patch("class_tracker.util.crawl.session_pool.run", return_value=page_src):
+            run_crawl_unit(self.units[0])
+            self.units[0].refresh_from_db()
+            self.assertFalse(self.units[0].is_unchanged)
+
+            run_crawl_unit(self.units[0])
+
+        self.units[0].refresh_from_db()
+        self.assertEqual(self.units[0].status, CatalogCrawlUnit.StatusChoices.COMPLETED)
+        self.assertTrue(self.units[0].is_unchanged)
+        self.assertEqual(Course.objects.count(), self.units[0].num_courses)
+
+    def test_failure_marks_unit_failed(self) -> None:
+        with mock.patch(
+            "class_tracker.util.crawl.session_pool.run", side_effect=ConnectionError("timed out")
+        ):
+            run_crawl_unit(self.units[0])
+
+        self.units[0].refresh_from_db()
+        self.assertEqual(self.units[0].status, CatalogCrawlUnit.StatusChoices.FAILED)
+        self.assertIn("timed out", self.units[0].error)
+
+    def test_crawl_finishes_after_last_unit(self) -> None:
+        with mock.patch(
+            "class_tracker.util.crawl.session_pool.run", return_value=generate_results_page(5)
+        ):
+            run_crawl_unit(self.units[0])
+            self.crawl.refresh_from_db()
+            self.assertFalse(self.crawl.is_finished)
+
+            crawl_catalog_unit(self.units[1].id)
+
+        self.crawl.refresh_from_db()
+        self.assertEqual(self.crawl.status, CatalogCrawl.StatusChoices.COMPLETED)
+        self.assertEqual(self.crawl.num_units_completed, len(self.units))
+
+    def test_resume_skips_completed_units(self) -> None:
+        with mock.patch(
+            "class_tracker.util.crawl.session_pool.run", return_value=generate_results_page(5)
+        ):
+            run_crawl_unit(self.units[0])
+        with mock.patch(
+            "class_tracker.util.crawl.session_pool.run", side_effect=ConnectionError("timed out")
+        ):
+            run_crawl_unit(self.units[1])
+        self.crawl.refresh_from_db()
+        self.assertEqual(self.crawl.status, CatalogCrawl.StatusChoices.FAILED)
+
+        num_resumed = resume_catalog_crawl(self.crawl)
+
+        self.crawl.refresh_from_db()
+        [enqueued_job] = self.get_enqueued_jobs()
+        self.assertEqual(num_resumed, 1)
+        self.assertEqual(enqueued_job.kwargs["args"], (self.units[1].id,))
+        self.assertEqual(self.crawl.status, CatalogCrawl.StatusChoices.RUNNING)
+        self.assertIsNone(self.crawl.datetime_finished)
+
+    def test_throughput_and_eta(self) -> None:
+        self.assertIsNone(self.crawl.get_units_per_minute())
+
+        now = timezone.now()
+        self.units[0].status = CatalogCrawlUnit.StatusChoices.COMPLETED
+        self.units[0].datetime_started = now - datetime.timedelta(minutes=2)
+        self.units[0].datetime_finished = now - datetime.timedelta(minutes=1)
+        self.units[0].save()
+
+        crawl = CatalogCrawl.objects.get(id=self.crawl.id)  # the unit aggregates are cached
+        units_per_minute = crawl.get_units_per_minute()
+        eta = crawl.get_eta()
+
+        if units_per_minute is None or eta is None:
+            self.fail("Expected throughput & ETA once a unit has completed")
+        self.assertAlmostEqual(units_per_minute, 0.5, places=2)
+        self.assertAlmostEqual(eta.total_seconds(), 120, delta=1)
+
+
+class CrawlPipelineTests(CatalogCrawlTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.crawl = CatalogCrawl.objects.create(term=self.term, school=self.school)
+        self.units = plan_crawl_units(self.crawl)
+
+        self.subject_to_page_src = {
+            subject: generate_results_page(10, seed=i) for i, subject in enumerate(self.subjects)
+        }
+        patcher = mock.patch(
+            "class_tracker.util.crawl_pipeline.session_pool.run", side_effect=self.fetch_page
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def fetch_page(
+        self, _school: School, _term: Term, callback: mock.Mock, **_kwargs: float
+    ) -> str:
+        subject = callback.keywords["subject"]
+        if subject.globalsearch_key == "PHYS":
+            raise ConnectionError("timed out")
+        return self.subject_to_page_src[subject]
+
+    def test_crawls_every_unit(self) -> None:
+        stats = run_crawl_pipeline(self.crawl, self.units, _PIPELINE_CONFIG)
+
+        self.crawl.refresh_from_db()
+        units = list(self.crawl.units.all())
+        failed_units = [unit for unit in units if unit.subject.globalsearch_key == "PHYS"]
+        completed_units = [unit for unit in units if unit not in failed_units]
+        self.assertEqual(self.crawl.status, CatalogCrawl.StatusChoices.FAILED)
+        self.assertTrue(
+            all(unit.status == CatalogCrawlUnit.StatusChoices.FAILED for unit in failed_units)
+        )
+        self.assertIn("timed out", failed_units[0].error)
+        self.assertTrue(
+            all(unit.status == CatalogCrawlUnit.StatusChoices.COMPLETED for unit in completed_units)
+        )
+        self.assertTrue(all(unit.num_courses > 0 for unit in completed_units))
+        self.assertTrue(all(unit.ingest_duration is not None for unit in completed_units))
+
+        stage_name_to_num_items = {stage.name: stage.num_items for stage in stats.stages}
+        self.assertEqual(
+            stage_name_to_num_items,
+            {"fetch": len(units), "parse": len(completed_units), "write": mock.ANY},
+        )
+        for stage in stats.stages:
+            self.assertLessEqual(stage.get_utilization(stats.elapsed_seconds), 1)
+
+    def test_unchanged_pages_are_not_parsed_again(self) -> None:
+        run_crawl_pipeline(self.crawl, self.units, _PIPELINE_CONFIG)
+        CatalogCrawlUnit.objects.update(status=CatalogCrawlUnit.StatusChoices.QUEUED)
+
+        with mock.patch(
+            "class_tracker.global_search.parse_pool.parse_class_list_page"
+        ) as parse_class_list_page:
+            stats = run_crawl_pipeline(self.crawl, list(self.crawl.units.all()), _PIPELINE_CONFIG)
+
+        parse_class_list_page.assert_not_called()
+        completed_units = self.crawl.units.filter(status=CatalogCrawlUnit.StatusChoices.COMPLETED)
+        self.assertTrue(completed_units.exists())
+        self.assertTrue(all(unit.is_unchanged for unit in completed_units))
+        self.assertGreater(stats.stages[1].num_items, 0)
+
+    def test_parses_in_worker_processes(self) -> None:
+        config = CrawlPipelineConfig(
+            num_fetchers=2,
+            num_parsers=1,
+            queue_size=2,
+            write_batch_size=4,
+            request_timeout_seconds=1,
+        )
+
+        run_crawl_pipeline(self.crawl, self.units, config)
+
+        self.assertEqual(
+            self.crawl.units.filter(status=CatalogCrawlUnit.StatusChoices.COMPLETED).count(),
+            len(self.careers) * (len(self.subjects) - 1),
+        )
+        self.assertTrue(Course.objects.exists())
+
+    def test_job_only_runs_pending_units(self) -> None:
+        self.units[0].status = CatalogCrawlUnit.StatusChoices.COMPLETED
+        self.units[0].save(update_fields=["status"])
+
+        with mock.patch("class_tracker.jobs.run_crawl_pipeline") as run_crawl_pipeline_mock:
+            crawl_catalog_pipeline(self.crawl.id)
+
+        [crawl, units, _config] = run_crawl_pipeline_mock.call_args.args
+        self.assertEqual(crawl, self.crawl)
+        self.assertEqual([unit.id for unit in units], [unit.id for unit in self.units[1:]])
+
+
+class CatalogCrawlViewTests(CatalogCrawlTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        staff_user = get_user_model().objects.create_user(username="staff", is_staff=True)
+        self.client.force_login(staff_user)
+
+    def test_fetch_queues_crawl_after_commit(self) -> None:
+        url = reverse(
+            "class_tracker:fetch_new_semester_course_sections",
+            kwargs={"school_id": self.school.id, "term_id": self.term.id, "subject_id": 0},
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(url, headers={"Accept": "application/json"})
+
+        self.assertEqual(response.status_code, 200)
+        crawl = CatalogCrawl.objects.get()
+        self.assertEqual(response.json()["crawl"]["id"], crawl.id)
+        self.assertIsNone(crawl.subject)
+        [enqueued_job] = self.get_enqueued_jobs()
+        self.assertEqual(enqueued_job.args, (start_catalog_crawl,))
+        self.assertEqual(enqueued_job.kwargs["args"], (crawl.id,))
+
+    def test_fetch_unknown_subject_is_not_found(self) -> None:
+        url = reverse(
+            "class_tracker:fetch_new_semester_course_sections",
+            kwargs={"school_id": self.school.id, "term_id": self.term.id, "subject_id": 9999},
+        )
+
+        with self.assertRaises(NotFound):
+            self.client.post(url, headers={"Accept": "application/json"})
+
+        self.assertFalse(CatalogCrawl.objects.exists())
+
+    def test_fetch_resumes_failed_crawl(self) -> None:
+        crawl = CatalogCrawl.objects.create(
+            term=self.term,
+            school=self.school,
+            subject=self.subjects[0],
+            status=CatalogCrawl.StatusChoices.FAILED,
+        )
+        [failed_unit, completed_unit] = plan_crawl_units(crawl)
+        failed_unit.status = CatalogCrawlUnit.StatusChoices.FAILED
+        failed_unit.save(update_fields=["status"])
+        completed_unit.status = CatalogCrawlUnit.StatusChoices.COMPLETED
+        completed_unit.save(update_fields=["status"])
+        url = reverse(
+            "class_tracker:fetch_new_semester_course_sections",
+            kwargs={
+                "school_id": self.school.id,
+                "term_id": self.term.id,
+                "subject_id": self.subjects[0].id,
+            },
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(url, headers={"Accept": "application/json"})
+
+        self.assertEqual(response.json()["crawl"]["id"], crawl.id)
+        self.assertEqual(CatalogCrawl.objects.count(), 1)
+        [enqueued_job] = self.get_enqueued_jobs()
+        self.assertEqual(enqueued_job.kwargs["args"], (failed_unit.id,))
+
+    def test_fetch_resumes_stale_crawl(self) -> None:
+        crawl = CatalogCrawl.objects.create(
+            term=self.term,
+            school=self.school,
+            subject=self.subjects[0],
+            status=CatalogCrawl.StatusChoices.RUNNING,
+        )
+        [running_unit, completed_unit] = plan_crawl_units(crawl)
+        running_unit.status = CatalogCrawlUnit.StatusChoices.RUNNING
+        running_unit.save(update_fields=["status"])
+        completed_unit.status = CatalogCrawlUnit.StatusChoices.COMPLETED
+        completed_unit.save(update_fields=["status"])
+        url = reverse(
+            "class_tracker:fetch_new_semester_course_sections",
+            kwargs={
+                "school_id": self.school.id,
+                "term_id": self.term.id,
+                "subject_id": self.subjects[0].id,
+            },
+        )
+
+        # still within the lease, so the crawl is left to its worker
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(url, headers={"Accept": "application/json"})
+        self.assertEqual(self.get_enqueued_jobs(), [])
+
+        # the worker died mid-crawl
+        datetime_abandoned = timezone.now() - datetime.timedelta(hours=2)
+        CatalogCrawl.objects.update(datetime_modified=datetime_abandoned)
+        CatalogCrawlUnit.objects.update(datetime_modified=datetime_abandoned)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(url, headers={"Accept": "application/json"})
+
+        self.assertEqual(response.json()["crawl"]["id"], crawl.id)
+        [enqueued_job] = self.get_enqueued_jobs()
+        self.assertEqual(enqueued_job.args, (crawl_catalog_unit,))
+        self.assertEqual(enqueued_job.kwargs["args"], (running_unit.id,))
+        running_unit.refresh_from_db()
+        self.assertEqual(running_unit.status, CatalogCrawlUnit.StatusChoices.QUEUED)
+
+    def test_fetch_replans_stale_crawl_without_units(self) -> None:
+        crawl = CatalogCrawl.objects.create(term=self.term, school=self.school)
+        CatalogCrawl.objects.update(datetime_modified=timezone.now() - datetime.timedelta(hours=2))
+        url = reverse(
+            "class_tracker:fetch_new_semester_course_sections",
+            kwargs={"school_id": self.school.id, "term_id": self.term.id, "subject_id": 0},
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(url, headers={"Accept": "application/json"})
+
+        [enqueued_job] = self.get_enqueued_jobs()
+        self.assertEqual(enqueued_job.args, (start_catalog_crawl,))
+        self.assertEqual(enqueued_job.kwargs["args"], (crawl.id,))
+
+    def test_status_returns_courses_when_finished(self) -> None:
+        crawl = CatalogCrawl.objects.create(
+            term=self.term, school=self.school, subject=self.subjects[0]
+        )
+        plan_crawl_units(crawl)
+        with mock.patch(
+            "class_tracker.util.crawl.session_pool.run", return_value=generate_results_page(10)
+        ):
+            for unit in crawl.units.all():
+                crawl_catalog_unit(unit.id)
+
+        response = self.client.get(
+            reverse("class_tracker:get_catalog_crawl", kwargs={"crawl_id": crawl.id}),
+            headers={"Accept": "application/json"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()["crawl"]["is_finished"])
+        self.assertEqual(len(response.json()["courses"]), Course.objects.count())
@@ -0,0 +1,121 @@
+import datetime
+
+from django.test import SimpleTestCase, TestCase
+
+from ..models import (
+    Course,
+    CourseCareer,
+    CourseSection,
+    InstructionEntry,
+    Instructor,
+    School,
+    Subject,
+    Term,
+    Weekday,
+)
+
+
+class DaysMaskTests(SimpleTestCase):
+    def test_encode_and_decode_round_trip(self) -> None:
+        days_mask = InstructionEntry.encode_days(["Th", "Tu"])
+
+        self.assertEqual(days_mask, 0b1010)
+        self.assertEqual(
+            InstructionEntry.decode_days(days_mask), [Weekday.TUESDAY, Weekday.THURSDAY]
+        )
+
+    def test_days_accessor(self) -> None:
+        instruction_entry = InstructionEntry()
+        instruction_entry.days = InstructionEntry.parse_days("MoWeFr")
+
+        self.assertEqual(instruction_entry.days_mask, 0b10101)
+        self.assertEqual(
+            instruction_entry.days, [Weekday.MONDAY, Weekday.WEDNESDAY, Weekday.FRIDAY]
+        )
+
+    def test_parse_days_and_times(self) -> None:
+        days, start_time, end_time = InstructionEntry.parse_days_and_times("TuTh 5:00PM - 5:30PM")
+
+        self.assertEqual(days, (Weekday.TUESDAY, Weekday.THURSDAY))
+        self.assertEqual(start_time, datetime.time(17, 0))
+        self.assertEqual(end_time, datetime.time(17, 30))
+
+    def test_parse_times_around_noon_and_midnight(self) -> None:
+        _, start_time, end_time = InstructionEntry.parse_days_and_times("Sa 12:05am - 12:15pm")
+
+        self.assertEqual(start_time, datetime.time(0, 5))
+        self.assertEqual(end_time, datetime.time(12, 15))
+
+    def test_parse_days_and_times_tba(self) -> None:
+        self.assertEqual(InstructionEntry.parse_days_and_times("TBA"), ((), None, None))
+
+    def test_parse_invalid_time(self) -> None:
+        with self.assertRaises(ValueError):
+            InstructionEntry.parse_days_and_times("Mo 13:00PM - 2:00PM")
+
+    def test_parse_meeting_dates(self) -> None:
+        self.assertEqual(
+            InstructionEntry.parse_meeting_dates("01/25/2025 - 05/22/2025"),
+            (datetime.date(2025, 1, 25), datetime.date(2025, 5, 22)),
+        )
+        self.assertEqual(InstructionEntry.parse_meeting_dates("-"), (None, None))
+
+    def test_parse_location(self) -> None:
+        self.assertEqual(InstructionEntry.parse_location(""), ("", "", ""))
+        self.assertEqual(
+            InstructionEntry.parse_location("Online Synchronous"), ("", "Online Synchronous", "")
+        )
+
+    def test_parsers_are_cached(self) -> None:
+        InstructionEntry.clear_parse_caches()
+        first = InstructionEntry.parse_days_and_times("MoWe 9:15AM - 10:30AM")
+
+        self.assertIs(InstructionEntry.parse_days_and_times("MoWe 9:15AM - 10:30AM"), first)
+        self.assertEqual(InstructionEntry.parse_days_and_times.cache_info().hits, 1)
+
+    def test_unknown_day(self) -> None:
+        with self.assertRaises(ValueError):
+            InstructionEntry.parse_days("TuXx")
+
+
+class MeetsOnTests(TestCase):
+    def setUp(self) -> None:
+        school = School.objects.create(name="Queens College", globalsearch_key="QNS01")
+        term = Term.objects.create(name="Fall Term", year=2024, globalsearch_key="1249")
+        course = Course.objects.create(
+            code="CSCI",
+            level="316",
+            title="Principles of Programming Lang",
+            subject=Subject.objects.create(name="Computer Science", globalsearch_key="CMSC"),
+            career=CourseCareer.objects.create(name="Undergraduate", globalsearch_key="UGRD"),
+            school=school,
+        )
+        course_section = CourseSection.objects.create(
+            gs_unique_id="1", number=43070, section="121-LEC Regular", course=course, term=term
+        )
+        instructor = Instructor.objects.create(name="Jane Doe", school=school)
+
+        for room, days in (("101", "TuTh"), ("102", "MoWe"), ("103", "Tu")):
+            InstructionEntry.objects.create(
+                days_mask=InstructionEntry.encode_days(InstructionEntry.parse_days(days)),
+                room=room,
+                instructor=instructor,
+                course_section=course_section,
+                term=term,
+            )
+
+    def test_meets_on(self) -> None:
+        self.assertEqual(
+            set(InstructionEntry.objects.meets_on("Tu").values_list("room", flat=True)),
+            {"101", "103"},
+        )
+        self.assertEqual(
+            list(InstructionEntry.objects.meets_on("Tu", "Th").values_list("room", flat=True)),
+            ["101"],
+        )
+
+    def test_meets_only_on(self) -> None:
+        self.assertEqual(
+            list(InstructionEntry.objects.meets_only_on("Tu").values_list("room", flat=True)),
+            ["103"],
+        )
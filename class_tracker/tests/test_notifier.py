@@ -0,0 +1,61 @@
+from unittest import mock
+
+from django.test import TestCase
+
+from ..models import ContactInfo, Recipient
+from ..util.notifier import NotificationDispatcher, UndeliverableError
+
+
+class NotificationDispatcherTests(TestCase):
+    def setUp(self) -> None:
+        self.dispatcher = NotificationDispatcher(max_workers=4, send_url="http://join.test/send")
+
+    def create_recipient(self, name: str, *phone_numbers: tuple[str, bool]) -> Recipient:
+        recipient = Recipient.objects.create(name=name)
+        for number, is_enabled in phone_numbers:
+            ContactInfo.objects.create(number=number, owner=recipient, is_enabled=is_enabled)
+        return recipient
+
+    @mock.patch.object(NotificationDispatcher, "_send_join_request")
+    def test_notify_all(self, send_join_request: mock.Mock) -> None:
+        ada = self.create_recipient("Ada", ("5550001", False), ("5550002", True), ("5550003", True))
+        grace = self.create_recipient("Grace", ("5550004", True))
+        unreachable = self.create_recipient("Unreachable", ("5550005", False))
+        myself = Recipient.objects.create(name="Me", is_contact_by_phone=False)
+        recipients = list(Recipient.objects.order_by("id"))
+
+        # the phone numbers of every recipient are read in one query
+        with self.assertNumQueries(1):
+            errors = self.dispatcher.notify_all(
+                [(recipient, f"Hello {recipient.name}") for recipient in recipients]
+            )
+
+        self.assertEqual(
+            [recipient.id for recipient in recipients],
+            [ada.id, grace.id, unreachable.id, myself.id],
+        )
+        self.assertIsNone(errors[0])
+        self.assertIsNone(errors[1])
+        self.assertIsInstance(errors[2], UndeliverableError)
+        self.assertIsNone(errors[3])
+        self.assertCountEqual(
+            [
+                (params.get("smsnumber"), params.get("smstext") or params.get("text"))
+                for params in (call.args[0] for call in send_join_request.call_args_list)
+            ],
+            [("5550002", "Hello Ada"), ("5550004", "Hello Grace"), (None, "Hello Me")],
+        )
+
+    def test_join_api_error(self) -> None:
+        recipient = self.create_recipient("Ada", ("5550001", True))
+        self.dispatcher.session = mock.Mock()
+        self.dispatcher.session.get.return_value.json.return_value = {
+            "success": False,
+            "errorMessage": "Invalid device",
+        }
+
+        [error] = self.dispatcher.notify_all([(recipient, "Hello")])
+
+        self.assertIsInstance(error, ValueError)
+        self.assertIn("Invalid device", str(error))
+        self.assertEqual(self.dispatcher.session.get.call_args.args[0], "http://join.test/send")
@@ -0,0 +1,127 @@
+import datetime
+from dataclasses import replace
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+
+from ..jobs import dispatch_notifications
+from ..models import OutboxNotification, Recipient
+from ..util.notifier import UndeliverableError
+from ..util.outbox import OutboxConfig, drain_outbox
+
+_CONFIG = OutboxConfig(
+    batch_size=2,
+    max_workers=4,
+    max_attempts=3,
+    retry_backoff_seconds=30,
+    max_retry_backoff_seconds=45,
+    lease_seconds=300,
+)
+
+
+@mock.patch("class_tracker.util.notifier.NotificationDispatcher.notify")
+class DrainOutboxTests(TestCase):
+    def setUp(self) -> None:
+        self.ada = Recipient.objects.create(name="Ada")
+        self.grace = Recipient.objects.create(name="Grace")
+
+    def create_notification(self, recipient: Recipient, message: str) -> OutboxNotification:
+        return OutboxNotification.objects.create(recipient=recipient, message=message)
+
+    def test_sends_every_batch(self, notify_recipient: mock.Mock) -> None:
+        for index in range(5):
+            self.create_notification(self.ada, f"Message {index}")
+
+        stats = drain_outbox(_CONFIG)
+
+        self.assertEqual((stats.num_sent, stats.num_retrying, stats.num_failed), (5, 0, 0))
+        self.assertCountEqual(
+            [call.args[1] for call in notify_recipient.call_args_list],
+            [f"Message {index}" for index in range(5)],
+        )
+        for notification in OutboxNotification.objects.all():
+            self.assertEqual(notification.status, OutboxNotification.StatusChoices.SENT)
+            self.assertEqual(notification.num_attempts, 1)
+            self.assertIsNotNone(notification.datetime_sent)
+
+    def test_retries_with_backoff(self, notify_recipient: mock.Mock) -> None:
+        notification = self.create_notification(self.ada, "Hello")
+        notify_recipient.side_effect = ConnectionError("reset")
+
+        for num_attempts, backoff_seconds in ((1, 30), (2, 45)):
+            stats = drain_outbox(_CONFIG)
+            self.assertEqual(stats.num_retrying, 1)
+
+            notification.refresh_from_db()
+            self.assertEqual(notification.status, OutboxNotification.StatusChoices.PENDING)
+            self.assertEqual(notification.num_attempts, num_attempts)
+            self.assertEqual(notification.error, "reset")
+            self.assertEqual(
+                notification.datetime_next_attempt - notification.datetime_modified,
+                datetime.timedelta(seconds=backoff_seconds),
+            )
+
+            # not due yet
+            self.assertEqual(drain_outbox(_CONFIG).num_retrying, 0)
+            OutboxNotification.objects.update(datetime_next_attempt=timezone.now())
+
+        notify_recipient.side_effect = None
+        self.assertEqual(drain_outbox(_CONFIG).num_sent, 1)
+        self.assertEqual(notify_recipient.call_count, 3)
+
+    def test_gives_up(self, notify_recipient: mock.Mock) -> None:
+        notification = self.create_notification(self.ada, "Hello")
+        undeliverable = self.create_notification(self.grace, "Hello")
+
+        def fail(recipient: Recipient, _message: str) -> None:
+            if recipient == self.grace:
+                raise UndeliverableError("no phone")
+            raise ValueError("500")
+
+        notify_recipient.side_effect = fail
+
+        stats = drain_outbox(replace(_CONFIG, max_attempts=1))
+
+        self.assertEqual((stats.num_sent, stats.num_retrying, stats.num_failed), (0, 0, 2))
+        notification.refresh_from_db()
+        undeliverable.refresh_from_db()
+        self.assertEqual(notification.status, OutboxNotification.StatusChoices.FAILED)
+        self.assertEqual(undeliverable.status, OutboxNotification.StatusChoices.FAILED)
+        self.assertEqual(undeliverable.error, "no phone")
+
+    def test_reclaims_abandoned_sends(self, notify_recipient: mock.Mock) -> None:
+        notification = self.create_notification(self.ada, "Hello")
+        OutboxNotification.objects.update(
+            status=OutboxNotification.StatusChoices.SENDING, num_attempts=1
+        )
+
+        self.assertEqual(drain_outbox(_CONFIG).num_sent, 0)
+        OutboxNotification.objects.update(
+            datetime_modified=timezone.now() - datetime.timedelta(seconds=301)
+        )
+        self.assertEqual(drain_outbox(_CONFIG).num_sent, 1)
+
+        notification.refresh_from_db()
+        self.assertEqual(notification.num_attempts, 2)
+        notify_recipient.assert_called_once()
+
+
+class DispatchNotificationsTests(TestCase):
+    def setUp(self) -> None:
+        self.ada = Recipient.objects.create(name="Ada")
+
+    @mock.patch("class_tracker.jobs.enqueue_notification_dispatch")
+    @mock.patch(
+        "class_tracker.util.notifier.NotificationDispatcher.notify", side_effect=ValueError("500")
+    )
+    def test_dispatch_schedules_retry(
+        self, notify_recipient: mock.Mock, enqueue: mock.Mock
+    ) -> None:
+        OutboxNotification.objects.create(recipient=self.ada, message="Hello")
+
+        dispatch_notifications()
+
+        notify_recipient.assert_called_once()
+        notification = OutboxNotification.objects.get()
+        enqueue.assert_called_once_with(when=notification.datetime_next_attempt)
@@ -0,0 +1,102 @@
+import time
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from ..benchmarks.synthetic import generate_results_page
+from ..global_search.parse_pool import ParsePool
+from ..global_search.parser import parse_class_list_page
+from ..global_search.typedefs import GSCourse
+
+
+def _get_section_fingerprints(gs_courses: list[GSCourse]) -> list[str]:
+    return [
+        gs_course_section.get_fingerprint(gs_course.get_name())
+        for gs_course in gs_courses
+        for gs_course_section in gs_course.sections
+    ]
+
+
+class ParsePoolTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.page_srcs = [generate_results_page(30, seed=seed) for seed in range(3)]
+        self.expected_fingerprints = [
+            _get_section_fingerprints(parse_class_list_page(page_src))
+            for page_src in self.page_srcs
+        ]
+
+    def test_parses_in_process(self) -> None:
+        with ParsePool(0) as parse_pool:
+            results = list(parse_pool.map(self.page_srcs))
+
+        self.assertEqual(
+            [_get_section_fingerprints(gs_courses) for gs_courses in results],
+            self.expected_fingerprints,
+        )
+
+    def test_parses_in_worker_processes(self) -> None:
+        with ParsePool(2) as parse_pool:
+            results = list(parse_pool.map(self.page_srcs))
+
+        self.assertEqual(
+            [_get_section_fingerprints(gs_courses) for gs_courses in results],
+            self.expected_fingerprints,
+        )
+
+    def test_parse_errors_are_raised(self) -> None:
+        with (
+            ParsePool(0) as parse_pool,
+            mock.patch(
+                "class_tracker.global_search.parse_pool.parse_class_list_page",
+                side_effect=ValueError("No next sibling found"),
+            ),
+            self.assertRaises(ValueError),
+        ):
+            parse_pool.parse(self.page_srcs[0])
+
+    def test_falls_back_in_process_when_a_worker_dies(self) -> None:
+        parse_pool = ParsePool(2)
+        self.addCleanup(parse_pool.close)
+        broken_future = mock.Mock()
+        broken_future.result.side_effect = BrokenProcessPool("worker died")
+
+        with mock.patch.object(parse_pool, "submit", return_value=broken_future):
+            gs_courses = parse_pool.parse(self.page_srcs[0])
+
+        self.assertEqual(_get_section_fingerprints(gs_courses), self.expected_fingerprints[0])
+        self.assertEqual(parse_pool.num_workers, 0)
+
+    def test_falls_back_in_process_when_cancelled_by_another_fallback(self) -> None:
+        parse_pool = ParsePool(2)
+        self.addCleanup(parse_pool.close)
+        cancelled_future = mock.Mock()
+        cancelled_future.result.side_effect = CancelledError()
+
+        with mock.patch.object(parse_pool, "submit", return_value=cancelled_future):
+            gs_courses = parse_pool.parse(self.page_srcs[0])
+
+        self.assertEqual(_get_section_fingerprints(gs_courses), self.expected_fingerprints[0])
+        self.assertEqual(parse_pool.num_workers, 0)
+
+    def test_threads_share_one_executor(self) -> None:
+        parse_pool = ParsePool(2)
+        self.addCleanup(parse_pool.close)
+
+        def start_executor(**_kwargs: Any) -> mock.Mock:
+            time.sleep(0.01)  # widen the window for threads racing to start their own
+            return mock.Mock()
+
+        with (
+            mock.patch(
+                "class_tracker.global_search.parse_pool.ProcessPoolExecutor",
+                side_effect=start_executor,
+            ) as process_pool_executor,
+            ThreadPoolExecutor(max_workers=8) as thread_pool,
+        ):
+            executors = list(thread_pool.map(lambda _: parse_pool._get_executor(), range(32)))  # noqa: SLF001
+
+        process_pool_executor.assert_called_once()
+        self.assertEqual({id(executor) for executor in executors}, {id(executors[0])})
@@ -0,0 +1,80 @@
+import threading
+import time
+
+from django.test import SimpleTestCase
+
+from ..util.polling import PollingConfig, run_concurrently
+
+
+def _get_config(**overrides: float) -> PollingConfig:
+    config_values: dict[str, float] = {
+        "max_workers": 8,
+        "max_connections_per_host": 4,
+        "deadline_seconds": 5,
+        "group_timeout_seconds": 5,
+        "request_timeout_seconds": 1,
+    }
+    config_values.update(overrides)
+    return PollingConfig(
+        max_workers=int(config_values["max_workers"]),
+        max_connections_per_host=int(config_values["max_connections_per_host"]),
+        deadline_seconds=config_values["deadline_seconds"],
+        group_timeout_seconds=config_values["group_timeout_seconds"],
+        request_timeout_seconds=config_values["request_timeout_seconds"],
+    )
+
+
+class RunConcurrentlyTests(SimpleTestCase):
+    def test_runs_items_in_parallel_up_to_host_cap(self) -> None:
+        lock = threading.Lock()
+        in_flight = 0
+        max_in_flight = 0
+
+        def worker(item: int) -> int:
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+            return item * 2
+
+        results = run_concurrently(
+            list(range(12)), worker, describe=str, config=_get_config(max_connections_per_host=3)
+        )
+
+        self.assertEqual(sorted(results), [i * 2 for i in range(12)])
+        self.assertEqual(max_in_flight, 3)
+
+    def test_failed_and_slow_items_are_skipped(self) -> None:
+        def worker(item: int) -> int:
+            if item == 1:
+                raise ValueError("bad page")
+            if item == 2:  # noqa: PLR2004
+                time.sleep(1)
+            return item
+
+        started = time.monotonic()
+        results = run_concurrently(
+            [0, 1, 2, 3], worker, describe=str, config=_get_config(group_timeout_seconds=0.2)
+        )
+
+        self.assertEqual(sorted(results), [0, 3])
+        self.assertLess(time.monotonic() - started, 0.9)
+
+    def test_deadline_bounds_the_whole_cycle(self) -> None:
+        def worker(item: int) -> int:
+            time.sleep(0.3)
+            return item
+
+        started = time.monotonic()
+        results = run_concurrently(
+            list(range(10)),
+            worker,
+            describe=str,
+            config=_get_config(max_connections_per_host=1, deadline_seconds=0.5),
+        )
+
+        self.assertLess(len(results), 10)
+        self.assertLess(time.monotonic() - started, 1)
@@ -0,0 +1,163 @@
+import functools
+import os
+import unittest
+from unittest import mock
+
+import redis
+from django.test import SimpleTestCase
+from requests import ConnectionError as RequestsConnectionError
+from requests import Response, Session
+
+from server.util import get_redis_connection
+
+from ..global_search import navigator
+from ..global_search.rate_limiter import (
+    AdaptiveRateLimiter,
+    RateLimitConfig,
+    RateLimitTimeoutError,
+)
+
+_CONFIG = RateLimitConfig(
+    initial_rate=1,
+    min_rate=0.25,
+    max_rate=2,
+    burst=2,
+    target_latency_seconds=1,
+    slow_latency_seconds=5,
+    increase_step=0.5,
+)
+
+
+@functools.cache
+def is_redis_available() -> bool:
+    try:
+        return bool(get_redis_connection().ping())
+    except redis.RedisError:
+        return False
+
+
+# CI runs next to the scheduler's Redis server: there the tests that need it fail when it cannot be
+# reached instead of being skipped
+requires_redis = unittest.skipUnless(
+    os.environ.get("CI", "").lower() == "true" or is_redis_available(),
+    "needs the scheduler's Redis server",
+)
+
+
+class AdaptiveRateLimiterTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.limiter = AdaptiveRateLimiter("test:rate_limit", _CONFIG)
+
+        patcher = mock.patch("class_tracker.global_search.rate_limiter.get_redis_connection")
+        self.redis_connection = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+
+    def test_fails_open_without_redis(self) -> None:
+        self.redis_connection.eval.side_effect = redis.ConnectionError("refused")
+
+        self.limiter.acquire(timeout=1)
+        self.limiter.record_response(0.1, 200)
+        self.limiter.record_failure()
+
+        # Redis is left alone until the retry interval passes
+        self.assertEqual(self.redis_connection.eval.call_count, 1)
+
+    def test_waits_for_token(self) -> None:
+        self.redis_connection.eval.side_effect = ["0.2", "0"]
+
+        with mock.patch("class_tracker.global_search.rate_limiter.time.sleep") as sleep:
+            self.limiter.acquire(timeout=1)
+
+        sleep.assert_called_once_with(0.2)
+
+    def test_times_out_when_no_token_in_time(self) -> None:
+        self.redis_connection.eval.return_value = "5"
+
+        with self.assertRaises(RateLimitTimeoutError):
+            self.limiter.acquire(timeout=1)
+
+    def test_adjusts_rate_from_responses(self) -> None:
+        def get_direction() -> str | None:
+            if not self.redis_connection.eval.called:
+                return None
+            direction: str = self.redis_connection.eval.call_args.args[3]
+            self.redis_connection.eval.reset_mock()
+            return direction
+
+        self.limiter.record_response(0.5, 200)
+        self.assertEqual(get_direction(), "increase")
+
+        self.limiter.record_response(2, 200)  # between target & slow latency, keep the rate
+        self.assertIsNone(get_direction())
+
+        self.limiter.record_response(6, 200)
+        self.assertEqual(get_direction(), "decrease")
+
+        self.limiter.record_response(0.5, 503)
+        self.assertEqual(get_direction(), "decrease")
+
+    def test_disabled_limiter_skips_redis(self) -> None:
+        limiter = AdaptiveRateLimiter("test:rate_limit", _CONFIG, is_enabled=False)
+
+        limiter.acquire(timeout=1)
+        limiter.record_response(0.5, 200)
+
+        self.redis_connection.eval.assert_not_called()
+
+
+class NavigatorRateLimitTests(SimpleTestCase):
+    def setUp(self) -> None:
+        patcher = mock.patch.object(navigator, "rate_limiter")
+        self.rate_limiter = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch.object(navigator, "circuit_breaker")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_requests_go_through_limiter(self) -> None:
+        response = Response()
+        response.status_code = 200
+        response._content = b"<html></html>"  # noqa: SLF001
+        session = mock.Mock(spec=Session, headers={})
+        session.request.return_value = response
+
+        self.assertEqual(navigator.get_main_page(session, timeout=3), "<html></html>")
+
+        self.rate_limiter.acquire.assert_called_once_with(timeout=3)
+        self.rate_limiter.record_response.assert_called_once()
+        self.assertEqual(self.rate_limiter.record_response.call_args.args[1], 200)
+
+    def test_connection_errors_back_off(self) -> None:
+        session = mock.Mock(spec=Session, headers={})
+        session.request.side_effect = RequestsConnectionError("reset")
+
+        with self.assertRaises(RequestsConnectionError):
+            navigator.get_main_page(session)
+
+        self.rate_limiter.record_failure.assert_called_once_with()
+        self.rate_limiter.record_response.assert_not_called()
+
+
+@requires_redis
+class RedisRateLimiterTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.limiter = AdaptiveRateLimiter("class_tracker:test:rate_limit", _CONFIG)
+        self.limiter.reset()
+        self.addCleanup(self.limiter.reset)
+
+    def test_burst_then_wait(self) -> None:
+        self.limiter.acquire(timeout=0)
+        self.limiter.acquire(timeout=0)
+
+        with self.assertRaises(RateLimitTimeoutError):
+            self.limiter.acquire(timeout=0)
+
+    def test_rate_stays_within_bounds(self) -> None:
+        for _ in range(10):
+            self.limiter.record_response(0.1, 200)
+        self.assertEqual(self.limiter.get_rate(), _CONFIG.max_rate)
+
+        for _ in range(10):
+            self.limiter.record_failure()
+        self.assertEqual(self.limiter.get_rate(), _CONFIG.min_rate)
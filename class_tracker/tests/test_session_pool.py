@@ -0,0 +1,56 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+from requests import Session
+
+from ..global_search.navigator import SessionExpiredError, is_session_expired_page
+from ..global_search.session_pool import GlobalSearchSessionPool
+from ..models import School, Term
+
+
+class SessionPoolTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.pool = GlobalSearchSessionPool(max_idle_per_key=2, max_age_seconds=600)
+        self.school = School(name="Queens College", globalsearch_key="QNS01")
+        self.term = Term(name="Fall Term", year=2024, globalsearch_key="1249")
+
+        patcher = mock.patch(
+            "class_tracker.global_search.session_pool.get_subject_selection_page",
+            return_value="<html>subjects</html>",
+        )
+        self.get_subject_selection_page = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_reuses_warmed_session(self) -> None:
+        sessions: list[Session] = []
+        for _ in range(3):
+            self.pool.run(self.school, self.term, sessions.append)
+
+        self.assertEqual(self.get_subject_selection_page.call_count, 1)
+        self.assertEqual(len({id(session) for session in sessions}), 1)
+
+    def test_rewarms_expired_session(self) -> None:
+        calls: list[Session] = []
+
+        def callback(session: Session) -> str:
+            calls.append(session)
+            if len(calls) == 1:
+                raise SessionExpiredError
+            return "results"
+
+        self.assertEqual(self.pool.run(self.school, self.term, callback), "results")
+        self.assertEqual(self.get_subject_selection_page.call_count, 2)
+
+    def test_discards_session_after_error(self) -> None:
+        def callback(_session: Session) -> None:
+            raise ValueError
+
+        with self.assertRaises(ValueError):
+            self.pool.run(self.school, self.term, callback)
+        self.pool.run(self.school, self.term, lambda _session: None)
+
+        self.assertEqual(self.get_subject_selection_page.call_count, 2)
+
+    def test_detects_expired_page(self) -> None:
+        self.assertTrue(is_session_expired_page('<input name="inst_selection" value="QNS01">'))
+        self.assertFalse(is_session_expired_page('<span class="testing_msg">CSCI 316</span>'))
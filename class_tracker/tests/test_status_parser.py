@@ -0,0 +1,122 @@
+from typing import Any
+from unittest import mock
+
+from bs4 import BeautifulSoup
+from django.test import SimpleTestCase
+
+from ..global_search.parser import find_open_sections, parse_gs_courses, parse_section_statuses
+from ..global_search.session_pool import session_pool
+from ..models import CourseCareer, School, Subject, Term
+
+_SECTION_ROW_TEMPLATE = """
+<tr>
+  <td data-label="Class"><a href="https://globalsearch.cuny.edu/CFGlobalSearchTool/CFSearchToolController?class_number_searched=Q{number}">{number}</a></td>
+  <td data-label="Section"><a href="#">0{index}-LEC Regular</a></td>
+  <td data-label="DaysAndTimes">TuTh 10:45AM - 12:00PM</td>
+  <td data-label="Room">Science Building C205</td>
+  <td data-label="Instructor">Jane Doe</td>
+  <td data-label="Instruction Mode">In Person</td>
+  <td data-label="Meeting Dates">08/26/2024 - 12/18/2024</td>
+  <td data-label="Status"><img src="/img/{status}.png" alt="{status}" title="{status}"></td>
+  <td data-label="Course Topic"></td>
+</tr>
+"""
+
+_PAGE_TEMPLATE = """
+<html><body>
+<div id="contentDiv0">
+  <span class="testing_msg">&nbsp;CSCI 316 - Principles of Programming Languages</span>
+  <div id="contentDivImg0">
+    <table class="classinfo">
+      <thead><tr><th>Class</th><th>Section</th><th>Status</th></tr></thead>
+      <tbody>{rows}</tbody>
+    </table>
+  </div>
+</div>
+</body></html>
+"""
+
+
+def _get_results_page(statuses: list[str]) -> str:
+    rows = "".join(
+        _SECTION_ROW_TEMPLATE.format(number=40000 + index, index=index, status=status)
+        for index, status in enumerate(statuses)
+    )
+    return _PAGE_TEMPLATE.format(rows=rows)
+
+
+class StatusParserTests(SimpleTestCase):
+    def test_matches_full_parser(self) -> None:
+        page_src = _get_results_page(["Open", "Closed", "wait", "Open"])
+
+        full_parser_statuses = {
+            section.number: section.status
+            for course in parse_gs_courses(BeautifulSoup(page_src, "lxml"))
+            for section in course.sections
+        }
+
+        self.assertEqual(parse_section_statuses(page_src), full_parser_statuses)
+        self.assertEqual(
+            parse_section_statuses(page_src),
+            {40000: "Open", 40001: "Closed", 40002: "wait", 40003: "Open"},
+        )
+
+    def test_page_without_results(self) -> None:
+        self.assertEqual(parse_section_statuses("<html><body></body></html>"), {})
+        self.assertEqual(parse_section_statuses(""), {})
+
+    def test_missing_status_indicator(self) -> None:
+        page_src = _get_results_page(["Open"]).replace('alt="Open" title="Open"', "")
+
+        with self.assertRaises(ValueError):
+            parse_section_statuses(page_src)
+
+
+class FindOpenSectionsTests(SimpleTestCase):
+    def setUp(self) -> None:
+        session_pool.clear()
+
+    def _find_open_sections(self, pages_by_filter: dict[bool, str]) -> tuple[set[int], list[bool]]:
+        requested_filters: list[bool] = []
+
+        def get_classlist_result_page(
+            *_args: Any, open_classes_only: bool = False, **_kwargs: Any
+        ) -> str:
+            requested_filters.append(open_classes_only)
+            return pages_by_filter[open_classes_only]
+
+        with (
+            mock.patch(
+                "class_tracker.global_search.session_pool.get_subject_selection_page",
+                return_value="",
+            ),
+            mock.patch(
+                "class_tracker.global_search.parser.get_classlist_result_page",
+                side_effect=get_classlist_result_page,
+            ),
+        ):
+            open_sections = find_open_sections(
+                {40000, 40001, 40002},
+                School(name="Queens College", globalsearch_key="QNS01"),
+                Term(name="Fall Term", year=2024, globalsearch_key="1249"),
+                Subject(name="Computer Science", globalsearch_key="CMSC"),
+                CourseCareer(name="Undergraduate", globalsearch_key="UGRD"),
+            )
+
+        return open_sections, requested_filters
+
+    def test_uses_open_classes_only_listing(self) -> None:
+        open_sections, requested_filters = self._find_open_sections(
+            {True: _get_results_page(["Closed", "Open"])}
+        )
+
+        self.assertEqual(open_sections, {40001})
+        self.assertEqual(requested_filters, [True])
+
+    def test_falls_back_to_full_listing_when_empty(self) -> None:
+        open_sections, requested_filters = self._find_open_sections(
+            {True: "<html><body></body></html>", False: _get_results_page(["Open", "Closed"])}
+        )
+
+        self.assertEqual(open_sections, {40000})
+        self.assertEqual(requested_filters, [True, False])
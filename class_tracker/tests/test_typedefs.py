@@ -0,0 +1,58 @@
+from dataclasses import FrozenInstanceError
+
+from bs4 import BeautifulSoup
+from django.test import SimpleTestCase
+
+from ..benchmarks.synthetic import generate_results_page
+from ..global_search.parser import parse_gs_courses
+from ..global_search.typedefs import GSCourse
+
+
+class GSCourseTests(SimpleTestCase):
+    def test_from_full_title(self) -> None:
+        gs_course = GSCourse.from_full_title("CSCI  331 - Database Systems", [])
+
+        self.assertEqual(gs_course.get_name(), "CSCI 331")
+        self.assertEqual(gs_course.title, "Database Systems")
+        self.assertEqual(gs_course.sections, ())
+
+    def test_from_bad_full_title(self) -> None:
+        with self.assertRaises(ValueError):
+            GSCourse.from_full_title("Database Systems", [])
+
+
+class ParsedGSObjectTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.gs_courses = parse_gs_courses(BeautifulSoup(generate_results_page(60), "lxml"))
+        self.gs_course_sections = [
+            gs_course_section
+            for gs_course in self.gs_courses
+            for gs_course_section in gs_course.sections
+        ]
+
+    def test_are_slotted_and_frozen(self) -> None:
+        gs_course_section = self.gs_course_sections[0]
+        gs_object_fields = [
+            (self.gs_courses[0], "title"),
+            (gs_course_section, "topic"),
+            (gs_course_section.instruction_entries[0], "room"),
+        ]
+
+        for gs_object, field_name in gs_object_fields:
+            self.assertFalse(hasattr(gs_object, "__dict__"))
+            with self.assertRaises(FrozenInstanceError):
+                setattr(gs_object, field_name, "")
+
+    def test_repeated_strings_are_shared(self) -> None:
+        instructor_to_ids: dict[str, set[int]] = {}
+        for gs_course_section in self.gs_course_sections:
+            for gs_instruction_entry in gs_course_section.instruction_entries:
+                instructor = gs_instruction_entry.instructor
+                instructor_to_ids.setdefault(instructor, set()).add(id(instructor))
+
+        self.assertLess(len(instructor_to_ids), len(self.gs_course_sections))
+        self.assertTrue(all(len(ids) == 1 for ids in instructor_to_ids.values()))
+        self.assertEqual(
+            len({id(gs_course_section.status) for gs_course_section in self.gs_course_sections}),
+            len({gs_course_section.status for gs_course_section in self.gs_course_sections}),
+        )
@@ -0,0 +1,239 @@
+from dataclasses import replace
+from unittest import mock
+
+from bs4 import BeautifulSoup
+from django.test import TestCase, override_settings
+
+from ..benchmarks.synthetic import generate_results_page
+from ..global_search.circuit_breaker import CircuitOpenError
+from ..global_search.parser import parse_gs_courses
+from ..global_search.rate_limiter import RateLimitTimeoutError
+from ..jobs import check_for_open_sections
+from ..models import (
+    ClassAlert,
+    CourseCareer,
+    CourseSection,
+    OutboxNotification,
+    Recipient,
+    School,
+    Subject,
+    Term,
+    WatchIndexEntry,
+)
+from ..util import (
+    create_db_courses,
+    get_grouped_watched_sections_for_search,
+    group_open_sections_by_recipient,
+)
+from ..util.alert_ledger import AlertLedger
+from ..util.reference_rows import clear_reference_row_caches, school_cache, subject_cache
+from .test_rate_limiter import is_redis_available
+
+
+class WatchIndexTests(TestCase):
+    def setUp(self) -> None:
+        clear_reference_row_caches()
+        self.school = School.objects.create(name="Queens College", globalsearch_key="QNS01")
+        self.term = Term.objects.create(name="Fall Term", globalsearch_key="1249", year=2024)
+        self.career = CourseCareer.objects.create(name="Undergraduate", globalsearch_key="UGRD")
+        self.subject = Subject.objects.create(name="Computer Science", globalsearch_key="CMSC")
+
+        self.gs_courses = parse_gs_courses(BeautifulSoup(generate_results_page(20), "lxml"))
+        self.sync()
+        self.course_sections = list(CourseSection.objects.order_by("number"))
+        self.ada = Recipient.objects.create(name="Ada")
+        self.grace = Recipient.objects.create(name="Grace")
+
+        # keep the alerts of these tests out of the ledger the scheduler uses
+        alert_ledger = AlertLedger("class_tracker:test:watch_index:alert_ledger")
+        patcher = mock.patch("class_tracker.jobs.alert_ledger", alert_ledger)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        if is_redis_available():
+            alert_ledger.reset()
+            self.addCleanup(alert_ledger.reset)
+
+    def sync(self) -> None:
+        create_db_courses(self.gs_courses, self.subject, self.career, self.school, self.term)
+
+    def get_index(self) -> set[tuple[int, int, int]]:
+        return set(
+            WatchIndexEntry.objects.values_list(
+                "recipient_id", "course_section_id", "section_number"
+            )
+        )
+
+    def get_watched(self) -> set[tuple[int, int, int]]:
+        return {
+            (recipient.id, course_section.id, course_section.number)
+            for recipient in Recipient.objects.prefetch_related("watched_sections")
+            for course_section in recipient.watched_sections.all()
+        }
+
+    def test_follows_watched_sections_from_both_sides(self) -> None:
+        first, second, third = self.course_sections[:3]
+
+        self.ada.watched_sections.add(first, second)
+        third.watched_by.add(self.ada, self.grace)
+        self.assertEqual(len(self.get_index()), 4)
+        self.assertEqual(self.get_index(), self.get_watched())
+
+        self.ada.watched_sections.remove(second)
+        third.watched_by.remove(self.grace)
+        self.assertEqual(self.get_index(), self.get_watched())
+
+        self.grace.watched_sections.set([first, second])
+        third.watched_by.clear()
+        self.assertEqual(self.get_index(), self.get_watched())
+
+        self.ada.watched_sections.clear()
+        self.grace.delete()
+        self.assertEqual(self.get_index(), set())
+
+    def test_entries_carry_search_group(self) -> None:
+        self.ada.watched_sections.add(self.course_sections[0])
+
+        watch_index_entry = WatchIndexEntry.objects.get()
+        self.assertEqual(
+            (
+                watch_index_entry.school,
+                watch_index_entry.term,
+                watch_index_entry.subject,
+                watch_index_entry.career,
+            ),
+            (self.school, self.term, self.subject, self.career),
+        )
+
+    def test_rebuild(self) -> None:
+        self.ada.watched_sections.add(*self.course_sections[:5])
+        self.grace.watched_sections.add(*self.course_sections[3:8])
+        index = self.get_index()
+        WatchIndexEntry.objects.all().delete()
+
+        self.assertEqual(WatchIndexEntry.rebuild(), 10)
+        self.assertEqual(self.get_index(), index)
+
+    def test_renumbered_section_is_reindexed(self) -> None:
+        course_section = self.course_sections[0]
+        self.ada.watched_sections.add(course_section)
+
+        gs_course = next(
+            gs_course
+            for gs_course in self.gs_courses
+            if any(
+                gs_course_section.unique_id == course_section.gs_unique_id
+                for gs_course_section in gs_course.sections
+            )
+        )
+        self.gs_courses[self.gs_courses.index(gs_course)] = replace(
+            gs_course,
+            sections=tuple(
+                replace(gs_course_section, number=99999)
+                if gs_course_section.unique_id == course_section.gs_unique_id
+                else gs_course_section
+                for gs_course_section in gs_course.sections
+            ),
+        )
+        self.sync()
+
+        self.assertEqual(self.get_index(), {(self.ada.id, course_section.id, 99999)})
+
+    def test_search_groups_take_constant_queries(self) -> None:
+        self.ada.watched_sections.add(*self.course_sections[:5])
+        recipients = [self.ada]
+        for index in range(10):
+            recipient = Recipient.objects.create(name=f"Recipient {index}")
+            recipient.watched_sections.add(*self.course_sections[index : index + 3])
+            recipients.append(recipient)
+
+        with self.assertNumQueries(5):
+            [search_group] = get_grouped_watched_sections_for_search()
+        # the reference rows are cached, leaving the single aggregate query
+        with self.assertNumQueries(1):
+            self.assertEqual(get_grouped_watched_sections_for_search(), [search_group])
+
+        self.assertEqual(
+            (search_group.school, search_group.term, search_group.subject, search_group.career),
+            (self.school, self.term, self.subject, self.career),
+        )
+        self.assertEqual(
+            search_group.section_numbers,
+            [course_section.number for course_section in self.course_sections[:12]],
+        )
+        self.assertEqual(search_group.recipient_ids, [recipient.id for recipient in recipients])
+
+    def test_search_groups_skip_deleted_reference_rows(self) -> None:
+        self.ada.watched_sections.add(self.course_sections[0])
+
+        # the subject is deleted between the aggregate query and reading the reference rows
+        with mock.patch.object(subject_cache, "get_many", return_value={}):
+            self.assertEqual(get_grouped_watched_sections_for_search(), [])
+
+    def test_reference_row_cache_expires(self) -> None:
+        with self.assertNumQueries(1):
+            self.assertEqual(school_cache.get_many([self.school.id]), {self.school.id: self.school})
+        with self.assertNumQueries(0):
+            school_cache.get_many([self.school.id])
+        with (
+            override_settings(CLASS_TRACKER_POLL_REFERENCE_CACHE_SECONDS=-1),
+            self.assertNumQueries(1),
+        ):
+            school_cache.get_many([self.school.id])
+
+    def test_group_open_sections_by_recipient(self) -> None:
+        first, second, third = self.course_sections[:3]
+        self.ada.watched_sections.add(first, second)
+        self.grace.watched_sections.add(second, third)
+        [search_group] = get_grouped_watched_sections_for_search()
+
+        recipient_to_sections = group_open_sections_by_recipient(
+            [(search_group, {second.number, third.number, 12345})]
+        )
+
+        self.assertEqual(recipient_to_sections, {self.ada: [second], self.grace: [second, third]})
+        self.assertEqual(group_open_sections_by_recipient([(search_group, set())]), {})
+
+    @mock.patch("class_tracker.jobs.enqueue_notification_dispatch")
+    @mock.patch("class_tracker.jobs.find_open_sections")
+    def test_check_for_open_sections(
+        self, find_open_sections: mock.Mock, enqueue_notification_dispatch: mock.Mock
+    ) -> None:
+        first, second = self.course_sections[:2]
+        self.ada.watched_sections.add(first)
+        self.grace.watched_sections.add(second)
+        find_open_sections.return_value = {second.number}
+
+        with self.captureOnCommitCallbacks(execute=True):
+            check_for_open_sections()
+
+        find_open_sections.assert_called_once()
+        self.assertEqual(find_open_sections.call_args.args[0], {first.number, second.number})
+        # the alert & its notification are written together, and sent once that commits
+        self.assertEqual(
+            list(ClassAlert.objects.values_list("recipient_id", "course_section_id")),
+            [(self.grace.id, second.id)],
+        )
+        notification = OutboxNotification.objects.get()
+        self.assertEqual(notification.recipient, self.grace)
+        self.assertIn(second.course.code, notification.message)
+        enqueue_notification_dispatch.assert_called_once_with()
+
+    @mock.patch("class_tracker.jobs.enqueue_notification_dispatch")
+    @mock.patch("class_tracker.jobs.find_open_sections")
+    def test_check_for_open_sections_while_globalsearch_unavailable(
+        self, find_open_sections: mock.Mock, enqueue_notification_dispatch: mock.Mock
+    ) -> None:
+        self.ada.watched_sections.add(self.course_sections[0])
+
+        for ex in (CircuitOpenError("open"), RateLimitTimeoutError("no token")):
+            find_open_sections.side_effect = ex
+            with self.subTest(ex=ex), self.assertLogs("main", "WARNING") as logs:
+                check_for_open_sections()
+
+                # logged as a single warning, not as an error with a traceback
+                [record] = logs.records
+                self.assertEqual(record.levelname, "WARNING")
+                self.assertIn(str(ex), record.getMessage())
+
+        self.assertFalse(ClassAlert.objects.exists())
+        enqueue_notification_dispatch.assert_not_called()
@@ -34,6 +34,7 @@ ajax_urlpatterns = [
         ajax.fetch_new_semester_course_sections,
         name="fetch_new_semester_course_sections",
     ),
+    path("get_catalog_crawl/<int:crawl_id>/", ajax.get_catalog_crawl, name="get_catalog_crawl"),
     path(
         "get_recipient_form/<int:recipient_id>/", ajax.get_recipient_form, name="get_recipient_form"
     ),
@@ -1,12 +1,21 @@
 import logging
 from collections import defaultdict
-from dataclasses import dataclass
-from typing import Any
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from typing import Any, NamedTuple
 
-from server.util import atomic_get_or_create, bulk_create_and_get
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
 
-from ..global_search.typedefs import GSCourse
+from server.util import bulk_create_and_get, bulk_upsert
+
+from ..global_search.parser import get_page_fingerprint, parse_class_list_page
+from ..global_search.typedefs import GSCourse, GSCourseSection
 from ..models import (
+    CatalogChange,
+    ClassListFingerprint,
     Course,
     CourseCareer,
     CourseSection,
@@ -16,12 +25,13 @@ from ..models import (
     School,
     Subject,
     Term,
+    WatchIndexEntry,
 )
+from .reference_rows import career_cache, school_cache, subject_cache, term_cache
 
 logger = logging.getLogger("main")
 
 TNameToInstructorMap = dict[str, Instructor]
-TSearchGroupKey = tuple[School, Term, Subject, CourseCareer]
 
 
 @dataclass
@@ -31,74 +41,151 @@ class SearchGroup:
     subject: Subject
     career: CourseCareer
     section_numbers: list[int]
-    recipients: list[Recipient]
+    recipient_ids: list[int]
 
 
 def get_grouped_watched_sections_for_search() -> list[SearchGroup]:
     """
-    Group recipients watched sections by (school, term, subject, career)
+    Group the watched section numbers by (school, term, subject, career)
     to minimize the number of calls to `search_for_classes`
-    """
-    from class_tracker.models import Recipient
 
-    search_groups: defaultdict[TSearchGroupKey, dict[str, Any]] = defaultdict(
-        lambda: {"section_numbers": set(), "recipients": set()}
+    A single aggregate query over the watch index, however many recipients there are; the schools,
+    terms, subjects & careers of the groups come from per-process caches.
+    """
+    search_group_rows = list(
+        WatchIndexEntry.objects.values("school_id", "term_id", "subject_id", "career_id")
+        .annotate(
+            section_numbers=ArrayAgg("section_number", distinct=True, ordering="section_number"),
+            recipient_ids=ArrayAgg("recipient_id", distinct=True, ordering="recipient_id"),
+        )
+        .order_by()
     )
 
-    for recipient in Recipient.objects.prefetch_related(
-        "watched_sections__course__school",
-        "watched_sections__course__subject",
-        "watched_sections__course__career",
-        "watched_sections__term",
-    ).all():
-        for section in recipient.watched_sections.all():
-            course = section.course
-            key = (course.school, section.term, course.subject, course.career)
-
-            search_groups[key]["section_numbers"].add(section.number)
-            search_groups[key]["recipients"].add(recipient)
-
-    results: list[SearchGroup] = []
-    for key, data in search_groups.items():
-        school, term, subject, career = key
-        search_group = SearchGroup(
-            school=school,
-            term=term,
-            subject=subject,
-            career=career,
-            section_numbers=list(data["section_numbers"]),
-            recipients=list(data["recipients"]),
+    id_to_school = school_cache.get_many(row["school_id"] for row in search_group_rows)
+    id_to_term = term_cache.get_many(row["term_id"] for row in search_group_rows)
+    id_to_subject = subject_cache.get_many(row["subject_id"] for row in search_group_rows)
+    id_to_career = career_cache.get_many(row["career_id"] for row in search_group_rows)
+
+    search_groups: list[SearchGroup] = []
+    for row in search_group_rows:
+        school = id_to_school.get(row["school_id"])
+        term = id_to_term.get(row["term_id"])
+        subject = id_to_subject.get(row["subject_id"])
+        career = id_to_career.get(row["career_id"])
+        if school is None or term is None or subject is None or career is None:
+            # deleted, along with its watches, since the aggregate query
+            continue
+
+        search_groups.append(
+            SearchGroup(
+                school=school,
+                term=term,
+                subject=subject,
+                career=career,
+                section_numbers=row["section_numbers"],
+                recipient_ids=row["recipient_ids"],
+            )
         )
-        results.append(search_group)
 
-    return results
+    return search_groups
 
 
 def group_open_sections_by_recipient(
-    open_sections: list[CourseSection], recipients: list[Recipient]
+    search_groups_open_section_numbers: Iterable[tuple[SearchGroup, set[int]]],
 ) -> dict[Recipient, list[CourseSection]]:
-    recipient_to_sections = defaultdict(list)
-
-    open_section_numbers: set[int] = {section.number for section in open_sections}
-
-    for recipient in recipients:
-        for watched_section in recipient.watched_sections.all():
-            if watched_section.number in open_section_numbers:
-                # find the actual open section object
-                matching_open_section = next(
-                    (
-                        section
-                        for section in open_sections
-                        if section.number == watched_section.number
-                    ),
-                    None,
-                )
-                if matching_open_section:
-                    recipient_to_sections[recipient].append(matching_open_section)
+    """
+    Look the recipients watching the open sections of each search group up in the watch index, with
+    a single query sized by the open sections rather than by recipients & their watched sections.
+    """
+    watch_index_filter = Q()
+    for search_group, open_section_numbers in search_groups_open_section_numbers:
+        if open_section_numbers:
+            watch_index_filter |= Q(
+                school_id=search_group.school.id,
+                term_id=search_group.term.id,
+                subject_id=search_group.subject.id,
+                career_id=search_group.career.id,
+                section_number__in=open_section_numbers,
+            )
+    if not watch_index_filter:
+        return {}
+
+    recipient_to_sections: defaultdict[Recipient, list[CourseSection]] = defaultdict(list)
+    for watch_index_entry in (
+        WatchIndexEntry.objects.filter(watch_index_filter)
+        .select_related("recipient", "course_section__course")
+        .prefetch_related("course_section__instruction_entries__instructor")
+        .order_by("recipient_id", "section_number")
+    ):
+        recipient_to_sections[watch_index_entry.recipient].append(watch_index_entry.course_section)
 
     return dict(recipient_to_sections)
 
 
+class ClassListIngest(NamedTuple):
+    num_courses: int
+    is_unchanged: bool  # the page matched the stored fingerprint, nothing was parsed or written
+
+
+def ingest_class_list_page(
+    page_src: str,
+    subject: Subject,
+    career: CourseCareer,
+    school: School,
+    term: Term,
+    *,
+    is_forced: bool = False,
+) -> ClassListIngest:
+    """
+    Parse & store a class list page, unless its fingerprint matches the one stored by the last
+    ingest of the same (school, term, career, subject); `is_forced` ingests it regardless.
+    """
+    fingerprint = get_page_fingerprint(page_src)
+    stored_fingerprint = ClassListFingerprint.objects.filter(
+        school=school, term=term, career=career, subject=subject
+    ).first()
+    if (
+        not is_forced
+        and stored_fingerprint is not None
+        and stored_fingerprint.fingerprint == fingerprint
+    ):
+        logger.info(
+            " - Class list unchanged for %s (%s) - %s, %s",
+            school.name,
+            term.name,
+            career.name,
+            subject.name,
+        )
+        return ClassListIngest(num_courses=stored_fingerprint.num_courses, is_unchanged=True)
+
+    num_courses = store_class_list(
+        parse_class_list_page(page_src), fingerprint, subject, career, school, term
+    )
+    return ClassListIngest(num_courses=num_courses, is_unchanged=False)
+
+
+def store_class_list(
+    gs_courses: list[GSCourse],
+    fingerprint: str,
+    subject: Subject,
+    career: CourseCareer,
+    school: School,
+    term: Term,
+) -> int:
+    """Write a parsed class list & remember the fingerprint of its page, returning the course count."""
+    with transaction.atomic():
+        courses = create_db_courses(gs_courses, subject, career, school, term)
+        ClassListFingerprint.objects.update_or_create(
+            school=school,
+            term=term,
+            career=career,
+            subject=subject,
+            defaults={"fingerprint": fingerprint, "num_courses": len(courses)},
+        )
+
+    return len(courses)
+
+
 def create_db_courses(
     gs_courses: list[GSCourse],
     subject: Subject,
@@ -106,6 +193,11 @@ def create_db_courses(
     school: School,
     term: Term,
 ) -> list[Course]:
+    """
+    Sync the parsed class list of a (school, term, career, subject) into the database, writing only
+    what differs from the stored sections & instruction entries and logging each difference as a
+    `CatalogChange`.
+    """
     logger.info(
         " - Creating %s database courses for %s (%s) - %s, %s",
         len(gs_courses),
@@ -114,36 +206,305 @@ def create_db_courses(
         career.name,
         subject.name,
     )
-    name_to_instructor_map = _create_instructors_from_gs_courses(gs_courses, school, term)
-
-    course_name_to_course_map = {
-        course.get_name(): course
-        for course in list(
-            bulk_create_and_get(
-                Course,
-                [Course.from_gs_course(c, subject, career, school) for c in gs_courses],
-                fields=["code", "level", "school__id"],
+    with transaction.atomic():
+        gs_unique_id_to_stored_section = _get_stored_course_sections(
+            gs_courses, subject, career, school, term
+        )
+        # only new sections & those whose fingerprint changed since the last ingest are written
+        changed_gs_courses = _get_changed_gs_course_sections(
+            gs_courses, gs_unique_id_to_stored_section
+        )
+        removed_course_sections = _get_removed_course_sections(
+            gs_courses, gs_unique_id_to_stored_section
+        )
+        num_changed_sections = sum(len(gs_course.sections) for gs_course in changed_gs_courses)
+        logger.info(
+            " - %d of %d sections changed, %d removed",
+            num_changed_sections,
+            sum(len(gs_course.sections) for gs_course in gs_courses),
+            len(removed_course_sections),
+        )
+
+        course_name_to_course_map = {
+            course.get_name(): course
+            for course in list(
+                bulk_create_and_get(
+                    Course,
+                    [Course.from_gs_course(c, subject, career, school) for c in gs_courses],
+                    fields=["code", "level", "school__id"],
+                )
             )
+        }
+
+        courses = list(course_name_to_course_map.values())
+        term.courses.add(*courses)
+
+        catalog_changes = _remove_course_sections(removed_course_sections, term)
+        if num_changed_sections == 0:
+            CatalogChange.objects.bulk_create(catalog_changes)
+            return courses
+
+        name_to_instructor_map = _create_instructors_from_gs_courses(
+            changed_gs_courses, school, term
         )
-    }
 
-    courses = list(course_name_to_course_map.values())
+        gs_unique_id_to_gs_course_section: dict[str, GSCourseSection] = {}
+        gs_unique_id_to_course_section: dict[str, CourseSection] = {}
+        for gs_course in changed_gs_courses:
+            course = course_name_to_course_map[gs_course.get_name()]
+            for gs_course_section in gs_course.sections:
+                gs_unique_id_to_gs_course_section[gs_course_section.unique_id] = gs_course_section
+                gs_unique_id_to_course_section[gs_course_section.unique_id] = (
+                    CourseSection.from_gs_course_section(gs_course_section, course, term)
+                )
 
+        course_sections = bulk_upsert(
+            CourseSection,
+            list(gs_unique_id_to_course_section.values()),
+            unique_fields=["gs_unique_id"],
+            update_fields=list(CourseSection.GS_UPSERT_FIELDS),
+        )
+        WatchIndexEntry.refresh_for_course_sections(
+            course_section.id
+            for course_section in course_sections
+            if (stored_section := gs_unique_id_to_stored_section.get(course_section.gs_unique_id))
+            is not None
+            and (stored_section.number, stored_section.course_id)
+            != (course_section.number, course_section.course_id)
+        )
+
+        catalog_changes.extend(
+            _sync_instruction_entries(
+                [
+                    (gs_unique_id_to_gs_course_section[course_section.gs_unique_id], course_section)
+                    for course_section in course_sections
+                ],
+                gs_unique_id_to_stored_section,
+                term,
+                name_to_instructor_map,
+            )
+        )
+        CatalogChange.objects.bulk_create(catalog_changes)
+
+    return courses
+
+
+def _get_stored_course_sections(
+    gs_courses: list[GSCourse],
+    subject: Subject,
+    career: CourseCareer,
+    school: School,
+    term: Term,
+) -> dict[str, CourseSection]:
+    """
+    The stored sections listed in `gs_courses`, plus the ones of the same class list that are not
+    marked removed, by `gs_unique_id`.
+    """
+    gs_unique_ids = [
+        gs_course_section.unique_id
+        for gs_course in gs_courses
+        for gs_course_section in gs_course.sections
+    ]
+    course_sections = CourseSection.objects.filter(
+        Q(gs_unique_id__in=gs_unique_ids)
+        | Q(
+            term=term,
+            course__school=school,
+            course__career=career,
+            course__subject=subject,
+            datetime_removed__isnull=True,
+        )
+    ).only(
+        "id", "gs_unique_id", "gs_fingerprint", "datetime_removed", *CourseSection.GS_DIFF_FIELDS
+    )
+    return {course_section.gs_unique_id: course_section for course_section in course_sections}
+
+
+def _get_changed_gs_course_sections(
+    gs_courses: list[GSCourse], gs_unique_id_to_stored_section: dict[str, CourseSection]
+) -> list[GSCourse]:
+    """
+    Copies of `gs_courses` holding only the sections that are new, listed again after a removal or
+    whose fingerprint differs from the stored one; courses left without sections are dropped.
+    """
+    changed_gs_courses: list[GSCourse] = []
     for gs_course in gs_courses:
+        course_name = gs_course.get_name()
+        changed_sections = []
         for gs_course_section in gs_course.sections:
-            course = course_name_to_course_map[gs_course.get_name()]
-            course_section = CourseSection.from_gs_course_section(gs_course_section, course, term)
-            course_section, _ = atomic_get_or_create(course_section, fields=["gs_unique_id"])
+            stored_section = gs_unique_id_to_stored_section.get(gs_course_section.unique_id)
+            if (
+                stored_section is None
+                or stored_section.datetime_removed is not None
+                or stored_section.gs_fingerprint != gs_course_section.get_fingerprint(course_name)
+            ):
+                changed_sections.append(gs_course_section)
+
+        if changed_sections:
+            changed_gs_courses.append(replace(gs_course, sections=tuple(changed_sections)))
+
+    return changed_gs_courses
+
+
+def _get_removed_course_sections(
+    gs_courses: list[GSCourse], gs_unique_id_to_stored_section: dict[str, CourseSection]
+) -> list[CourseSection]:
+    # an empty class list is more likely a GlobalSearch hiccup than a subject losing every section
+    if not gs_courses:
+        return []
+
+    listed_gs_unique_ids = {
+        gs_course_section.unique_id
+        for gs_course in gs_courses
+        for gs_course_section in gs_course.sections
+    }
+    return [
+        course_section
+        for gs_unique_id, course_section in gs_unique_id_to_stored_section.items()
+        if gs_unique_id not in listed_gs_unique_ids and course_section.datetime_removed is None
+    ]
+
+
+def _remove_course_sections(
+    course_sections: list[CourseSection], term: Term
+) -> list[CatalogChange]:
+    """Mark sections no longer listed as removed, returning their (unsaved) change log entries."""
+    if not course_sections:
+        return []
+
+    now = timezone.now()
+    CourseSection.objects.filter(
+        id__in=[course_section.id for course_section in course_sections]
+    ).update(datetime_removed=now, datetime_modified=now)
+    return [
+        CatalogChange(
+            course_section=course_section, term=term, kind=CatalogChange.KindChoices.REMOVED
+        )
+        for course_section in course_sections
+    ]
 
-            InstructionEntry.objects.filter(course_section=course_section).delete()
 
-            InstructionEntry.create_entries_from_gs_course_section(
-                gs_course_section, course_section, term, name_to_instructor_map
+def _sync_instruction_entries(
+    gs_and_db_course_sections: list[tuple[GSCourseSection, CourseSection]],
+    gs_unique_id_to_stored_section: dict[str, CourseSection],
+    term: Term,
+    name_to_instructor_map: TNameToInstructorMap,
+) -> list[CatalogChange]:
+    """
+    Bring the instruction entries of upserted sections in line with the page, only inserting,
+    updating & deleting the entries that differ, and return the (unsaved) change log entries of
+    those sections.
+    """
+    key_to_instruction_entry = InstructionEntry.build_from_gs_course_sections(
+        gs_and_db_course_sections, term, name_to_instructor_map
+    )
+    key_to_stored_instruction_entry = {
+        instruction_entry.get_unique_key(): instruction_entry
+        for instruction_entry in InstructionEntry.objects.filter(
+            course_section__in=[course_section for _, course_section in gs_and_db_course_sections]
+        ).select_related("instructor")
+    }
+
+    course_section_id_to_entries: defaultdict[int, list[InstructionEntry]] = defaultdict(list)
+    course_section_id_to_stored_entries: defaultdict[int, list[InstructionEntry]] = defaultdict(
+        list
+    )
+    for instruction_entry in key_to_stored_instruction_entry.values():
+        course_section_id_to_stored_entries[instruction_entry.course_section_id].append(
+            instruction_entry
+        )
+
+    created_entries: list[InstructionEntry] = []
+    updated_entries: list[InstructionEntry] = []
+    for key, instruction_entry in key_to_instruction_entry.items():
+        course_section_id_to_entries[instruction_entry.course_section_id].append(instruction_entry)
+        stored_instruction_entry = key_to_stored_instruction_entry.pop(key, None)
+        if stored_instruction_entry is None:
+            created_entries.append(instruction_entry)
+        elif stored_instruction_entry.days_mask != instruction_entry.days_mask:
+            stored_instruction_entry.days_mask = instruction_entry.days_mask
+            stored_instruction_entry.datetime_modified = timezone.now()
+            updated_entries.append(stored_instruction_entry)
+
+    # whatever is left over is no longer on the page
+    InstructionEntry.objects.filter(
+        id__in=[
+            instruction_entry.id for instruction_entry in key_to_stored_instruction_entry.values()
+        ]
+    ).delete()
+    InstructionEntry.objects.bulk_update(updated_entries, ["days_mask", "datetime_modified"])
+    InstructionEntry.objects.bulk_create(created_entries)
+
+    catalog_changes: list[CatalogChange] = []
+    for gs_course_section, course_section in gs_and_db_course_sections:
+        stored_section = gs_unique_id_to_stored_section.get(gs_course_section.unique_id)
+        if stored_section is None or stored_section.datetime_removed is not None:
+            catalog_changes.append(
+                CatalogChange(
+                    course_section=course_section, term=term, kind=CatalogChange.KindChoices.ADDED
+                )
             )
+            continue
+
+        catalog_changes.extend(
+            _diff_course_section(
+                stored_section,
+                course_section,
+                course_section_id_to_stored_entries[course_section.id],
+                course_section_id_to_entries[course_section.id],
+                term,
+            )
+        )
 
-    term.courses.add(*courses)
+    return catalog_changes
 
-    return courses
+
+def _diff_course_section(
+    stored_section: CourseSection,
+    course_section: CourseSection,
+    stored_entries: list[InstructionEntry],
+    entries: list[InstructionEntry],
+    term: Term,
+) -> list[CatalogChange]:
+    def get_meetings(instruction_entries: list[InstructionEntry]) -> list[str]:
+        return sorted(
+            {
+                f"{entry.get_days_and_times()} ({entry.get_start_and_end_dates()})"
+                for entry in instruction_entries
+            }
+        )
+
+    def get_instructors(instruction_entries: list[InstructionEntry]) -> list[str]:
+        return sorted({entry.instructor.name for entry in instruction_entries})
+
+    def get_rooms(instruction_entries: list[InstructionEntry]) -> list[str]:
+        return sorted({f"{entry.building} {entry.room}".strip() for entry in instruction_entries})
+
+    modified_fields: dict[str, list[Any]] = {
+        field: [getattr(stored_section, field), getattr(course_section, field)]
+        for field in CourseSection.GS_DIFF_FIELDS
+        if getattr(stored_section, field) != getattr(course_section, field)
+    }
+    kind_to_changes: dict[CatalogChange.KindChoices, dict[str, list[Any]]] = {
+        CatalogChange.KindChoices.MODIFIED: modified_fields,
+        CatalogChange.KindChoices.INSTRUCTORS: {},
+        CatalogChange.KindChoices.ROOMS: {},
+    }
+
+    for kind, field, get_values in (
+        (CatalogChange.KindChoices.MODIFIED, "meetings", get_meetings),
+        (CatalogChange.KindChoices.INSTRUCTORS, "instructors", get_instructors),
+        (CatalogChange.KindChoices.ROOMS, "rooms", get_rooms),
+    ):
+        stored_values, values = get_values(stored_entries), get_values(entries)
+        if stored_values != values:
+            kind_to_changes[kind][field] = [stored_values, values]
+
+    return [
+        CatalogChange(course_section=course_section, term=term, kind=kind, changes=changes)
+        for kind, changes in kind_to_changes.items()
+        if changes
+    ]
 
 
 def _create_instructors_from_gs_courses(
@@ -0,0 +1,158 @@
+import datetime
+import logging
+from collections.abc import Iterable
+from typing import cast
+
+import redis
+from django.db.models import Max
+from django.utils import timezone
+from redis.client import Pipeline
+
+from server.util import RedisOutageGuard, get_redis_connection
+
+from ..models import ClassAlert
+
+logger = logging.getLogger("main")
+
+TAlertPair = tuple[int, int]  # (recipient id, course section id)
+
+
+class AlertLedger:
+    """
+    Redis ledger of the (recipient, course section) pairs alerted within the renotify grace period,
+    so the grace check is one key lookup per candidate instead of a `ClassAlert` query.
+
+    Each pair's key holds the time of its latest alert and expires once the grace period is over.
+    The ledger also keeps the grace period it was filled for & the id of the last alert it holds:
+    if Redis was flushed, the grace period changed or alerts were created without being recorded
+    (e.g. during a Redis outage), the missing alerts are read from the database before the check.
+
+    If Redis cannot be reached the ledger fails open to querying `ClassAlert` directly.
+    """
+
+    def __init__(self, key: str):
+        self.key = key
+        self.state_key = f"{key}:state"
+        self._redis_guard = RedisOutageGuard("Class alert ledger")
+
+    def get_recent_pairs(
+        self, pairs: Iterable[TAlertPair], *, hours_grace_period: float
+    ) -> set[TAlertPair]:
+        """The `pairs` that were alerted within the last `hours_grace_period` hours."""
+        pairs = list(pairs)
+        if len(pairs) == 0:
+            return set()
+
+        cutoff = timezone.now() - datetime.timedelta(hours=hours_grace_period)
+        if self._redis_guard.is_usable():
+            try:
+                self._catch_up(cutoff, hours_grace_period)
+                values = cast(
+                    "list[bytes | None]",
+                    get_redis_connection().mget([self._get_pair_key(*pair) for pair in pairs]),
+                )
+            except redis.RedisError as ex:
+                self._redis_guard.mark_failed(ex)
+            else:
+                cutoff_timestamp = cutoff.timestamp()
+                return {
+                    pair
+                    for pair, value in zip(pairs, values, strict=True)
+                    if value is not None and float(value) > cutoff_timestamp
+                }
+
+        return _get_recent_pairs_from_db(pairs, cutoff)
+
+    def record(self, alerts: list[ClassAlert], *, hours_grace_period: float) -> None:
+        """Add freshly created `alerts` to the ledger."""
+        if len(alerts) == 0 or not self._redis_guard.is_usable():
+            return
+
+        cutoff = timezone.now() - datetime.timedelta(hours=hours_grace_period)
+        try:
+            with get_redis_connection().pipeline() as pipeline:
+                self._add_alerts(
+                    pipeline,
+                    (
+                        (alert.recipient_id, alert.course_section_id, alert.datetime_created)
+                        for alert in alerts
+                    ),
+                    cutoff,
+                )
+                pipeline.hset(
+                    self.state_key, "last_alert_id", str(max(alert.id for alert in alerts))
+                )
+                pipeline.execute()
+        except redis.RedisError as ex:
+            # the alerts are picked up from the database by the next check's catch-up
+            self._redis_guard.mark_failed(ex)
+
+    def reset(self) -> None:
+        connection = get_redis_connection()
+        connection.delete(self.state_key, *connection.scan_iter(f"{self.key}:pair:*"))
+
+    def _get_pair_key(self, recipient_id: int, course_section_id: int) -> str:
+        return f"{self.key}:pair:{recipient_id}:{course_section_id}"
+
+    def _catch_up(self, cutoff: datetime.datetime, hours_grace_period: float) -> None:
+        """Add the alerts missing from the ledger; a primary key lookup when there are none."""
+        connection = get_redis_connection()
+        grace_period_seconds, last_alert_id = cast(
+            "list[bytes | None]",
+            connection.hmget(self.state_key, ["grace_period_seconds", "last_alert_id"]),
+        )
+        latest_alert_id = ClassAlert.objects.aggregate(latest_alert_id=Max("id"))["latest_alert_id"]
+        alerts = ClassAlert.objects.filter(
+            id__lte=latest_alert_id or 0, datetime_created__gt=cutoff
+        )
+
+        if grace_period_seconds is None or float(grace_period_seconds) != hours_grace_period * 3600:
+            logger.info("Filling the class alert ledger from the database")
+        elif int(last_alert_id or 0) < (latest_alert_id or 0):
+            alerts = alerts.filter(id__gt=int(last_alert_id or 0))
+        else:
+            return
+
+        with connection.pipeline() as pipeline:
+            self._add_alerts(
+                pipeline,
+                alerts.values_list("recipient_id", "course_section_id", "datetime_created"),
+                cutoff,
+            )
+            pipeline.hset(
+                self.state_key,
+                mapping={
+                    "grace_period_seconds": str(hours_grace_period * 3600),
+                    "last_alert_id": str(latest_alert_id or 0),
+                },
+            )
+            pipeline.execute()
+
+    def _add_alerts(
+        self,
+        pipeline: Pipeline,
+        alerts: Iterable[tuple[int, int, datetime.datetime]],
+        cutoff: datetime.datetime,
+    ) -> None:
+        for recipient_id, course_section_id, datetime_created in alerts:
+            time_to_live = datetime_created - cutoff
+            if time_to_live > datetime.timedelta(0):
+                pipeline.set(
+                    self._get_pair_key(recipient_id, course_section_id),
+                    datetime_created.timestamp(),
+                    px=time_to_live,
+                )
+
+
+def _get_recent_pairs_from_db(
+    pairs: list[TAlertPair], cutoff: datetime.datetime
+) -> set[TAlertPair]:
+    recent_pairs = ClassAlert.objects.filter(
+        recipient_id__in={recipient_id for recipient_id, _ in pairs},
+        course_section_id__in={course_section_id for _, course_section_id in pairs},
+        datetime_created__gt=cutoff,
+    ).values_list("recipient_id", "course_section_id")
+    return set(recent_pairs) & set(pairs)
+
+
+alert_ledger = AlertLedger("class_tracker:alert_ledger")
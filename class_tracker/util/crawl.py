@@ -0,0 +1,103 @@
+import hashlib
+import logging
+import time
+from datetime import timedelta
+from functools import partial
+
+from django.utils import timezone
+
+from ..global_search.navigator import get_classlist_result_page
+from ..global_search.session_pool import session_pool
+from ..models import CatalogCrawl, CatalogCrawlUnit, CourseCareer, School, Subject
+from . import ingest_class_list_page
+
+logger = logging.getLogger("main")
+
+# unit fields settled once a unit is crawled, successfully or not
+UNIT_CHECKPOINT_FIELDS = (
+    "status",
+    "num_courses",
+    "is_unchanged",
+    "error",
+    "content_hash",
+    "datetime_finished",
+    "fetch_duration",
+    "ingest_duration",
+)
+
+
+def plan_crawl_units(crawl: CatalogCrawl) -> list[CatalogCrawlUnit]:
+    """
+    Create a queued unit for every (school, career, subject) class list the crawl covers & return
+    all of the crawl's units. Units planned by an earlier run are kept with their checkpoint, so
+    re-planning an interrupted crawl only adds what is missing.
+    """
+    term = crawl.term
+    existing_unit_keys = set(crawl.units.values_list("school_id", "career_id", "subject_id"))
+    schools = (
+        [crawl.school] if crawl.school is not None else list(School.objects.filter(terms=term))
+    )
+
+    units: list[CatalogCrawlUnit] = []
+    for school in schools:
+        careers = CourseCareer.objects.filter(terms=term, schools=school)
+        subjects = (
+            [crawl.subject]
+            if crawl.subject is not None
+            else list(Subject.objects.filter(terms=term, schools=school))
+        )
+
+        units.extend(
+            CatalogCrawlUnit(crawl=crawl, school=school, career=career, subject=subject)
+            for career in careers
+            for subject in subjects
+            if (school.id, career.id, subject.id) not in existing_unit_keys
+        )
+
+    CatalogCrawlUnit.objects.bulk_create(units)
+    return list(crawl.units.order_by("id"))
+
+
+def run_crawl_unit(unit: CatalogCrawlUnit) -> None:
+    """
+    Fetch, parse and store one class list. The courses are written in their own transaction, so a
+    failing unit leaves every other unit of the crawl intact and can simply be re-run.
+    """
+    crawl = unit.crawl
+    school, career, subject, term = unit.school, unit.career, unit.subject, crawl.term
+
+    unit.status = CatalogCrawlUnit.StatusChoices.RUNNING
+    unit.datetime_started = timezone.now()
+    unit.datetime_finished = None
+    unit.save(update_fields=["status", "datetime_started", "datetime_finished"])
+
+    logger.info(
+        " - Parsing courses for %s, %s (%s, %s)", career.name, subject.name, school.name, term.name
+    )
+
+    unit.is_unchanged = False
+    try:
+        start = time.perf_counter()
+        page_src = session_pool.run(
+            school, term, partial(get_classlist_result_page, course_career=career, subject=subject)
+        )
+        unit.fetch_duration = timedelta(seconds=time.perf_counter() - start)
+        unit.content_hash = hashlib.sha256(page_src.encode()).hexdigest()
+
+        start = time.perf_counter()
+        class_list_ingest = ingest_class_list_page(page_src, subject, career, school, term)
+        unit.ingest_duration = timedelta(seconds=time.perf_counter() - start)
+    except Exception as ex:  # any failure must still settle the unit, or the crawl never finishes
+        logger.exception("Crawl unit failed: %r", unit)
+        unit.status = CatalogCrawlUnit.StatusChoices.FAILED
+        unit.error = f"{type(ex).__name__}: {ex}"
+    else:
+        unit.status = CatalogCrawlUnit.StatusChoices.COMPLETED
+        unit.num_courses = class_list_ingest.num_courses
+        unit.is_unchanged = class_list_ingest.is_unchanged
+        unit.error = ""
+
+    unit.datetime_finished = timezone.now()
+    unit.save(update_fields=UNIT_CHECKPOINT_FIELDS)
+
+    crawl.mark_finished_if_done()
@@ -0,0 +1,337 @@
+import hashlib
+import logging
+import queue
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import timedelta
+from functools import partial
+from typing import Self, TypeVar
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import prefetch_related_objects
+from django.utils import timezone
+
+from ..global_search.navigator import get_classlist_result_page
+from ..global_search.parse_pool import ParsePool
+from ..global_search.parser import get_page_fingerprint
+from ..global_search.session_pool import session_pool
+from ..global_search.typedefs import GSCourse
+from ..models import CatalogCrawl, CatalogCrawlUnit, ClassListFingerprint, Term
+from . import store_class_list
+from .crawl import UNIT_CHECKPOINT_FIELDS
+
+logger = logging.getLogger("main")
+
+T = TypeVar("T")
+
+# how often blocked stages wake up to check whether the pipeline was stopped
+_STOP_CHECK_INTERVAL_SECONDS = 0.5
+
+
+@dataclass(frozen=True)
+class CrawlPipelineConfig:
+    num_fetchers: int  # threads waiting on GlobalSearch
+    num_parsers: int  # `ParsePool` processes, 0 parses on the parser threads of this process
+    queue_size: int  # pages buffered between two stages before the earlier stage blocks
+    write_batch_size: int  # units committed together by the writer
+    request_timeout_seconds: float
+
+    @classmethod
+    def from_settings(cls) -> Self:
+        return cls(
+            num_fetchers=settings.GLOBALSEARCH_MAX_CONNECTIONS_PER_HOST,
+            num_parsers=settings.CLASS_TRACKER_PARSE_WORKERS,
+            queue_size=settings.CLASS_TRACKER_CRAWL_PIPELINE_QUEUE_SIZE,
+            write_batch_size=settings.CLASS_TRACKER_CRAWL_PIPELINE_WRITE_BATCH_SIZE,
+            request_timeout_seconds=settings.CLASS_TRACKER_POLL_REQUEST_TIMEOUT_SECONDS,
+        )
+
+
+@dataclass
+class StageStats:
+    name: str
+    num_workers: int
+    num_items: int = 0
+    busy_seconds: float = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @contextmanager
+    def busy(self) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.busy_seconds += time.perf_counter() - start
+                self.num_items += 1
+
+    def get_utilization(self, elapsed_seconds: float) -> float:
+        """Share of the stage's worker time spent working rather than waiting on a queue."""
+        if elapsed_seconds <= 0:
+            return 0
+        return min(1.0, self.busy_seconds / (elapsed_seconds * self.num_workers))
+
+
+@dataclass
+class CrawlPipelineStats:
+    elapsed_seconds: float
+    stages: list[StageStats]
+
+    def __str__(self) -> str:
+        return ", ".join(
+            f"{stage.name} {stage.get_utilization(self.elapsed_seconds):.0%} busy "
+            f"({stage.num_items} items, {stage.num_workers} workers)"
+            for stage in self.stages
+        )
+
+
+@dataclass
+class _CrawlItem:
+    unit: CatalogCrawlUnit
+    page_src: str = ""
+    fingerprint: str = ""
+    gs_courses: list[GSCourse] | None = None  # None when the page is unchanged or failed
+    num_courses: int = 0  # of an unchanged page
+    parse_seconds: float = 0
+    error: str = ""
+
+
+class _PipelineStoppedError(Exception):
+    pass
+
+
+def _put(items: "queue.Queue[T]", item: T, stop_event: threading.Event) -> None:
+    while True:
+        if stop_event.is_set():
+            raise _PipelineStoppedError
+        try:
+            items.put(item, timeout=_STOP_CHECK_INTERVAL_SECONDS)
+            return
+        except queue.Full:
+            continue
+
+
+def _get(items: "queue.Queue[T]", stop_event: threading.Event) -> T:
+    while True:
+        if stop_event.is_set():
+            raise _PipelineStoppedError
+        try:
+            return items.get(timeout=_STOP_CHECK_INTERVAL_SECONDS)
+        except queue.Empty:
+            continue
+
+
+class _CrawlPipeline:
+    def __init__(
+        self, crawl: CatalogCrawl, units: list[CatalogCrawlUnit], config: CrawlPipelineConfig
+    ):
+        self.crawl = crawl
+        self.term = crawl.term
+        self.units = units
+        self.config = config
+        self.fetch_stats = StageStats("fetch", config.num_fetchers)
+        self.parse_stats = StageStats("parse", max(1, config.num_parsers))
+        self.write_stats = StageStats("write", 1)
+
+        self.pending_units: queue.Queue[CatalogCrawlUnit] = queue.Queue()
+        for unit in units:
+            self.pending_units.put(unit)
+        self.fetched_items: queue.Queue[_CrawlItem] = queue.Queue(maxsize=config.queue_size)
+        self.parsed_items: queue.Queue[_CrawlItem] = queue.Queue(maxsize=config.queue_size)
+        self.stop_event = threading.Event()
+
+        self.parse_pool = ParsePool(config.num_parsers)
+        self.unit_key_to_stored_fingerprint: dict[tuple[int, int, int], ClassListFingerprint] = {}
+
+    def run(self) -> CrawlPipelineStats:
+        start = time.perf_counter()
+        # the stage threads only read what is loaded here, all queries stay on the writer's thread
+        prefetch_related_objects(self.units, "school", "career", "subject")
+        self.unit_key_to_stored_fingerprint = {
+            (fingerprint.school_id, fingerprint.career_id, fingerprint.subject_id): fingerprint
+            for fingerprint in ClassListFingerprint.objects.filter(term=self.term)
+        }
+        CatalogCrawlUnit.objects.filter(id__in=[unit.id for unit in self.units]).update(
+            status=CatalogCrawlUnit.StatusChoices.RUNNING, datetime_modified=timezone.now()
+        )
+
+        threads = [
+            threading.Thread(target=self._fetch, name=f"class-tracker-crawl-fetch-{i}", daemon=True)
+            for i in range(self.fetch_stats.num_workers)
+        ] + [
+            threading.Thread(target=self._parse, name=f"class-tracker-crawl-parse-{i}", daemon=True)
+            for i in range(self.parse_stats.num_workers)
+        ]
+        for thread in threads:
+            thread.start()
+
+        try:
+            self._write()
+        finally:
+            # fetchers & parsers are idle once every unit was written, unless the writer failed
+            self.stop_event.set()
+            for thread in threads:
+                thread.join()
+            self.parse_pool.close()
+
+        return CrawlPipelineStats(
+            elapsed_seconds=time.perf_counter() - start,
+            stages=[self.fetch_stats, self.parse_stats, self.write_stats],
+        )
+
+    def _fetch(self) -> None:
+        try:
+            while True:
+                try:
+                    unit = self.pending_units.get_nowait()
+                except queue.Empty:
+                    return
+
+                item = _CrawlItem(unit=unit)
+                unit.datetime_started = timezone.now()
+                start = time.perf_counter()
+                with self.fetch_stats.busy():
+                    try:
+                        item.page_src = session_pool.run(
+                            unit.school,
+                            self.term,
+                            partial(
+                                get_classlist_result_page,
+                                course_career=unit.career,
+                                subject=unit.subject,
+                            ),
+                            timeout=self.config.request_timeout_seconds,
+                        )
+                        unit.content_hash = hashlib.sha256(item.page_src.encode()).hexdigest()
+                    except Exception as ex:
+                        logger.exception("Crawl unit failed: %r", unit)
+                        item.error = f"{type(ex).__name__}: {ex}"
+                unit.fetch_duration = timedelta(seconds=time.perf_counter() - start)
+
+                _put(self.fetched_items, item, self.stop_event)
+        except _PipelineStoppedError:
+            return
+        finally:
+            # stage threads get their own db connection; don't leak it past the crawl
+            connections.close_all()
+
+    def _parse(self) -> None:
+        try:
+            while True:
+                item = _get(self.fetched_items, self.stop_event)
+                if not item.error:
+                    with self.parse_stats.busy():
+                        self._parse_item(item)
+                item.page_src = ""  # the writer only needs the parsed courses
+                _put(self.parsed_items, item, self.stop_event)
+        except _PipelineStoppedError:
+            return
+        finally:
+            connections.close_all()
+
+    def _parse_item(self, item: _CrawlItem) -> None:
+        unit = item.unit
+        start = time.perf_counter()
+        try:
+            item.fingerprint = get_page_fingerprint(item.page_src)
+            stored_fingerprint = self.unit_key_to_stored_fingerprint.get(
+                (unit.school_id, unit.career_id, unit.subject_id)
+            )
+            if (
+                stored_fingerprint is not None
+                and stored_fingerprint.fingerprint == item.fingerprint
+            ):
+                item.num_courses = stored_fingerprint.num_courses
+                return
+
+            item.gs_courses = self.parse_pool.parse(item.page_src)
+        except Exception as ex:
+            logger.exception("Crawl unit failed: %r", unit)
+            item.error = f"{type(ex).__name__}: {ex}"
+        finally:
+            item.parse_seconds = time.perf_counter() - start
+
+    def _write(self) -> None:
+        num_written = 0
+        while num_written < len(self.units):
+            batch = [_get(self.parsed_items, self.stop_event)]
+            while len(batch) < self.config.write_batch_size:
+                try:
+                    batch.append(self.parsed_items.get_nowait())
+                except queue.Empty:
+                    break
+
+            with self.write_stats.busy():
+                _write_batch(batch, self.term)
+            num_written += len(batch)
+
+
+def run_crawl_pipeline(
+    crawl: CatalogCrawl, units: list[CatalogCrawlUnit], config: CrawlPipelineConfig
+) -> CrawlPipelineStats:
+    """
+    Crawl `units` through three stages connected by bounded queues, so GlobalSearch requests,
+    parsing & database writes of different class lists overlap:
+
+    - fetch: threads downloading class list pages through the session pool
+    - parse: threads handing changed pages to a `ParsePool`, skipping pages whose fingerprint
+      matches the stored one
+    - write: the calling thread, committing parsed class lists & unit checkpoints in batches
+
+    A full queue blocks the stage feeding it, so a slow writer throttles fetching instead of piling
+    up pages in memory. Each unit is settled as completed or failed just like `run_crawl_unit`.
+    """
+    stats = _CrawlPipeline(crawl, units, config).run()
+    crawl.mark_finished_if_done()
+
+    logger.info(
+        "Crawled %d units of %r in %.1fs: %s", len(units), crawl, stats.elapsed_seconds, stats
+    )
+    return stats
+
+
+def _write_batch(batch: list[_CrawlItem], term: Term) -> None:
+    """Store the parsed class lists of `batch` & checkpoint their units in one transaction."""
+    with transaction.atomic():
+        for item in batch:
+            unit = item.unit
+            unit.is_unchanged = False
+            start = time.perf_counter()
+            if not item.error:
+                try:
+                    if item.gs_courses is None:
+                        unit.is_unchanged = True
+                        unit.num_courses = item.num_courses
+                    else:
+                        unit.num_courses = store_class_list(
+                            item.gs_courses,
+                            item.fingerprint,
+                            unit.subject,
+                            unit.career,
+                            unit.school,
+                            term,
+                        )
+                except Exception as ex:
+                    logger.exception("Crawl unit failed: %r", unit)
+                    item.error = f"{type(ex).__name__}: {ex}"
+
+            unit.ingest_duration = timedelta(
+                seconds=item.parse_seconds + time.perf_counter() - start
+            )
+            unit.status = (
+                CatalogCrawlUnit.StatusChoices.FAILED
+                if item.error
+                else CatalogCrawlUnit.StatusChoices.COMPLETED
+            )
+            unit.error = item.error
+            unit.datetime_finished = timezone.now()
+            unit.datetime_modified = unit.datetime_finished
+
+        CatalogCrawlUnit.objects.bulk_update(
+            [item.unit for item in batch],
+            [*UNIT_CHECKPOINT_FIELDS, "datetime_started", "datetime_modified"],
+        )
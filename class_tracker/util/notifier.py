@@ -1,10 +1,15 @@
+import functools
 import logging
 import os
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+from django.db.models import Prefetch, prefetch_related_objects
+
 from server.util import init_http_retrier
 
-from ..models import Recipient
+from ..models import ContactInfo, Recipient
 
 logger = logging.getLogger("main")
 
@@ -14,95 +19,176 @@ API_KEY = os.environ["JOINAPP_API_KEY"]
 SEND_URL = os.environ["JOINAPP_SEND_URL"]
 LIST_URL = os.environ["JOINAPP_LIST_URL"]
 
-
-def notify_recipient(recipient: Recipient, message: str) -> None:
-    if not recipient.is_contact_by_phone:
-        _notify_myself(title="Open Course Sections Alert", message=message)
-        return
-
-    first_phone = recipient.phone_numbers.filter(is_enabled=True).first()
-
-    if first_phone is None:
-        logger.warning("No enabled phone numbers found for recipient %s", recipient.name)
-        return
-
-    try:
-        _send_join_sms(first_phone.number, message)
+_REQUEST_TIMEOUT_SECONDS = 10
+
+
+class UndeliverableError(ValueError):
+    """The recipient cannot be reached at all, so sending again will not help."""
+
+
+def prefetch_enabled_phone_numbers(recipients: Sequence[Recipient]) -> None:
+    """Read the enabled phone numbers of all `recipients` in one query."""
+    prefetch_related_objects(
+        list(recipients),
+        Prefetch(
+            "phone_numbers",
+            queryset=ContactInfo.objects.filter(is_enabled=True).order_by("id"),
+            to_attr="enabled_phone_numbers",
+        ),
+    )
+
+
+def _get_first_enabled_phone(recipient: Recipient) -> ContactInfo | None:
+    enabled_phone_numbers: list[ContactInfo] | None = getattr(
+        recipient, "enabled_phone_numbers", None
+    )
+    if enabled_phone_numbers is None:
+        return recipient.phone_numbers.filter(is_enabled=True).order_by("id").first()
+    return next(iter(enabled_phone_numbers), None)
+
+
+class NotificationDispatcher:
+    """
+    Sends notifications through the Join API, fanning a batch out over up to `max_workers` threads.
+    The threads share one long-lived session whose connection pool keeps a connection alive per
+    thread, so a message does not pay for a new session & handshake.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int,
+        send_url: str = SEND_URL,
+        request_timeout_seconds: float = _REQUEST_TIMEOUT_SECONDS,
+    ):
+        self.max_workers = max(1, max_workers)
+        self.send_url = send_url
+        self.request_timeout_seconds = request_timeout_seconds
+        self.session = init_http_retrier(num_retries=3, pool_maxsize=self.max_workers)
+
+    def notify_all(self, notifications: Sequence[tuple[Recipient, str]]) -> list[Exception | None]:
+        """
+        Send every (recipient, message) and return what each send raised, None once delivered, in
+        the order of `notifications`. Phone numbers are prefetched in one query up front, so the
+        sending threads never touch the database.
+        """
+        if len(notifications) == 0:
+            return []
+
+        prefetch_enabled_phone_numbers([recipient for recipient, _ in notifications])
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(notifications)),
+            thread_name_prefix="class-tracker-notify",
+        ) as executor:
+            return list(executor.map(self._try_notify, notifications))
+
+    def notify(self, recipient: Recipient, message: str) -> None:
+        """Send `message` to `recipient`, raising if it was not delivered."""
+        if not recipient.is_contact_by_phone:
+            self._notify_myself(title="Open Course Sections Alert", message=message)
+            return
+
+        first_phone = _get_first_enabled_phone(recipient)
+
+        if first_phone is None:
+            raise UndeliverableError(
+                f"No enabled phone numbers found for recipient {recipient.name}"
+            )
+
+        self._send_join_sms(first_phone.number, message)
         logger.info("SMS sent successfully to %s (%s)", recipient.name, first_phone.number)
-    except Exception:
-        logger.exception("Failed to send SMS to %s (%s)", recipient.name, first_phone.number)
 
+    def _try_notify(self, notification: tuple[Recipient, str]) -> Exception | None:
+        try:
+            self.notify(*notification)
+        except Exception as ex:  # noqa: BLE001 - handed back to the caller with the others
+            return ex
+        return None
 
-def _notify_myself(title: str, message: str, url: str = "") -> None:
-    if url == "":
-        _send_join_notification_text(
-            title="Open Course Section(s)", text=message, device_id=DEVICE_ID
+    def _send_join_request(self, params: dict[str, Any]) -> None:
+        response = self.session.get(
+            self.send_url, params=params, timeout=self.request_timeout_seconds
         )
-    else:
-        _send_join_notification_url(url=url, title=title, text=message, device_id=DEVICE_ID)
-
-
-def _send_join_sms(sms_number: str, sms_text: str) -> None:
-    params = {
-        "apikey": API_KEY,
-        "smsnumber": sms_number,
-        "smstext": sms_text,
-        "deviceId": DEVICE_ID,
-    }
-
-    session = init_http_retrier(num_retries=3)
-    session.get(SEND_URL, params=params)
-
-
-def _send_join_notification_text(
-    text: str,
-    title: str | None = None,
-    device_id: str | None = None,
-    device_ids: list[str] | None = None,
-    device_names: list[str] | None = None,
-    icon: Any = None,
-    smallicon: Any = None,
-    vibration: Any = None,
-) -> bool:
-    if device_id is None and device_ids is None and device_names is None:
-        return False
-    params = {
-        "apikey": API_KEY,
-        "text": text,
-        "title": title,
-        "icon": icon,
-        "smallicon": smallicon,
-        "vibration": vibration,
-        "deviceId": device_id,
-        "deviceIds": device_ids,
-        "deviceNames": device_names,
-    }
-
-    session = init_http_retrier(num_retries=3)
-    session.get(SEND_URL, params=params, timeout=10)
-    return True
-
-
-def _send_join_notification_url(
-    url: str,
-    text: str | None = None,
-    title: str | None = None,
-    device_id: str | None = None,
-    device_ids: list[str] | None = None,
-    device_names: list[str] | None = None,
-) -> bool:
-    if device_id is None and device_ids is None and device_names is None:
-        return False
-    params = {
-        "apikey": API_KEY,
-        "url": url,
-        "title": title,
-        "text": text,
-        "deviceId": device_id,
-        "deviceIds": device_ids,
-        "deviceNames": device_names,
-    }
-
-    session = init_http_retrier(num_retries=3)
-    session.get(SEND_URL, params=params, timeout=10)
-    return True
+        response.raise_for_status()
+
+        result = response.json()
+        if not result.get("success", False):
+            raise ValueError(f"Join API error: {result.get('errorMessage', 'unknown error')}")
+
+    def _notify_myself(self, title: str, message: str, url: str = "") -> None:
+        if url == "":
+            self._send_join_notification_text(
+                title="Open Course Section(s)", text=message, device_id=DEVICE_ID
+            )
+        else:
+            self._send_join_notification_url(
+                url=url, title=title, text=message, device_id=DEVICE_ID
+            )
+
+    def _send_join_sms(self, sms_number: str, sms_text: str) -> None:
+        params = {
+            "apikey": API_KEY,
+            "smsnumber": sms_number,
+            "smstext": sms_text,
+            "deviceId": DEVICE_ID,
+        }
+
+        self._send_join_request(params)
+
+    def _send_join_notification_text(
+        self,
+        text: str,
+        title: str | None = None,
+        device_id: str | None = None,
+        device_ids: list[str] | None = None,
+        device_names: list[str] | None = None,
+        icon: Any = None,
+        smallicon: Any = None,
+        vibration: Any = None,
+    ) -> bool:
+        if device_id is None and device_ids is None and device_names is None:
+            return False
+        params = {
+            "apikey": API_KEY,
+            "text": text,
+            "title": title,
+            "icon": icon,
+            "smallicon": smallicon,
+            "vibration": vibration,
+            "deviceId": device_id,
+            "deviceIds": device_ids,
+            "deviceNames": device_names,
+        }
+
+        self._send_join_request(params)
+        return True
+
+    def _send_join_notification_url(
+        self,
+        url: str,
+        text: str | None = None,
+        title: str | None = None,
+        device_id: str | None = None,
+        device_ids: list[str] | None = None,
+        device_names: list[str] | None = None,
+    ) -> bool:
+        if device_id is None and device_ids is None and device_names is None:
+            return False
+        params = {
+            "apikey": API_KEY,
+            "url": url,
+            "title": title,
+            "text": text,
+            "deviceId": device_id,
+            "deviceIds": device_ids,
+            "deviceNames": device_names,
+        }
+
+        self._send_join_request(params)
+        return True
+
+
+@functools.cache
+def get_notification_dispatcher(max_workers: int) -> NotificationDispatcher:
+    """The process-wide dispatcher for `max_workers`, so its connection pool outlives a batch."""
+    return NotificationDispatcher(max_workers=max_workers)
@@ -0,0 +1,157 @@
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Self, cast
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Min, Q
+from django.utils import timezone
+
+from ..models import OutboxNotification
+from .notifier import UndeliverableError, get_notification_dispatcher
+
+logger = logging.getLogger("main")
+
+
+@dataclass(frozen=True)
+class OutboxConfig:
+    batch_size: int  # notifications claimed, and sent concurrently, at a time
+    max_workers: int  # concurrent sends
+    max_attempts: int
+    retry_backoff_seconds: float  # before the second attempt, doubling for every one after
+    max_retry_backoff_seconds: float
+    lease_seconds: float  # a notification left sending this long is claimed again
+
+    @classmethod
+    def from_settings(cls) -> Self:
+        return cls(
+            batch_size=settings.CLASS_TRACKER_NOTIFY_BATCH_SIZE,
+            max_workers=settings.CLASS_TRACKER_NOTIFY_MAX_WORKERS,
+            max_attempts=settings.CLASS_TRACKER_NOTIFY_MAX_ATTEMPTS,
+            retry_backoff_seconds=settings.CLASS_TRACKER_NOTIFY_RETRY_BACKOFF_SECONDS,
+            max_retry_backoff_seconds=settings.CLASS_TRACKER_NOTIFY_MAX_RETRY_BACKOFF_SECONDS,
+            lease_seconds=settings.CLASS_TRACKER_NOTIFY_LEASE_SECONDS,
+        )
+
+
+@dataclass
+class OutboxDrainStats:
+    num_sent: int = 0
+    num_retrying: int = 0
+    num_failed: int = 0
+
+    def __str__(self) -> str:
+        return f"{self.num_sent} sent, {self.num_retrying} to retry, {self.num_failed} failed"
+
+
+def get_due_notifications_filter(now: datetime, config: OutboxConfig) -> Q:
+    return Q(status=OutboxNotification.StatusChoices.PENDING, datetime_next_attempt__lte=now) | Q(
+        status=OutboxNotification.StatusChoices.SENDING,
+        datetime_modified__lt=now - timedelta(seconds=config.lease_seconds),
+    )
+
+
+def get_next_retry_datetime() -> datetime | None:
+    """When the earliest notification waiting to be retried is due, None if there is none."""
+    return cast(
+        "datetime | None",
+        OutboxNotification.objects.filter(
+            status=OutboxNotification.StatusChoices.PENDING
+        ).aggregate(datetime_next_attempt=Min("datetime_next_attempt"))["datetime_next_attempt"],
+    )
+
+
+def claim_due_notifications(config: OutboxConfig) -> list[OutboxNotification]:
+    """
+    Mark a batch of due notifications as sending & count the attempt. Rows locked by another
+    dispatch job are skipped, so concurrent jobs never send the same notification.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        notification_ids = list(
+            OutboxNotification.objects.select_for_update(skip_locked=True)
+            .filter(get_due_notifications_filter(now, config))
+            .order_by("datetime_next_attempt", "id")
+            .values_list("id", flat=True)[: config.batch_size]
+        )
+        OutboxNotification.objects.filter(id__in=notification_ids).update(
+            status=OutboxNotification.StatusChoices.SENDING,
+            num_attempts=F("num_attempts") + 1,
+            datetime_modified=now,
+        )
+
+    return list(
+        OutboxNotification.objects.filter(id__in=notification_ids)
+        .select_related("recipient")
+        .order_by("id")
+    )
+
+
+def _get_retry_backoff(num_attempts: int, config: OutboxConfig) -> timedelta:
+    return timedelta(
+        seconds=min(
+            config.retry_backoff_seconds * 2 ** max(num_attempts - 1, 0),
+            config.max_retry_backoff_seconds,
+        )
+    )
+
+
+def _record_results(
+    notifications: list[OutboxNotification],
+    errors: list[Exception | None],
+    config: OutboxConfig,
+    stats: OutboxDrainStats,
+) -> None:
+    now = timezone.now()
+    for notification, error in zip(notifications, errors, strict=True):
+        notification.datetime_modified = now
+        if error is None:
+            notification.status = OutboxNotification.StatusChoices.SENT
+            notification.datetime_sent = now
+            notification.error = ""
+            stats.num_sent += 1
+            continue
+
+        notification.error = str(error) or type(error).__name__
+        if (
+            isinstance(error, UndeliverableError)
+            or notification.num_attempts >= config.max_attempts
+        ):
+            notification.status = OutboxNotification.StatusChoices.FAILED
+            stats.num_failed += 1
+            logger.error("Giving up on %r: %s", notification, notification.error)
+        else:
+            notification.status = OutboxNotification.StatusChoices.PENDING
+            notification.datetime_next_attempt = now + _get_retry_backoff(
+                notification.num_attempts, config
+            )
+            stats.num_retrying += 1
+            logger.warning(
+                "Failed to send %r, retrying at %s: %s",
+                notification,
+                notification.datetime_next_attempt,
+                notification.error,
+            )
+
+    OutboxNotification.objects.bulk_update(
+        notifications,
+        ["status", "datetime_sent", "datetime_next_attempt", "error", "datetime_modified"],
+    )
+
+
+def drain_outbox(config: OutboxConfig) -> OutboxDrainStats:
+    """
+    Send every due notification, a batch at a time with the sends of a batch running concurrently,
+    and record how each went. Failed sends are scheduled for another attempt with exponential
+    backoff until `config.max_attempts`; undeliverable notifications fail right away.
+    """
+    stats = OutboxDrainStats()
+    dispatcher = get_notification_dispatcher(config.max_workers)
+    while notifications := claim_due_notifications(config):
+        errors = dispatcher.notify_all(
+            [(notification.recipient, notification.message) for notification in notifications]
+        )
+        _record_results(notifications, errors, config, stats)
+
+    return stats
@@ -0,0 +1,171 @@
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Self, TypeVar
+
+from django.conf import settings
+from django.db import connections
+
+from ..global_search import GLOBALSEARCH_HOST
+
+logger = logging.getLogger("main")
+
+TItem = TypeVar("TItem")
+TResultValue = TypeVar("TResultValue")
+
+# upper bound on how long the engine sleeps between deadline checks
+_MAX_WAIT_INTERVAL_SECONDS = 1.0
+
+
+@dataclass(frozen=True)
+class PollingConfig:
+    max_workers: int
+    max_connections_per_host: int
+    deadline_seconds: float  # budget for the whole poll cycle
+    group_timeout_seconds: float  # budget for a single item, measured once it holds a host slot
+    request_timeout_seconds: float  # forwarded to each outbound http request
+
+    @classmethod
+    def from_settings(cls) -> Self:
+        return cls(
+            max_workers=settings.CLASS_TRACKER_POLL_MAX_WORKERS,
+            max_connections_per_host=settings.GLOBALSEARCH_MAX_CONNECTIONS_PER_HOST,
+            deadline_seconds=settings.CLASS_TRACKER_POLL_DEADLINE_SECONDS,
+            group_timeout_seconds=settings.CLASS_TRACKER_POLL_GROUP_TIMEOUT_SECONDS,
+            request_timeout_seconds=settings.CLASS_TRACKER_POLL_REQUEST_TIMEOUT_SECONDS,
+        )
+
+
+class HostLimiter:
+    """Caps the number of in-flight items talking to the same host."""
+
+    def __init__(self, max_connections_per_host: int):
+        self._max_connections_per_host = max(1, max_connections_per_host)
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _get_semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self._max_connections_per_host)
+            return self._semaphores[host]
+
+    @contextmanager
+    def slot(self, host: str, timeout: float) -> Iterator[bool]:
+        """Yield whether a slot for `host` was acquired within `timeout` seconds."""
+        semaphore = self._get_semaphore(host)
+        is_acquired = semaphore.acquire(timeout=max(timeout, 0))
+        try:
+            yield is_acquired
+        finally:
+            if is_acquired:
+                semaphore.release()
+
+
+def run_concurrently(
+    items: Sequence[TItem],
+    worker: Callable[[TItem], TResultValue],
+    *,
+    describe: Callable[[TItem], str],
+    config: PollingConfig,
+    host: str = GLOBALSEARCH_HOST,
+) -> list[TResultValue]:
+    """
+    Run `worker` over `items` on a bounded thread pool and return the results of the items
+    that finished in time, in completion order.
+
+    Items that raise, exceed `config.group_timeout_seconds`, or are still pending once
+    `config.deadline_seconds` elapses are logged and left out of the results. Threads cannot
+    be interrupted, so abandoned items keep running in the background until their own
+    request timeouts expire; their results are discarded.
+    """
+    if len(items) == 0:
+        return []
+
+    host_limiter = HostLimiter(config.max_connections_per_host)
+    poll_deadline = time.monotonic() + config.deadline_seconds
+    started_at: dict[int, float] = {}
+
+    def run_item(index: int, item: TItem) -> TResultValue | None:
+        try:
+            with host_limiter.slot(host, timeout=poll_deadline - time.monotonic()) as is_acquired:
+                if not is_acquired:
+                    logger.warning("No free %s slot before poll deadline: %s", host, describe(item))
+                    return None
+
+                started_at[index] = time.monotonic()
+                return worker(item)
+        finally:
+            # worker threads get their own db connection; don't leak it past the item
+            connections.close_all()
+
+    results: list[TResultValue] = []
+
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, config.max_workers), thread_name_prefix="class-tracker-poll"
+    )
+    try:
+        future_to_index: dict[Future[TResultValue | None], int] = {
+            executor.submit(run_item, index, item): index for index, item in enumerate(items)
+        }
+        pending = set(future_to_index)
+
+        while pending:
+            now = time.monotonic()
+            if now >= poll_deadline:
+                break
+
+            next_expiry = min(
+                [poll_deadline]
+                + [
+                    started_at[future_to_index[future]] + config.group_timeout_seconds
+                    for future in pending
+                    if future_to_index[future] in started_at
+                ]
+            )
+            done, pending = wait(
+                pending,
+                timeout=min(max(next_expiry - now, 0), _MAX_WAIT_INTERVAL_SECONDS),
+                return_when=FIRST_COMPLETED,
+            )
+
+            for future in done:
+                item = items[future_to_index[future]]
+                try:
+                    result = future.result()
+                except Exception:
+                    logger.exception("Polling failed for %s", describe(item))
+                    continue
+
+                if result is not None:
+                    results.append(result)
+
+            now = time.monotonic()
+            for future in list(pending):
+                index = future_to_index[future]
+                if index in started_at and now - started_at[index] > config.group_timeout_seconds:
+                    logger.warning(
+                        "Polling timed out after %.1fs for %s",
+                        config.group_timeout_seconds,
+                        describe(items[index]),
+                    )
+                    pending.discard(future)
+
+        for future in pending:
+            if not future.cancel():
+                logger.warning(
+                    "Poll deadline of %.1fs reached before finishing %s",
+                    config.deadline_seconds,
+                    describe(items[future_to_index[future]]),
+                )
+
+        if pending:
+            logger.warning("%d of %d items did not finish in time", len(pending), len(items))
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return results
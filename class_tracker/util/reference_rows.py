@@ -0,0 +1,59 @@
+import threading
+import time
+from collections.abc import Iterable
+from typing import Generic, TypeVar
+
+from django.conf import settings
+from django.db import models
+
+from ..models import CourseCareer, School, Subject, Term
+
+TModel = TypeVar("TModel", bound=models.Model)
+
+
+class ReferenceRowCache(Generic[TModel]):
+    """
+    Per-process cache of the rows of a small, rarely edited table by id, so that every poll does
+    not read the same schools, terms, subjects & careers again. The whole cache is dropped once it
+    is older than `CLASS_TRACKER_POLL_REFERENCE_CACHE_SECONDS`, which bounds how stale a row gets.
+    """
+
+    def __init__(self, model: type[TModel]):
+        self.model = model
+        self._id_to_row: dict[int, TModel] = {}
+        self._loaded_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def get_many(self, ids: Iterable[int]) -> dict[int, TModel]:
+        """The rows of `ids` by id, reading only uncached ones; deleted rows are left out."""
+        ids = set(ids)
+        with self._lock:
+            now = time.monotonic()
+            if now - self._loaded_at > settings.CLASS_TRACKER_POLL_REFERENCE_CACHE_SECONDS:
+                self._id_to_row = {}
+                self._loaded_at = now
+            missing_ids = ids - self._id_to_row.keys()
+
+        if missing_ids:
+            id_to_missing_row = self.model._default_manager.in_bulk(missing_ids)  # noqa: SLF001
+            with self._lock:
+                self._id_to_row.update(id_to_missing_row)
+
+        with self._lock:
+            return {id_: self._id_to_row[id_] for id_ in ids if id_ in self._id_to_row}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._id_to_row = {}
+            self._loaded_at = time.monotonic()
+
+
+school_cache = ReferenceRowCache(School)
+term_cache = ReferenceRowCache(Term)
+subject_cache = ReferenceRowCache(Subject)
+career_cache = ReferenceRowCache(CourseCareer)
+
+
+def clear_reference_row_caches() -> None:
+    for cache in (school_cache, term_cache, subject_cache, career_cache):
+        cache.clear()
@@ -1,9 +1,10 @@
 import logging
-import time
-from typing import TYPE_CHECKING
+from functools import partial
 
 from bs4 import BeautifulSoup
+from django.conf import settings
 from django.contrib.admin.views.decorators import staff_member_required
+from django.db import transaction
 from django.http import HttpRequest, HttpResponse
 from django.views.decorators.http import require_http_methods
 from natsort import natsorted
@@ -12,36 +13,25 @@ from rest_framework.exceptions import APIException
 from rest_framework.exceptions import NotFound as DRFNotFound
 
 from class_tracker.views import interfaces_response
-from server.util import bulk_create_and_get, error_json_response, init_http_retrier
+from server.util import bulk_create_and_get, error_json_response
 
-from ..global_search import get_globalsearch_headers
-from ..global_search.navigator import (
-    get_classlist_result_page,
-    get_main_page,
-    get_subject_selection_page,
-)
-from ..global_search.parser import (
-    create_careers_and_subjects,
-    get_terms_available,
-    parse_gs_courses,
-    parse_schools,
-)
+from ..global_search import init_globalsearch_session
+from ..global_search.navigator import get_main_page
+from ..global_search.parser import create_careers_and_subjects, get_terms_available, parse_schools
+from ..global_search.session_pool import session_pool
+from ..jobs import enqueue_catalog_crawl, resume_catalog_crawl
 from ..models import (
+    CatalogCrawl,
     ContactInfo,
     Course,
-    CourseCareer,
     CourseSection,
     Recipient,
     School,
     Subject,
     Term,
 )
-from ..util import create_db_courses
 from .forms import ContactInfoForm, RecipientForm
 
-if TYPE_CHECKING:
-    from django.db.models import QuerySet
-
 logger = logging.getLogger("main")
 
 
@@ -75,7 +65,7 @@ def get_course_sections(request: HttpRequest, term_id: int, subject_id: int) ->
 
 @staff_member_required
 def refresh_available_terms(request: HttpRequest) -> HttpResponse:
-    session = init_http_retrier(headers=get_globalsearch_headers())
+    session = init_globalsearch_session()
 
     try:
         main_page_soup = BeautifulSoup(get_main_page(session), "lxml")
@@ -117,10 +107,9 @@ def refresh_semester_data(request: HttpRequest, school_id: int, term_id: int) ->
     )
 
     for school in schools:
-        session = init_http_retrier(headers=get_globalsearch_headers())
-        subjects_page_soup = BeautifulSoup(
-            get_subject_selection_page(session, school, term), "lxml"
-        )
+        # always re-warm so the subject list reflects the latest selection page
+        with session_pool.session(school, term, rewarm=True) as pooled_session:
+            subjects_page_soup = BeautifulSoup(pooled_session.selection_page_src, "lxml")
 
         _, subjects = create_careers_and_subjects(subjects_page_soup, school, term)
 
@@ -131,56 +120,71 @@ def refresh_semester_data(request: HttpRequest, school_id: int, term_id: int) ->
 
 
 @staff_member_required
+@require_http_methods(["POST"])
+@transaction.non_atomic_requests
 def fetch_new_semester_course_sections(
     request: HttpRequest, school_id: int, term_id: int, subject_id: int
 ) -> HttpResponse:
-    schools = (
-        list(School.objects.prefetch_related("terms").all())
-        if school_id == 0
-        else [School.objects.prefetch_related("terms").get(id=school_id)]
-    )
-
-    term = Term.objects.get(id=term_id)
-
-    for school in schools:
-        logger.info("Processing school: %s", repr(school))
-
-        course_careers = CourseCareer.objects.filter(terms__id=term_id, schools__id=school.id)
-
-        subjects: QuerySet[Subject]
-        if subject_id == 0:
-            subjects = Subject.objects.filter(terms__id=term_id, schools__id=school.id)
-        else:
-            subjects = Subject.objects.filter(id=subject_id)
-
-        session = init_http_retrier(headers=get_globalsearch_headers())
-        _ = get_subject_selection_page(session, school, term)
-
-        courses: list[Course] = []
-        for career in course_careers:
-            for subject in subjects:
-                logger.info(
-                    " - Parsing courses for %s, %s (%s, %s)",
-                    career.name,
-                    subject.name,
-                    school.name,
-                    term.name,
-                )
-
-                class_result_soup = BeautifulSoup(
-                    get_classlist_result_page(session, career, subject), "lxml"
-                )
+    """
+    Start a background crawl of the term's class lists and return it for status polling. A failed
+    or stale crawl of the same scope is resumed rather than restarted, and one in progress is
+    returned as is.
+    """
+    term = Term.objects.filter(id=term_id).first()
+    if term is None:
+        raise DRFNotFound([f"Term id {term_id} not found"])
 
-                gs_courses = parse_gs_courses(class_result_soup)
-                courses.extend(create_db_courses(gs_courses, subject, career, school, term))
+    school = None
+    if school_id != 0:
+        school = School.objects.filter(id=school_id).first()
+        if school is None:
+            raise DRFNotFound([f"School id {school_id} not found"])
+
+    subject = None
+    if subject_id != 0:
+        subject = Subject.objects.filter(id=subject_id).first()
+        if subject is None:
+            raise DRFNotFound([f"Subject id {subject_id} not found"])
+
+    # pick up where the last crawl of the same scope stopped instead of starting over
+    crawl = (
+        CatalogCrawl.objects.filter(term=term, school=school, subject=subject)
+        .exclude(status=CatalogCrawl.StatusChoices.COMPLETED)
+        .order_by("-datetime_created")
+        .first()
+    )
+    if crawl is None:
+        crawl = CatalogCrawl.objects.create(term=term, school=school, subject=subject)
+        transaction.on_commit(partial(enqueue_catalog_crawl, crawl))
+        logger.info("Queued catalog crawl %r", crawl)
+    elif crawl.status == CatalogCrawl.StatusChoices.FAILED or crawl.is_stale(
+        settings.CLASS_TRACKER_CRAWL_STALE_SECONDS
+    ):
+        transaction.on_commit(partial(resume_catalog_crawl, crawl))
+        logger.info("Resuming catalog crawl %r", crawl)
+    else:
+        logger.info("Catalog crawl %r is already in progress", crawl)
 
-                time.sleep(2)
+    return interfaces_response.RespCatalogCrawl(crawl=crawl, courses=[]).render(request)
 
-    logger.info("Completed fetching new semester course sections")
 
-    return interfaces_response.RespRefreshCourseSections(
-        courses=natsorted(courses, key=lambda c: (c.code, c.level))
-    ).render(request)
+@staff_member_required
+@require_http_methods(["GET"])
+def get_catalog_crawl(request: HttpRequest, crawl_id: int) -> HttpResponse:
+    crawl = CatalogCrawl.objects.filter(id=crawl_id).first()
+    if crawl is None:
+        raise DRFNotFound([f"Crawl id {crawl_id} not found"])
+
+    courses: list[Course] = []
+    if crawl.is_finished and crawl.subject_id is not None:
+        courses_queryset = Course.objects.filter(
+            subject_id=crawl.subject_id, terms=crawl.term_id
+        ).prefetch_related("sections")
+        if crawl.school_id is not None:
+            courses_queryset = courses_queryset.filter(school_id=crawl.school_id)
+        courses = natsorted(courses_queryset, key=lambda c: (c.code, c.level))
+
+    return interfaces_response.RespCatalogCrawl(crawl=crawl, courses=courses).render(request)
 
 
 @staff_member_required
@@ -2,7 +2,16 @@ from typing import List, Literal, NamedTuple
 
 from reactivated import Pick, interface
 
-from ..models import ContactInfo, Course, CourseSection, Recipient, School, Subject, Term
+from ..models import (
+    CatalogCrawl,
+    ContactInfo,
+    Course,
+    CourseSection,
+    Recipient,
+    School,
+    Subject,
+    Term,
+)
 from .forms import ContactInfoForm, RecipientForm
 
 _TermPick = Pick[Term, Literal["id", "name", "year", "globalsearch_key", "full_term_name"]]
@@ -47,6 +56,18 @@ _RecipientPick = Pick[
 
 ContactPick = Pick[ContactInfo, Literal["id", "number", "is_enabled"]]
 
+_CatalogCrawlPick = Pick[
+    CatalogCrawl,
+    Literal[
+        "id",
+        "status",
+        "num_units_total",
+        "num_units_completed",
+        "num_units_failed",
+        "is_finished",
+    ],
+]
+
 
 @interface
 class BasicResponse(NamedTuple):
@@ -77,7 +98,9 @@ class RespGetSubjects(NamedTuple):
 
 
 @interface
-class RespRefreshCourseSections(NamedTuple):
+class RespCatalogCrawl(NamedTuple):
+    crawl: _CatalogCrawlPick
+    # filled in once a crawl of a single subject finishes
     courses: List[Pick[Course, Literal["id", "code", "level", "sections.number"]]]
 
 
@@ -123,7 +123,6 @@ def view_class_alerts(request: HttpRequest) -> HttpResponse:
             "course_section__term",
         )
         .prefetch_related(
-            "course_section__instruction_entries__days",
             "course_section__instruction_entries__instructor",
         )
         .order_by("-datetime_created")
@@ -19,6 +19,8 @@ const ALL_SUBJECTS_ID = 0;
 const ALL_SCHOOLS_OPTION = { id: ALL_SCHOOLS_ID, name: "All Schools" };
 const ALL_SUBJECTS_OPTION = { id: ALL_SUBJECTS_ID, name: "All Subjects" };
 
+const CRAWL_POLL_INTERVAL_MS = 3000;
+
 export function Template(props: templates.ClassTrackerManageCourselist) {
   const [availableSchools, setAvailableSchools] = React.useState([
     ALL_SCHOOLS_OPTION,
@@ -29,7 +31,7 @@ export function Template(props: templates.ClassTrackerManageCourselist) {
     interfaces.RespSubjectsUpdate["available_subjects"]
   >([ALL_SUBJECTS_OPTION]);
   const [availableCourses, setAvailableCourses] = React.useState<
-    interfaces.RespRefreshCourseSections["courses"] | undefined
+    interfaces.RespCatalogCrawl["courses"] | undefined
   >(undefined);
 
   const [selectedSchool, setSelectedSchool] = React.useState(availableSchools.at(0));
@@ -39,7 +41,12 @@ export function Template(props: templates.ClassTrackerManageCourselist) {
   const refreshTermsFetcher = useFetch<interfaces.RespSchoolsTermsUpdate>();
   const refreshSubjectsFetcher = useFetch<interfaces.RespSubjectsUpdate>();
   const getSubjectsFetcher = useFetch<interfaces.RespGetSubjects>();
-  const refreshClassesFetcher = useFetch<interfaces.RespRefreshCourseSections>();
+  const [catalogCrawl, setCatalogCrawl] = React.useState<
+    interfaces.RespCatalogCrawl["crawl"] | undefined
+  >(undefined);
+
+  const refreshClassesFetcher = useFetch<interfaces.RespCatalogCrawl>();
+  const catalogCrawlFetcher = useFetch<interfaces.RespCatalogCrawl>();
 
   const djangoContext = React.useContext(Context);
 
@@ -128,8 +135,33 @@ export function Template(props: templates.ClassTrackerManageCourselist) {
     const result = await refreshClassesFetcher.fetchData(callback);
     if (!result.ok) return;
 
-    setAvailableCourses(result.data.courses);
-    alert(`Success! Found ${result.data.courses.length} courses.`);
+    // the crawl runs as background jobs, poll it until every class list has been fetched
+    let crawlResult = result;
+    setCatalogCrawl(crawlResult.data.crawl);
+    while (!crawlResult.data.crawl.is_finished) {
+      await new Promise((resolve) => setTimeout(resolve, CRAWL_POLL_INTERVAL_MS));
+
+      const crawlId = crawlResult.data.crawl.id;
+      const pollResult = await catalogCrawlFetcher.fetchData(() =>
+        fetchByReactivated(
+          reverse("class_tracker:get_catalog_crawl", { crawl_id: crawlId }),
+          djangoContext.csrf_token,
+          "GET",
+        ),
+      );
+      if (!pollResult.ok) return;
+
+      crawlResult = pollResult;
+      setCatalogCrawl(crawlResult.data.crawl);
+    }
+
+    const { crawl, courses } = crawlResult.data;
+    setAvailableCourses(courses);
+    if (crawl.num_units_failed > 0) {
+      alert(`Done, but ${crawl.num_units_failed} of ${crawl.num_units_total} class lists failed.`);
+    } else {
+      alert(`Success! Fetched ${crawl.num_units_total} class lists.`);
+    }
   }
 
   async function getSubjects(schoolId: number | undefined, termId: number | undefined) {
@@ -236,17 +268,27 @@ export function Template(props: templates.ClassTrackerManageCourselist) {
         </Alert>
       )}
 
-      {refreshClassesFetcher.errorMessages.length > 0 && (
+      {[...refreshClassesFetcher.errorMessages, ...catalogCrawlFetcher.errorMessages].length > 0 && (
         <Alert variant="danger" className="mb-3">
           <Alert.Heading>Error fetching new courses:</Alert.Heading>
           <ul className="mb-0">
-            {refreshClassesFetcher.errorMessages.map((msg, idx) => (
-              <li key={idx}>{msg}</li>
-            ))}
+            {[...refreshClassesFetcher.errorMessages, ...catalogCrawlFetcher.errorMessages].map(
+              (msg, idx) => (
+                <li key={idx}>{msg}</li>
+              ),
+            )}
           </ul>
         </Alert>
       )}
 
+      {catalogCrawl !== undefined && !catalogCrawl.is_finished && (
+        <Alert variant="info" className="mb-3">
+          Fetching class lists: {catalogCrawl.num_units_completed + catalogCrawl.num_units_failed}{" "}
+          of {catalogCrawl.num_units_total} done
+          {catalogCrawl.num_units_failed > 0 && ` (${catalogCrawl.num_units_failed} failed)`}
+        </Alert>
+      )}
+
       <Card className="p-3">
         <Card.Title>Currently available terms and schools</Card.Title>
         <Card.Body>
@@ -355,7 +397,10 @@ export function Template(props: templates.ClassTrackerManageCourselist) {
                   onClick={() =>
                     handleRefreshClassesData(selectedSchool.id, selectedTerm.id, selectedSubject.id)
                   }
-                  isLoadingState={refreshClassesFetcher.isLoading}
+                  isLoadingState={
+                    refreshClassesFetcher.isLoading ||
+                    (catalogCrawl !== undefined && !catalogCrawl.is_finished)
+                  }
                 >
                   Fetch {selectedSubject.name} sections for{" "}
                   <b>
@@ -368,7 +413,7 @@ export function Template(props: templates.ClassTrackerManageCourselist) {
         </Card.Body>
       </Card>
 
-      {availableCourses !== undefined && !refreshClassesFetcher.isLoading && (
+      {availableCourses !== undefined && catalogCrawl?.is_finished && (
         <Card className="p-3">
           <Card.Title>Available Courses</Card.Title>
           <Card.Body>
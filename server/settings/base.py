@@ -253,3 +253,97 @@ JOINAPP_API_KEY = os.environ["JOINAPP_API_KEY"]
 
 JOINAPP_SEND_URL = os.environ["JOINAPP_SEND_URL"]
 JOINAPP_LIST_URL = os.environ["JOINAPP_LIST_URL"]
+
+# class tracker polling; all GlobalSearch traffic goes to a single host, so the per-host cap is
+# what actually bounds the number of parallel sessions
+CLASS_TRACKER_POLL_MAX_WORKERS = int(os.environ.get("CLASS_TRACKER_POLL_MAX_WORKERS", "8"))
+GLOBALSEARCH_MAX_CONNECTIONS_PER_HOST = int(
+    os.environ.get("GLOBALSEARCH_MAX_CONNECTIONS_PER_HOST", "4")
+)
+# keep below the scheduler's DEFAULT_JOB_TIMEOUT so a slow cycle still gets to notify recipients
+CLASS_TRACKER_POLL_DEADLINE_SECONDS = float(
+    os.environ.get("CLASS_TRACKER_POLL_DEADLINE_SECONDS", "180")
+)
+CLASS_TRACKER_POLL_GROUP_TIMEOUT_SECONDS = float(
+    os.environ.get("CLASS_TRACKER_POLL_GROUP_TIMEOUT_SECONDS", "45")
+)
+CLASS_TRACKER_POLL_REQUEST_TIMEOUT_SECONDS = float(
+    os.environ.get("CLASS_TRACKER_POLL_REQUEST_TIMEOUT_SECONDS", "10")
+)
+# the schools, terms, subjects & careers of search groups are cached per process for this long
+CLASS_TRACKER_POLL_REFERENCE_CACHE_SECONDS = float(
+    os.environ.get("CLASS_TRACKER_POLL_REFERENCE_CACHE_SECONDS", "300")
+)
+# how long a warmed GlobalSearch session is reused before posting the school & term selection again
+GLOBALSEARCH_SESSION_MAX_AGE_SECONDS = float(
+    os.environ.get("GLOBALSEARCH_SESSION_MAX_AGE_SECONDS", "600")
+)
+# shared, Redis-backed pacing of every GlobalSearch request; the rate (requests per second) starts
+# at the initial rate and adapts between the min & max rates to GlobalSearch's latency and errors
+GLOBALSEARCH_RATE_LIMIT_ENABLED = (
+    os.environ.get("GLOBALSEARCH_RATE_LIMIT_ENABLED", "true").lower() == "true"
+)
+GLOBALSEARCH_RATE_LIMIT_INITIAL_RATE = float(
+    os.environ.get("GLOBALSEARCH_RATE_LIMIT_INITIAL_RATE", "0.5")
+)
+GLOBALSEARCH_RATE_LIMIT_MIN_RATE = float(os.environ.get("GLOBALSEARCH_RATE_LIMIT_MIN_RATE", "0.2"))
+GLOBALSEARCH_RATE_LIMIT_MAX_RATE = float(os.environ.get("GLOBALSEARCH_RATE_LIMIT_MAX_RATE", "4"))
+GLOBALSEARCH_RATE_LIMIT_BURST = int(os.environ.get("GLOBALSEARCH_RATE_LIMIT_BURST", "4"))
+GLOBALSEARCH_RATE_LIMIT_TARGET_LATENCY_SECONDS = float(
+    os.environ.get("GLOBALSEARCH_RATE_LIMIT_TARGET_LATENCY_SECONDS", "1.5")
+)
+GLOBALSEARCH_RATE_LIMIT_SLOW_LATENCY_SECONDS = float(
+    os.environ.get("GLOBALSEARCH_RATE_LIMIT_SLOW_LATENCY_SECONDS", "5")
+)
+# consecutive failed GlobalSearch requests before every request fast-fails, and how long to wait
+# before letting a single probe request through
+GLOBALSEARCH_CIRCUIT_FAILURE_THRESHOLD = int(
+    os.environ.get("GLOBALSEARCH_CIRCUIT_FAILURE_THRESHOLD", "5")
+)
+GLOBALSEARCH_CIRCUIT_RESET_TIMEOUT_SECONDS = float(
+    os.environ.get("GLOBALSEARCH_CIRCUIT_RESET_TIMEOUT_SECONDS", "60")
+)
+# "record" archives every GlobalSearch response under GLOBALSEARCH_ARCHIVE_DIR, "replay" serves them
+# back without network access; leave unset to talk to GlobalSearch normally
+GLOBALSEARCH_ARCHIVE_MODE = os.environ.get("GLOBALSEARCH_ARCHIVE_MODE", "")
+GLOBALSEARCH_ARCHIVE_DIR = BASE_DIR / os.environ.get(
+    "GLOBALSEARCH_ARCHIVE_DIR", "globalsearch_archive"
+).strip("/")
+# worker processes parsing class list pages off the GIL, 0 parses in the calling process
+CLASS_TRACKER_PARSE_WORKERS = int(os.environ.get("CLASS_TRACKER_PARSE_WORKERS", "2"))
+# catalog crawls covering several class lists run as one fetch -> parse -> write pipeline job
+# instead of one job per class list; stages buffer up to the queue size of pages and the writer
+# commits batches of units
+CLASS_TRACKER_CRAWL_PIPELINE_ENABLED = (
+    os.environ.get("CLASS_TRACKER_CRAWL_PIPELINE_ENABLED", "true").lower() == "true"
+)
+CLASS_TRACKER_CRAWL_PIPELINE_QUEUE_SIZE = int(
+    os.environ.get("CLASS_TRACKER_CRAWL_PIPELINE_QUEUE_SIZE", "8")
+)
+CLASS_TRACKER_CRAWL_PIPELINE_WRITE_BATCH_SIZE = int(
+    os.environ.get("CLASS_TRACKER_CRAWL_PIPELINE_WRITE_BATCH_SIZE", "4")
+)
+# a whole-term crawl runs far longer than the scheduler's default job timeout
+CLASS_TRACKER_CRAWL_PIPELINE_JOB_TIMEOUT_SECONDS = int(
+    os.environ.get("CLASS_TRACKER_CRAWL_PIPELINE_JOB_TIMEOUT_SECONDS", "14400")
+)
+# an unfinished crawl none of whose units changed for this long lost its worker or job, and is
+# resumed when requested again; keep it above how long a crawl may wait behind other jobs
+CLASS_TRACKER_CRAWL_STALE_SECONDS = float(
+    os.environ.get("CLASS_TRACKER_CRAWL_STALE_SECONDS", "3600")
+)
+# notifications are queued in an outbox by the poll and sent by the notifications queue worker, in
+# batches of concurrent sends; failed sends are retried with exponential backoff up to max attempts
+CLASS_TRACKER_NOTIFY_BATCH_SIZE = int(os.environ.get("CLASS_TRACKER_NOTIFY_BATCH_SIZE", "50"))
+CLASS_TRACKER_NOTIFY_MAX_WORKERS = int(os.environ.get("CLASS_TRACKER_NOTIFY_MAX_WORKERS", "8"))
+CLASS_TRACKER_NOTIFY_MAX_ATTEMPTS = int(os.environ.get("CLASS_TRACKER_NOTIFY_MAX_ATTEMPTS", "5"))
+CLASS_TRACKER_NOTIFY_RETRY_BACKOFF_SECONDS = float(
+    os.environ.get("CLASS_TRACKER_NOTIFY_RETRY_BACKOFF_SECONDS", "30")
+)
+CLASS_TRACKER_NOTIFY_MAX_RETRY_BACKOFF_SECONDS = float(
+    os.environ.get("CLASS_TRACKER_NOTIFY_MAX_RETRY_BACKOFF_SECONDS", "1800")
+)
+# a notification left sending this long belongs to a worker that died, and is sent again
+CLASS_TRACKER_NOTIFY_LEASE_SECONDS = float(
+    os.environ.get("CLASS_TRACKER_NOTIFY_LEASE_SECONDS", "300")
+)
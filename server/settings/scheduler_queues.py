@@ -29,4 +29,11 @@ SCHEDULER_QUEUES: dict[str, QueueConfiguration] = {
         PASSWORD=os.environ["REDIS_PASSWORD"],
         DB=0,
     ),
+    # notification sends, worked by their own worker so polling never waits on the SMS API
+    "notifications": QueueConfiguration(
+        HOST=os.environ["REDIS_HOST"],
+        PORT=int(os.environ["REDIS_PORT"]),
+        PASSWORD=os.environ["REDIS_PASSWORD"],
+        DB=0,
+    ),
 }
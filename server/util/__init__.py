@@ -1,6 +1,11 @@
+import functools
+import logging
+import time
 from typing import Any, Type, TypeVar
 
+import redis
 import requests
+from django.conf import settings
 from django.core.paginator import Page, Paginator
 from django.db import IntegrityError, models, transaction
 from django.http import JsonResponse
@@ -9,12 +14,18 @@ from requests.adapters import HTTPAdapter, Retry
 
 from .typedefs import TPaginationData
 
+logger = logging.getLogger("main")
+
 TModelSubclass = TypeVar("TModelSubclass", bound=models.Model)
 TIsNewRecord = bool
 
 
 def init_http_retrier(
-    *, headers: dict[str, str] | None = None, num_retries: int = 3, backoff_factor: float = 0.5
+    *,
+    headers: dict[str, str] | None = None,
+    num_retries: int = 3,
+    backoff_factor: float = 0.5,
+    pool_maxsize: int = 10,  # connections kept alive per host, size it to the threads sharing it
 ) -> Session:
     session = requests.Session()
 
@@ -22,8 +33,8 @@ def init_http_retrier(
         total=num_retries, backoff_factor=backoff_factor, status_forcelist=[500, 502, 503, 504]
     )
 
-    session.mount("http://", HTTPAdapter(max_retries=retry_strategy))
-    session.mount("https://", HTTPAdapter(max_retries=retry_strategy))
+    session.mount("http://", HTTPAdapter(max_retries=retry_strategy, pool_maxsize=pool_maxsize))
+    session.mount("https://", HTTPAdapter(max_retries=retry_strategy, pool_maxsize=pool_maxsize))
 
     if headers is not None:
         session.headers.update(headers)
@@ -31,6 +42,53 @@ def init_http_retrier(
     return session
 
 
+@functools.cache
+def get_redis_connection() -> redis.Redis:
+    """
+    Shared client for the Redis instance backing the scheduler's default queue. Timeouts are short
+    so callers that fail open on `redis.RedisError` are not held up by an unreachable server.
+    """
+    queue_config = settings.SCHEDULER_QUEUES["default"]
+    if queue_config.URL is not None:
+        return redis.Redis.from_url(
+            queue_config.URL, socket_connect_timeout=1, socket_timeout=1, db=queue_config.DB or 0
+        )
+
+    return redis.Redis(
+        host=queue_config.HOST or "localhost",
+        port=queue_config.PORT or 6379,
+        db=queue_config.DB or 0,
+        password=queue_config.PASSWORD or None,
+        socket_connect_timeout=1,
+        socket_timeout=1,
+    )
+
+
+class RedisOutageGuard:
+    """
+    Lets Redis-backed helpers fail open: after a Redis error, `is_usable()` is False for
+    `retry_interval_seconds`, so callers skip Redis instead of each waiting out the client's
+    connection retries during an outage.
+    """
+
+    def __init__(self, name: str, *, retry_interval_seconds: float = 60):
+        self.name = name
+        self.retry_interval_seconds = retry_interval_seconds
+        self._datetime_failed = float("-inf")  # time.monotonic() timestamp
+
+    def is_usable(self) -> bool:
+        return time.monotonic() - self._datetime_failed >= self.retry_interval_seconds
+
+    def mark_failed(self, ex: redis.RedisError) -> None:
+        self._datetime_failed = time.monotonic()
+        logger.warning(
+            "%s failing open for %.0fs, Redis unavailable: %s",
+            self.name,
+            self.retry_interval_seconds,
+            ex,
+        )
+
+
 def get_pagination_data(
     queryset: models.QuerySet[TModelSubclass], *, page: int, page_size: int
 ) -> tuple[Page[TModelSubclass], TPaginationData]:
@@ -79,6 +137,40 @@ def bulk_create_and_get(
     return model_class.objects.filter(**filter_criteria)  # type: ignore [no-any-return, attr-defined]
 
 
+def bulk_upsert(
+    model_class: Type[TModelSubclass],
+    items: list[TModelSubclass],
+    *,
+    unique_fields: list[str],
+    update_fields: list[str],
+    batch_size: int | None = None,
+) -> list[TModelSubclass]:
+    """
+    Inserts items with a single `INSERT ... ON CONFLICT (unique_fields) DO UPDATE` per batch.
+
+    On PostgreSQL the statement uses `RETURNING`, so every returned instance has its primary key
+    populated whether it was inserted or updated. Items must be unique on `unique_fields`, since
+    PostgreSQL refuses to update the same row twice within one statement.
+
+    Args:
+        model_class (Type[models.Model]): The Django model class.
+        items (List[models.Model]): A list of model instances to be upserted.
+        unique_fields (List[str]): The field names making up the conflict target.
+        update_fields (List[str]): The field names to overwrite when a conflicting row exists.
+        batch_size (int|None): Limit committed records to a specified batch size.
+
+    Returns:
+        List[models.Model]: The upserted instances with primary keys.
+    """
+    return model_class.objects.bulk_create(  # type: ignore [no-any-return, attr-defined]
+        items,
+        batch_size=batch_size,
+        update_conflicts=True,
+        unique_fields=unique_fields,
+        update_fields=update_fields,
+    )
+
+
 def atomic_get_or_create(
     instance: TModelSubclass, *, fields: list[str]
 ) -> tuple[TModelSubclass, TIsNewRecord]: